@@ -5,7 +5,16 @@ See: https://wiki.purestorage.com/pages/viewpage.action?pageId=46827128
 import logging
 import pandas
 
+from six import iteritems
+
+from photon.backend.pure import FIELD_OPTIONS
+from photon.backend.pure import FieldCoverage
+from photon.backend.pure import META_COLUMNS
+from photon.backend.pure import apply_field_dtypes
+from photon.backend.pure import get_field_columns
+from photon.backend.pure import is_long_field
 from photon.backend.pure.cli import cli_api
+from photon.backend.pure.export import export_api
 from photon.backend.pure.logs import logs_api
 from photon.backend.pure.insights import insights_api
 from photon.backend.pure.iris import iris_api
@@ -38,6 +47,7 @@ FIELD_INDEX = config_utils.get_field_index()  # type: Dict[str, Any]
 SETTINGS = config_utils.get_settings()  # type: Dict[str, Any]
 SOURCES = {
     'cli':        cli_api.CLI,
+    'export':     export_api.ExportedFields,
     'logs':       logs_api.Logs,
     'insights':   insights_api.InsightsConnection,
     'iris':       iris_api.IrisConnection,
@@ -88,6 +98,59 @@ class FlashArray(object):
         # type: (...) -> str
         return 'Pure FlashArray <{}>.'.format(self.ident.fqdn if hasattr(self, 'ident') else '')
 
+    @property
+    def data_version(self):
+        # type: () -> Tuple[Tuple[str, int], ...]
+        """A version of the field values which each DataSource has cached; it changes whenever any of them change.
+
+        Results which are derived from get_fields (i.e. the processed metrics of a Report) can be reused while the
+        data_version and timeframe are unchanged.
+        """
+        return tuple((name, parser.coverage.version) for name, parser in sorted(iteritems(self.parsers)))
+
+    @classmethod
+    def from_export(cls, path, start=None, end=None, granularity=None):
+        # type: (str, Optional[str], Optional[str], Optional[str]) -> FlashArray
+        """Create a FlashArray which gets its fields from a file written by export_fields; instead of parsing again.
+
+        Arguments:
+            path (str): The exported file.
+            start (str/datetime/pandas.Timestamp): The start of the time frame to request.
+                * By default, the start of the exported time frame.
+            end (str/datetime/pandas.Timestamp): The end of the time frame to request.
+                * By default, the end of the exported time frame.
+            granularity (str): How granular the data should be; Time in Pandas.Timedelta friendly format.
+                * By default, the granularity of the exported time frame.
+
+        Returns:
+            flasharray (FlashArray): A FlashArray which only uses the "export" DataSource.
+        """
+        metadata = export_api.read_metadata(path)
+        flasharray = cls(fqdn=metadata['fqdn'], start=start or metadata['start'], end=end or metadata['end'],
+                         granularity=granularity or metadata['granularity'])
+        flasharray.parsers['export'] = export_api.ExportedFields(ident=flasharray.ident,
+                                                                 timeframe=flasharray.timeframe, path=path)
+        return flasharray
+
+    # pylint: disable=redefined-builtin
+    def export_fields(self, path, fields, format='parquet'):
+        # type: (str, List[str], str) -> None
+        """Get one or more fields and write them to a file; which FlashArray.from_export can read back.
+
+        Arguments:
+            path (str): Where to write the file.
+            fields (list/set/tuple): One or more fields to export.
+            format (str): 'parquet' or 'feather'.
+        """
+        metadata = {
+            'end': str(self.timeframe.end),
+            'fields': sorted(fields),
+            'fqdn': self.ident.fqdn,
+            'granularity': '{}ns'.format(self.timeframe.granularity.value),
+            'start': str(self.timeframe.start),
+        }
+        export_api.write_export(self.get_fields(list(fields)), path, format, metadata)
+
     def get_data_sources(self, fields):
         # type: (List[str]) -> List[Any]
         """Get the available data sources.
@@ -98,12 +161,16 @@ class FlashArray(object):
         Returns:
             A sorted list of available sources which have the requested field(s).
         """
+        if 'export' in self.parsers:
+            # A FlashArray from an exported file only has the fields of that file; see from_export.
+            return ['export']
         applicable_sources = set()  # type: Set[str]
 
         # Get data sources which can supply data for our requested field(s):
         for field in fields:
             # Assume that the field has already been validated:
-            field_sources = [src for src, sub_src in FIELD_INDEX[field].items() if sub_src]  # type: List[str]
+            field_sources = [src for src, sub_src in FIELD_INDEX[field].items()
+                             if sub_src and src not in FIELD_OPTIONS]  # type: List[str]
             for field_source in field_sources:
                 source_name = field_source.strip().lower()  # type: str
                 # PT-2139 - Temporarily disabling Pure1 manually:
@@ -117,8 +184,8 @@ class FlashArray(object):
         # pylint: disable=unnecessary-lambda
         return sorted(list(applicable_sources), key=lambda src_name: source_priority.index(src_name))
 
-    def get_fields(self, fields, data_sources=None, controllers=('CT0', 'CT1')):
-        # type: (List[str], Optional[List[str]], Union[Tuple[str, str], Tuple[str]]) -> pandas.DataFrame
+    def get_fields(self, fields, data_sources=None, controllers=('CT0', 'CT1'), name_filter=None):
+        # type: (List[str], Optional[List[str]], Union[Tuple[str, str], Tuple[str]], Any) -> pandas.DataFrame
         """Get one or more fields from this array within the given time frame.
 
         Arguments:
@@ -133,10 +200,16 @@ class FlashArray(object):
                     6) pure1
                     7) warehouse
             controllers (tuple): One or both controllers ('CT0' and/or 'CT1').
+            name_filter (str/list/set/tuple): Only get long layout fields (i.e. per_volume_read_latency) for these names.
+                * A str is used as a regular expression to search for within each name.
+                * Otherwise, this is a collection of the exact names to use.
 
         Returns:
             results (dict): Per-controller dictionary containing per-field results.
         """
+        # PT-2133 - Track which ranges of time we have per field/controller, so that each data source is
+        # only asked for the gaps which higher priority sources did not cover.
+        coverage = FieldCoverage()
         completed_fields = set()
         all_results = []
         # Validate that all fields are defined in the FIELD_INDEX.
@@ -145,47 +218,93 @@ class FlashArray(object):
 
         data_sources = data_sources or self.get_data_sources(fields)
         for data_source in data_sources:
-            # TODO: Get fields which are available within this data_source ONLY.
-            applicable_fields = set(fields) - completed_fields
-            if not applicable_fields:
-                continue
-            if data_source not in self.parsers:
-                parser = SOURCES[data_source](ident=self.ident, timeframe=self.timeframe, controllers=controllers)
-                self.parsers[data_source] = parser
-            elif data_source not in SOURCES:
+            if data_source not in SOURCES:
                 error_msg = 'Unknown DataSource "{}" requested.'.format(data_source)
                 LOGGER.error(error_msg)
                 raise ValueError(error_msg)
-            LOGGER.info('Requesting {} fields from the "{}" API.'.format(fields, data_source))
-            parser_results = self.parsers[data_source].get_fields(applicable_fields)  # type: pandas.DataFrame
+            gaps = {}
+            for field in fields:
+                field_gaps = {controller: coverage.get_gaps(field, controller, self.timeframe.start, self.timeframe.end)
+                              for controller in controllers}
+                if any(field_gaps.values()):
+                    gaps[field] = field_gaps
+            # TODO: Get fields which are available within this data_source ONLY.
+            applicable_fields = set(gaps)
+            if not applicable_fields:
+                continue
+            LOGGER.info('Requesting {} fields from the "{}" API.'.format(applicable_fields, data_source))
+            parser = self._get_parser(data_source, controllers)
+            parser_results = parser.get_fields_in_gaps(applicable_fields, gaps, name_filter)  # type: pandas.DataFrame
             if 'source' not in parser_results:
                 parser_results['source'] = data_source
             for field, series in parser_results.iteritems():
-                if field in ('Timestamp', 'source', 'controller'):
+                if field in META_COLUMNS or field not in applicable_fields:
                     # These are meta fields.
                     continue
-                elif series.dropna().empty:
+                # Don't use values for time which a higher priority source already covered.
+                field_results = parser_results[~coverage.covered_rows(field, parser_results) & series.notnull()]
+                if field_results.empty:
                     # We have no results for this field, so don't count it as completed.
                     continue
                 completed_fields.add(field)
-                all_results.append(parser_results[['Timestamp', field, 'source', 'controller']])
+                all_results.append(field_results[get_field_columns(field)])
+            # Update the coverage with what this source was able to cover within the gaps.
+            for field, field_gaps in iteritems(gaps):
+                for controller, controller_gaps in iteritems(field_gaps):
+                    source_covered = parser.coverage.get_intervals(field, controller)
+                    for start, end in time_utils.intersect_intervals(controller_gaps, source_covered):
+                        coverage.add(field, controller, start, end)
 
-        if not all_results:
-            merged = pandas.DataFrame()
-        else:
-            # Merge all of the individual frames back together:
-            merged = pandas.concat(all_results)
+        LOGGER.info('Done getting {} fields.'.format(len(completed_fields)))
+        return _merge_results(all_results, fields)
 
-        # Add placeholders for missing values:
+    def get_latest_fields(self, fields, data_sources=None, controllers=('CT0', 'CT1')):
+        # type: (List[str], Optional[List[str]], Union[Tuple[str, str], Tuple[str]]) -> pandas.DataFrame
+        """Get enough of one or more fields to know their latest values; without getting the entire timeframe.
+
+        Each data source is only asked for the fields which a higher priority source had no values for; and the
+        "logs" source stops parsing as soon as each field has a value for each controller (see
+        Logs.get_latest_fields).  Use get_latest_values to get just the latest values.
+
+        Arguments:
+            fields (str/list/set/tuple): One or more fields to request from the array.
+            data_sources (list/set/tuple): Which source of information to use; see get_fields.
+            controllers (tuple): One or both controllers ('CT0' and/or 'CT1').
+
+        Returns:
+            results (pandas.DataFrame): Per field values; where the last value of each field per controller is its
+                latest value.
+        """
+        all_results = []
         for field in fields:
-            if field not in merged:
-                merged[field] = None
-        if 'controller' not in merged:
-            merged['controller'] = None
-        if 'Timestamp' not in merged:
-            merged['Timestamp'] = None
-        LOGGER.info('Done getting {} fields.'.format(len(completed_fields)))
-        return pandas_utils.sort_by_index_and_columns(merged, ['Timestamp'])
+            validation_utils.field(field, ValueError)
+        missing = set((field, controller) for field in fields for controller in controllers)
+
+        data_sources = data_sources or self.get_data_sources(fields)
+        for data_source in data_sources:
+            if data_source not in SOURCES:
+                error_msg = 'Unknown DataSource "{}" requested.'.format(data_source)
+                LOGGER.error(error_msg)
+                raise ValueError(error_msg)
+            needed_fields = sorted(set(field for field, _ in missing))
+            if not needed_fields:
+                break
+            LOGGER.info('Requesting the latest {} fields from the "{}" API.'.format(needed_fields, data_source))
+            parser_results = self._get_parser(data_source, controllers).get_latest_fields(needed_fields, controllers)
+            if 'source' not in parser_results:
+                parser_results['source'] = data_source
+            for field in needed_fields:
+                if field not in parser_results:
+                    continue
+                # Only keep the controllers which a higher priority source had no values for.
+                needed_controllers = [controller for controller in controllers if (field, controller) in missing]
+                field_results = parser_results[parser_results[field].notnull() &
+                                               parser_results['controller'].isin(needed_controllers)]
+                if field_results.empty:
+                    continue
+                all_results.append(field_results[get_field_columns(field)])
+                missing -= set((field, controller) for controller in field_results['controller'].tolist())
+        return _merge_results(all_results, fields)
 
     def get_latest_values(self, fields, both_controllers=False):
         # type: (List[str]) -> pandas.DataFrame
@@ -198,7 +317,7 @@ class FlashArray(object):
         Returns:
             result (Any): The field's latest value from one or both controllers.
         """
-        return pandas_utils.get_latest_values(self.get_fields(fields), fields, both_controllers)
+        return pandas_utils.get_latest_values(self.get_latest_fields(fields), fields, both_controllers)
 
     def get_latest_value(self, field, both_controllers=False):
         # type: (str, bool) -> FIELD_TYPES
@@ -211,4 +330,38 @@ class FlashArray(object):
         Returns:
             result (Any): The field's latest value from one or both controllers.
         """
-        return pandas_utils.get_latest_value(self.get_fields([field]), field, both_controllers)
+        return pandas_utils.get_latest_value(self.get_latest_fields([field]), field, both_controllers)
+
+    def _get_parser(self, data_source, controllers):
+        # type: (str, Union[Tuple[str, str], Tuple[str]]) -> Any
+        """Get the DataSource instance for a data source; created the first time that it is used."""
+        if data_source not in self.parsers:
+            self.parsers[data_source] = SOURCES[data_source](ident=self.ident, timeframe=self.timeframe,
+                                                             controllers=controllers)
+        else:
+            # The timeframe may have changed (i.e. an extended end time) since we last used this source.
+            self.parsers[data_source].update_timeframe(self.timeframe)
+        return self.parsers[data_source]
+
+
+def _merge_results(all_results, fields):
+    # type: (List[pandas.DataFrame], List[str]) -> pandas.DataFrame
+    """Merge the per field results of each DataSource; with placeholders for any missing columns."""
+    if not all_results:
+        merged = pandas.DataFrame()
+    else:
+        # Merge all of the individual frames back together:
+        merged = apply_field_dtypes(pandas.concat(all_results))
+
+    # Add placeholders for missing values:
+    for field in fields:
+        if field not in merged:
+            merged[field] = None
+    if 'controller' not in merged:
+        merged['controller'] = None
+    if 'Timestamp' not in merged:
+        merged['Timestamp'] = None
+    if 'name' not in merged and any(is_long_field(field) for field in fields):
+        merged['name'] = None
+    # Each source's results are already in time order; this is the only place where they are ordered together.
+    return pandas_utils.merge_sorted_runs(merged, 'Timestamp')
@@ -4,6 +4,8 @@
 import collections
 import logging
 
+import pandas
+
 from six import iteritems
 try:
     from typing import Any
@@ -16,10 +18,72 @@ except ImportError:
     pass
 
 from photon.lib import config_utils
+from photon.lib import time_utils
 from photon.lib import validation_utils
 
 FIELD_INDEX = config_utils.get_field_index()  # type: Dict[str, Any]
+# Options within the field_index.ini which describe a field, rather than where to get it from:
+FIELD_OPTIONS = ('dtype', 'layout')
 LOGGER = logging.getLogger(__name__)  # type: logging.Logger
+# The 'name' column is only used by long layout fields (i.e. the volume name for per_volume_read_latency).
+META_COLUMNS = ('Timestamp', 'source', 'controller', 'name')
+
+
+class FieldCoverage(object):
+    """Track which ranges of time we already have results for; per field and per controller.
+
+    Like a Timeframe, each (start, end) interval includes both its start and end.  A gap shares its endpoints with the
+    covered intervals around it; a value at a shared endpoint is covered, so it is only kept from the source which
+    covered it first (see covered_rows).
+    """
+
+    def __init__(self):
+        # type: () -> None
+        # {field: {controller: [(start, end), ...]}}
+        self._intervals = collections.defaultdict(dict)  # type: Dict[str, Dict[str, List[Tuple[Any, Any]]]]
+        # Changes whenever the covered time changes; so results derived from the cached values can be reused until then.
+        self.version = 0
+
+    def add(self, field, controller, start, end):
+        # type: (str, str, Any, Any) -> None
+        """Mark a range of time as covered for a field on a controller."""
+        intervals = self._intervals[field].get(controller, [])
+        self._intervals[field][controller] = time_utils.merge_intervals(intervals + [(start, end)])
+        self.version += 1
+
+    def remove(self, field):
+        # type: (str) -> None
+        """Forget all of the covered time for a field; i.e. when its cached values are no longer valid."""
+        self._intervals.pop(field, None)
+        self.version += 1
+
+    def get_intervals(self, field, controller):
+        # type: (str, str) -> List[Tuple[Any, Any]]
+        """Get the covered (start, end) intervals for a field on a controller."""
+        return list(self._intervals.get(field, {}).get(controller, []))
+
+    def get_gaps(self, field, controller, start, end):
+        # type: (str, str, Any, Any) -> List[Tuple[Any, Any]]
+        """Get the (start, end) intervals between start and end which are not covered yet; see FieldCoverage."""
+        return time_utils.subtract_intervals(start, end, self.get_intervals(field, controller))
+
+    def covered_rows(self, field, frame):
+        # type: (str, pandas.DataFrame) -> pandas.Series
+        """Get a boolean mask of the rows in a frame which are within the covered time for a field; see FieldCoverage.
+
+        Arguments:
+            field (str): The field to check coverage for.
+            frame (pandas.DataFrame): A frame with 'Timestamp' and 'controller' columns.
+
+        Returns:
+            mask (pandas.Series): True for each row which is already covered.
+        """
+        mask = pandas.Series(False, index=frame.index)
+        for controller, intervals in iteritems(self._intervals.get(field, {})):
+            is_controller = frame['controller'] == controller
+            for start, end in intervals:
+                mask |= is_controller & (frame['Timestamp'] >= start) & (frame['Timestamp'] <= end)
+        return mask
 
 
 class DataSource(object):
@@ -34,6 +98,7 @@ class DataSource(object):
             controllers (tuple): One or multiple controllers to use.
         """
         self.controllers = controllers
+        self.coverage = FieldCoverage()
         self.ident = ident  # type: Any
         self.timeframe = timeframe  # type: Any
 
@@ -49,11 +114,61 @@ class DataSource(object):
         """Placeholder for required method."""
         raise NotImplementedError('DataSource objects require a get_fields method.')
 
+    # pylint: disable=unused-argument
+    def get_fields_in_gaps(self, fields, gaps, name_filter=None):
+        # type: (List[str], Dict[str, Dict[str, List[Tuple[Any, Any]]]], Any) -> pandas.DataFrame
+        """Get fields for only the ranges of time which are not already covered by another source.
+
+        DataSources which cannot fetch partial ranges of time get the fields for the whole timeframe,
+        and any field with results for a controller is then considered to cover all of its gaps.
+
+        Arguments:
+            fields (list/set/tuple): One or more fields to request.
+            gaps (dict): Per field and per controller (start, end) intervals which are still needed.
+            name_filter (str/list/set/tuple): Only get long layout fields for these names (if the source allows it).
+
+        Returns:
+            results (pandas.DataFrame): Per field values; which also updates self.coverage.
+        """
+        results = self.get_fields(fields)
+        for field in fields:
+            if field not in results:
+                continue
+            for controller, field_gaps in iteritems(gaps.get(field, {})):
+                has_values = results[field][results['controller'] == controller].dropna()
+                if has_values.empty:
+                    continue
+                for start, end in field_gaps:
+                    self.coverage.add(field, controller, start, end)
+        return results
+
+    # pylint: disable=unused-argument
+    def get_latest_fields(self, fields, controllers=('CT0', 'CT1')):
+        # type: (List[str], Tuple[str, str]) -> pandas.DataFrame
+        """Get the latest values of the requested fields; see FlashArray.get_latest_values.
+
+        DataSources which cannot stop early get the fields for the whole timeframe; the latest value of each
+        field per controller is then taken from the end of the results.
+
+        Arguments:
+            fields (list/set/tuple): One or more fields to request.
+            controllers (tuple): One or both controllers ('CT0' and/or 'CT1').
+
+        Returns:
+            results (pandas.DataFrame): Per field values; at least the latest of each field per controller.
+        """
+        return self.get_fields(fields)
+
     def get_source_order(self, fields):
         # type: (List[str]) -> None
         """Get the order of sub-sources to use; based upon the timeframe's granularity and requested fields."""
         raise NotImplementedError('DataSource objects require a get_source_order method.')
 
+    def update_timeframe(self, timeframe):
+        # type: (Any) -> None
+        """Use a new timeframe for future requests; i.e. when the timeframe of the FlashArray changed."""
+        self.timeframe = timeframe
+
     @staticmethod
     def map_fields_to_sources(fields):
         # type: (List[str]) -> Dict[str, Any]
@@ -77,6 +192,8 @@ class DataSource(object):
                 raise ValueError(msg)
             field_index = FIELD_INDEX[field]  # type: Dict[str, str]
             for category, data_sources in iteritems(field_index):
+                if category in FIELD_OPTIONS:
+                    continue
                 if category not in mapping:
                     # e.g. 'logs'
                     mapping[category] = collections.defaultdict(set)
@@ -86,6 +203,55 @@ class DataSource(object):
         return dict(mapping)
 
 
+def is_long_field(field):
+    # type: (str) -> bool
+    """Check if a field has a long layout; one row per timestamp and name (i.e. per volume) with a 'name' column."""
+    return FIELD_INDEX.get(field, {}).get('layout') == 'long'
+
+
+def get_field_columns(field):
+    # type: (str) -> List[str]
+    """Get the columns of a get_fields result which belong to a field; including the meta columns."""
+    columns = ['Timestamp', field, 'source', 'controller']
+    if is_long_field(field):
+        columns.append('name')
+    return columns
+
+
+def apply_field_dtypes(frame):
+    # type: (pandas.DataFrame) -> pandas.DataFrame
+    """Convert the columns of a get_fields result to the output schema.
+
+    * Timestamp: datetime64[ns].
+    * source, controller and name: category.
+    * Fields: the dtype from the field_index.ini; fields without a dtype are kept as objects.
+
+    Arguments:
+        frame (pandas.DataFrame): Per field values with Timestamp, source, and controller columns.
+
+    Returns:
+        frame (pandas.DataFrame): The same frame; with the converted columns.
+    """
+    if frame.empty:
+        return frame
+    for column in frame:
+        if column == 'Timestamp':
+            frame[column] = time_utils.to_datetime_series(frame[column])
+        elif column in META_COLUMNS:
+            frame[column] = frame[column].astype('category')
+        elif FIELD_INDEX.get(column, {}).get('dtype'):
+            dtype = FIELD_INDEX[column]['dtype']
+            if dtype.startswith('int') and frame[column].isnull().any():
+                # Integer columns cannot hold missing values (i.e. rows from other fields).
+                dtype = 'float64'
+            try:
+                frame[column] = frame[column].astype(dtype)
+            except (TypeError, ValueError):
+                LOGGER.warning('Field "{}" has values which are not "{}"; keeping it as objects.'.format(column,
+                                                                                                          dtype))
+    return frame
+
+
 class SQLDatabaseDataSource(DataSource):
     """The base class for database connection parsers."""
 
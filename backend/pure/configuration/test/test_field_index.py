@@ -9,6 +9,8 @@ except ImportError:
     from configparser import ConfigParser
 
 DATA_SOURCES = ('insights', 'iris', 'logs', 'middleware', 'mr_tunable', 'pure1', 'warehouse')
+DTYPES = ('float64', 'int64')
+LAYOUTS = ('long',)
 PATH = os.path.dirname(__file__)
 
 
@@ -27,6 +29,16 @@ def test_fields():
         options = parser.options(section)
         assert options, 'Section "{}" has no options.'.format(section)
         for option in options:
+            if option == 'dtype':
+                # Assert that the dtype is one which we support
+                msg = 'Section "{}" has an unknown dtype "{}".'.format(section, parser.get(section, option))
+                assert parser.get(section, option) in DTYPES, msg
+                continue
+            if option == 'layout':
+                # Assert that the layout is one which we support
+                msg = 'Section "{}" has an unknown layout "{}".'.format(section, parser.get(section, option))
+                assert parser.get(section, option) in LAYOUTS, msg
+                continue
             # Assert that the option is defined in the OPTIONS
             msg = 'Section "{}" has an unknown Option "{}".'.format(section, option)
             assert option in DATA_SOURCES, msg
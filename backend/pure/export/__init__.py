@@ -0,0 +1 @@
+"""Contains a DataSource for fields which were exported to a file."""
@@ -0,0 +1,246 @@
+"""Contains the ExportedFields DataSource; for reading fields from a file written by FlashArray.export_fields.
+
+Exported files are Parquet or Feather (Arrow IPC) files of a get_fields result; with the identity and timeframe of
+the FlashArray in the schema metadata.  Reading only loads the requested columns, and Parquet files skip the row
+groups which are outside of the timeframe (with pyarrow 1.0 or newer; older versions read every row group).
+"""
+
+import logging
+
+import pandas
+import ujson
+
+from six import string_types
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# pylint: disable=unused-import
+try:
+    from typing import Any
+    from typing import Dict
+    from typing import List
+    from typing import Optional
+    from typing import Tuple
+except ImportError:
+    pass
+
+from photon.backend.pure import DataSource
+from photon.backend.pure import META_COLUMNS
+
+EXPORT_FORMATS = ('feather', 'parquet')
+# The first bytes of each format; so the format of a file does not depend upon its name.
+FORMAT_MAGIC = {b'ARROW1': 'feather', b'PAR1': 'parquet'}
+LOGGER = logging.getLogger(__name__)
+# The key for the FlashArray information within the schema metadata of an exported file.
+METADATA_KEY = b'photon'
+# Parquet files are written in row groups of this many rows; the statistics of each row group are used to skip it.
+ROW_GROUP_SIZE = 100000
+
+
+class ExportedFields(DataSource):
+    """A read-only DataSource which is backed by a file from FlashArray.export_fields."""
+
+    def __init__(self, ident, timeframe, controllers=('CT0', 'CT1'), path=None):
+        # type: (Any, Any, Tuple[str, str], Optional[str]) -> None
+        """
+        Arguments:
+            ident (array_utils.ArrayIdent): An identity for the array.
+            timeframe (time_utils.Timeframe): A time range for information to gather.
+            controllers (tuple): One or multiple controllers to use.
+            path (str): The exported file.
+        """
+        super(ExportedFields, self).__init__(ident=ident, timeframe=timeframe, controllers=controllers)
+        if not path:
+            msg = 'The "export" DataSource requires an exported file; see FlashArray.from_export.'
+            LOGGER.error(msg)
+            raise ValueError(msg)
+        self.path = path
+        self.metadata = read_metadata(path)
+
+    # pylint: disable=unused-argument
+    @staticmethod
+    def is_available(ident, fields, timeframe):
+        # type: (Any, Optional[List[str]], Optional[Any]) -> bool
+        """Exported files are only used by a FlashArray from FlashArray.from_export."""
+        return False
+
+    def get_fields(self, fields):
+        # type: (List[str]) -> pandas.DataFrame
+        """Read the requested fields within the timeframe from the exported file."""
+        return read_export(self.path, fields, self.timeframe.start, self.timeframe.end, self.controllers)
+
+
+def get_format(path):
+    # type: (str) -> str
+    """Get the format of an exported file ('feather' or 'parquet') from its first bytes."""
+    with open(path, 'rb') as export_file:
+        header = export_file.read(6)
+    for magic, file_format in FORMAT_MAGIC.items():
+        if header.startswith(magic):
+            return file_format
+    msg = 'The file "{}" is not a Feather or Parquet file.'.format(path)
+    LOGGER.error(msg)
+    raise ValueError(msg)
+
+
+def read_export(path, fields, start=None, end=None, controllers=None):
+    # type: (str, List[str], Optional[Any], Optional[Any], Optional[Tuple[str, ...]]) -> pandas.DataFrame
+    """Read fields from an exported file; only the requested columns and the rows within a range of time.
+
+    Arguments:
+        path (str): The exported file.
+        fields (list): One or more fields to read; fields which were not exported are skipped.
+        start (pandas.Timestamp): Skip rows before this time.
+        end (pandas.Timestamp): Skip rows after this time.
+        controllers (tuple): Only read rows from these controllers.
+
+    Returns:
+        results (pandas.DataFrame): The meta columns and a column per exported field; with a row per value.
+    """
+    _check_pyarrow()
+    file_format = get_format(path)
+    schema = _read_schema(path, file_format)
+    metadata = _get_metadata(schema, path)
+    field_columns = [field for field in fields if field in schema.names and field not in META_COLUMNS]
+    columns = [column for column in META_COLUMNS if column in schema.names] + field_columns
+    if file_format == 'parquet':
+        filters = []
+        if start is not None:
+            filters.append(('Timestamp', '>=', pandas.Timestamp(start)))
+        if end is not None:
+            filters.append(('Timestamp', '<=', pandas.Timestamp(end)))
+        if not _parquet_filters_supported():
+            # Before pyarrow 1.0 filters only apply to partitioned datasets, not to the row groups of a single file.
+            filters = []
+        table = pyarrow.parquet.read_table(path, columns=columns, filters=filters or None)
+    else:
+        # Feather files are memory mapped, so columns which are not requested are never read.
+        with pyarrow.memory_map(path) as export_file:
+            table = pyarrow.ipc.open_file(export_file).read_all()
+        table = table.drop([name for name in table.schema.names if name not in columns])
+    results = table.to_pandas()
+
+    # Filter the rows here as well; Feather has no filters and Parquet filters only skip whole row groups.
+    keep = results[field_columns].notnull().any(axis=1)
+    if start is not None:
+        keep &= results['Timestamp'] >= start
+    if end is not None:
+        keep &= results['Timestamp'] <= end
+    if controllers:
+        keep &= results['controller'].isin(controllers)
+    results = results.loc[keep, columns].reset_index(drop=True)
+    return _decode_json_columns(results, metadata.get('json_columns', []))
+
+
+def read_metadata(path):
+    # type: (str) -> Dict[str, Any]
+    """Read the FlashArray information of an exported file; i.e. its fqdn and the timeframe of the export."""
+    _check_pyarrow()
+    return _get_metadata(_read_schema(path, get_format(path)), path)
+
+
+def write_export(results, path, file_format, metadata):
+    # type: (pandas.DataFrame, str, str, Dict[str, Any]) -> None
+    """Write the results of get_fields to a Feather or Parquet file.
+
+    Arguments:
+        results (pandas.DataFrame): A get_fields result.
+        path (str): Where to write the file.
+        file_format (str): One of the EXPORT_FORMATS.
+        metadata (dict): Information about the FlashArray to keep with the results; see FlashArray.export_fields.
+    """
+    _check_pyarrow()
+    if file_format not in EXPORT_FORMATS:
+        msg = 'Unknown export format "{}"; use one of {}.'.format(file_format, EXPORT_FORMATS)
+        LOGGER.error(msg)
+        raise ValueError(msg)
+    results, json_columns = _encode_json_columns(results)
+    table = pyarrow.Table.from_pandas(results, preserve_index=False)
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata[METADATA_KEY] = ujson.dumps(dict(metadata, json_columns=json_columns)).encode('utf-8')
+    table = table.replace_schema_metadata(schema_metadata)
+    if file_format == 'parquet':
+        pyarrow.parquet.write_table(table, path, row_group_size=ROW_GROUP_SIZE)
+    else:
+        # A Feather (V2) file is an Arrow IPC file; pyarrow.feather.write_feather only writes those (with the schema
+        # metadata) since pyarrow 0.17, so use the IPC writer which every version has.
+        writer = pyarrow.ipc.RecordBatchFileWriter(path, table.schema)
+        try:
+            writer.write_table(table)
+        finally:
+            writer.close()
+    LOGGER.info('Exported {} rows to "{}".'.format(len(results), path))
+
+
+def _check_pyarrow():
+    # type: () -> None
+    """Exporting requires pyarrow; which is an optional dependency."""
+    if pyarrow is None:
+        msg = 'Exporting fields requires pyarrow; install it with "pip install pyarrow".'
+        LOGGER.error(msg)
+        raise ImportError(msg)
+
+
+def _decode_json_columns(results, json_columns):
+    # type: (pandas.DataFrame, List[str]) -> pandas.DataFrame
+    """Decode the columns which _encode_json_columns stored as JSON."""
+    for column in json_columns:
+        if column not in results:
+            continue
+        results[column] = [ujson.loads(value) if value is not None else None for value in results[column].tolist()]
+    return results
+
+
+def _encode_json_columns(results):
+    # type: (pandas.DataFrame) -> Tuple[pandas.DataFrame, List[str]]
+    """Store object columns which are not only str values (i.e. a dict per volume) as JSON.
+
+    Returns:
+        results (pandas.DataFrame): A copy of the results with the encoded columns; or the same results.
+        json_columns (list): The encoded columns.
+    """
+    json_columns = []
+    encoded = results
+    for column in results:
+        if results[column].dtype != object:
+            continue
+        not_null = results[column].notnull()
+        if all(isinstance(value, string_types) for value in results[column][not_null].tolist()):
+            continue
+        if encoded is results:
+            encoded = results.copy()
+        encoded[column] = [ujson.dumps(value) if has_value else None
+                           for value, has_value in zip(results[column].tolist(), not_null.tolist())]
+        json_columns.append(column)
+    return encoded, json_columns
+
+
+def _get_metadata(schema, path):
+    # type: (Any, str) -> Dict[str, Any]
+    """Get the FlashArray information from the schema of an exported file."""
+    schema_metadata = schema.metadata or {}
+    if METADATA_KEY not in schema_metadata:
+        msg = 'The file "{}" was not written by FlashArray.export_fields.'.format(path)
+        LOGGER.error(msg)
+        raise ValueError(msg)
+    return ujson.loads(schema_metadata[METADATA_KEY])
+
+
+def _parquet_filters_supported():
+    # type: () -> bool
+    """Whether pyarrow.parquet.read_table can filter the row groups of a single file; i.e. pyarrow 1.0 or newer."""
+    return int(pyarrow.__version__.split('.')[0]) >= 1
+
+
+def _read_schema(path, file_format):
+    # type: (str, str) -> Any
+    """Read only the schema of an exported file."""
+    if file_format == 'parquet':
+        return pyarrow.parquet.read_schema(path)
+    with pyarrow.memory_map(path) as export_file:
+        return pyarrow.ipc.open_file(export_file).schema
@@ -0,0 +1,140 @@
+"""Unit tests for the export DataSource."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+import pandas
+
+from photon import api
+from photon.backend.pure import apply_field_dtypes
+from photon.backend.pure.export import export_api
+from photon.lib import array_utils
+from photon.lib import time_utils
+
+RESULTS = apply_field_dtypes(pandas.DataFrame({
+    'Timestamp': pandas.to_datetime(['2018-01-01 10:00', '2018-01-01 10:00', '2018-01-01 11:00',
+                                     '2018-01-01 12:00', '2018-01-01 13:00']),
+    'source': ['logs'] * 5,
+    'controller': ['CT0', 'CT1', 'CT0', 'CT1', 'CT0'],
+    'array_name': ['my_array', 'my_array', None, 'my_array', None],
+    'ssd_mapped': [numpy.nan, numpy.nan, 10., 11., 12.],
+    'volume_read_latency': [None, None, {'vol1': 3}, None, {'vol1': 4, 'vol2': 5}],
+}, columns=['Timestamp', 'source', 'controller', 'array_name', 'ssd_mapped', 'volume_read_latency']))
+METADATA = {'end': '2018-01-01 13:00:00', 'fields': ['array_name', 'ssd_mapped', 'volume_read_latency'],
+            'fqdn': None, 'granularity': '3600000000000ns', 'start': '2018-01-01 10:00:00'}
+
+
+class EncodeJSONColumnsTestCase(unittest.TestCase):
+    """Unit tests for _encode_json_columns and _decode_json_columns."""
+
+    def test_encode(self):
+        """Only object columns with values which are not str are encoded; without changing the results."""
+        encoded, json_columns = export_api._encode_json_columns(RESULTS)
+        self.assertEqual(json_columns, ['volume_read_latency'])
+        self.assertEqual(encoded['volume_read_latency'].tolist(),
+                         [None, None, '{"vol1":3}', None, '{"vol1":4,"vol2":5}'])
+        self.assertEqual(encoded['array_name'].tolist(), RESULTS['array_name'].tolist())
+        self.assertEqual(RESULTS['volume_read_latency'][2], {'vol1': 3})
+
+    def test_round_trip(self):
+        """Decoding the encoded columns gives back the same values."""
+        encoded, json_columns = export_api._encode_json_columns(RESULTS)
+        decoded = export_api._decode_json_columns(encoded, json_columns)
+        self.assertEqual(decoded['volume_read_latency'].tolist(), RESULTS['volume_read_latency'].tolist())
+
+    def test_no_json_columns(self):
+        """Results without any such columns are not copied."""
+        results = RESULTS[['Timestamp', 'controller', 'ssd_mapped']]
+        encoded, json_columns = export_api._encode_json_columns(results)
+        self.assertIs(encoded, results)
+        self.assertEqual(json_columns, [])
+
+
+@unittest.skipIf(export_api.pyarrow is None, 'pyarrow is not installed.')
+class ExportTestCase(unittest.TestCase):
+    """Unit tests for write_export and read_export in each format."""
+
+    def setUp(self):
+        """Use a temporary directory for the exported files."""
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the exported files."""
+        shutil.rmtree(self.directory)
+
+    def _export(self, file_format):
+        """Export the RESULTS in a format."""
+        path = os.path.join(self.directory, 'export.{}'.format(file_format))
+        export_api.write_export(RESULTS, path, file_format, METADATA)
+        return path
+
+    def test_round_trip(self):
+        """Reading all of the fields gives back the same results."""
+        for file_format in export_api.EXPORT_FORMATS:
+            path = self._export(file_format)
+            self.assertEqual(export_api.get_format(path), file_format)
+            results = export_api.read_export(path, METADATA['fields'])
+            pandas.testing.assert_frame_equal(results, RESULTS)
+
+    def test_metadata(self):
+        """The FlashArray information is kept in the exported file."""
+        for file_format in export_api.EXPORT_FORMATS:
+            metadata = export_api.read_metadata(self._export(file_format))
+            self.assertEqual(metadata, dict(METADATA, json_columns=['volume_read_latency']))
+
+    def test_columns(self):
+        """Only the requested fields are read; and only the rows which have a value for them."""
+        for file_format in export_api.EXPORT_FORMATS:
+            results = export_api.read_export(self._export(file_format), ['ssd_mapped', 'unknown_field'])
+            self.assertEqual(list(results.columns), ['Timestamp', 'source', 'controller', 'ssd_mapped'])
+            self.assertEqual(results['ssd_mapped'].tolist(), [10., 11., 12.])
+
+    def test_time_range(self):
+        """Only rows within the requested range of time and controllers are read."""
+        start = time_utils.Timestamp('2018-01-01 11:00')
+        end = time_utils.Timestamp('2018-01-01 12:00')
+        for file_format in export_api.EXPORT_FORMATS:
+            path = self._export(file_format)
+            results = export_api.read_export(path, ['ssd_mapped'], start, end)
+            self.assertEqual(results['ssd_mapped'].tolist(), [10., 11.])
+            results = export_api.read_export(path, ['ssd_mapped'], start, end, controllers=('CT1',))
+            self.assertEqual(results['ssd_mapped'].tolist(), [11.])
+
+    def test_unknown_format(self):
+        """Only the EXPORT_FORMATS can be written."""
+        with self.assertRaises(ValueError):
+            export_api.write_export(RESULTS, os.path.join(self.directory, 'export.csv'), 'csv', METADATA)
+
+    def test_not_an_export(self):
+        """Files which were not written by export_fields are rejected."""
+        path = os.path.join(self.directory, 'export.txt')
+        with open(path, 'w') as text_file:
+            text_file.write('Not an export.')
+        with self.assertRaises(ValueError):
+            export_api.read_metadata(path)
+
+    def test_exported_fields(self):
+        """The DataSource reads the fields within its timeframe."""
+        path = self._export('parquet')
+        timeframe = time_utils.Timeframe('2018-01-01 11:00', '2018-01-01 13:00', '1h')
+        source = export_api.ExportedFields(array_utils.ArrayIdent(), timeframe, path=path)
+        results = source.get_fields(['array_name'])
+        self.assertEqual(results['array_name'].tolist(), ['my_array'])
+
+    def test_exported_fields_requires_path(self):
+        """The DataSource cannot be used without an exported file."""
+        timeframe = time_utils.Timeframe('2018-01-01 11:00', '2018-01-01 13:00', '1h')
+        with self.assertRaises(ValueError):
+            export_api.ExportedFields(array_utils.ArrayIdent(), timeframe)
+
+    def test_from_export(self):
+        """A FlashArray from an exported file uses its timeframe and only the export DataSource."""
+        flasharray = api.FlashArray.from_export(self._export('feather'), start='2018-01-01 12:00')
+        self.assertEqual(flasharray.timeframe.start, time_utils.Timestamp('2018-01-01 12:00'))
+        self.assertEqual(flasharray.timeframe.end, time_utils.Timestamp('2018-01-01 13:00'))
+        self.assertEqual(flasharray.get_data_sources(['ssd_mapped']), ['export'])
+        results = flasharray.get_fields(['ssd_mapped'])
+        self.assertEqual(results['ssd_mapped'].tolist(), [11., 12.])
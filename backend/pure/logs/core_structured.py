@@ -1,14 +1,16 @@
 """Contains parser definitions on how to extract data from the core-structured log."""
 
 import collections
-import ujson
 
-from six import iteritems
+import numpy
+import pandas
+import ujson
 
 # pylint: disable=unused-import,line-too-long
 try:
     from typing import Any
     from typing import Dict
+    from typing import Iterator
     from typing import List
     from typing import Optional
     from typing import Tuple
@@ -18,6 +20,11 @@ except ImportError:
 from photon.lib import parser_utils
 from photon.lib import time_utils
 
+# The per device stats which are kept in the bdev_table:
+BDEV_STATS = ('rd_avg_lat', 'rd_bytes', 'rd_cnt', 'wr_avg_lat', 'wr_bytes', 'wr_cnt')
+# Lines which were logged within this long of the first line of an interval are part of that interval.
+INTERVAL_THRESHOLD = time_utils.Timedelta('10 seconds')
+
 
 class CoreStructuredFormData(parser_utils.FormData):
     """Forms used by the CoreParser."""
@@ -50,43 +57,79 @@ class CoreStructuredParser(parser_utils.ParallelLogParser):
         'per_bdev_write_iops': CoreStructuredLogData(['per_bdev_stats']),
     }
 
+    _bdev_table = None
+
+    def _iter_bdev_dumps(self):
+        # type: () -> Iterator[Tuple[pandas.Timestamp, Any]]
+        """Decode each per_bdev_stats line; with the time of the interval which it was logged in."""
+        time_strs = []
+        dumps = []
+        for line in self.get_form_lines('per_bdev_stats'):
+            month, day, time, _, _, json_dump = line.split()
+            time_strs.append(' '.join([month, day, time]))
+            dumps.append(ujson.loads(json_dump, precise_float=True))
+        times = _parse_times(time_strs, self.log_date)
+        interval_times = _align_intervals(times, INTERVAL_THRESHOLD.value)
+        for interval_time, json_dump in zip(pandas.to_datetime(interval_times), dumps):
+            yield interval_time, json_dump
+
+    @property
+    def bdev_table(self):
+        # type: () -> pandas.DataFrame
+        """The BDEV_STATS of each device per interval; built once and shared by all of the per_bdev fields.
+
+        Returns:
+            A numeric pandas.DataFrame with a BDEV_STATS column per stat, indexed by ('Timestamp', 'name') and sorted
+            by Timestamp (devices stay in the order which they were logged).
+        """
+        if self._bdev_table is None:
+            timestamps = []
+            names = []
+            stats = []
+            for timestamp, json_dump in self._iter_bdev_dumps():
+                timestamps.append(timestamp)
+                names.append(json_dump[1]['name'].replace(':', ''))
+                stats.append(json_dump[1]['stats'])
+            index = pandas.MultiIndex.from_arrays([timestamps, names], names=['Timestamp', 'name'])
+            table = pandas.DataFrame.from_records(stats, index=index, columns=BDEV_STATS) if stats else \
+                pandas.DataFrame(index=index, columns=BDEV_STATS)
+            # A device which was logged more than once in an interval keeps its last values.
+            table = table[~table.index.duplicated(keep='last')]
+            self._bdev_table = table.iloc[numpy.argsort(table.index.get_level_values(0).values, kind='mergesort')]
+        return self._bdev_table
+
+    def bdev_matrix(self, stat):
+        # type: (str) -> pandas.DataFrame
+        """A single stat as an interval x device matrix; i.e. for a latency heatmap across devices.
+
+        Arguments:
+            stat (str): One of the BDEV_STATS.
+
+        Returns:
+            A pandas.DataFrame indexed by Timestamp with a column per device; NaN where a device was not logged.
+        """
+        return self.bdev_table[stat].unstack('name')
+
     def get_per_bdev_stats(self):
         # type: () -> List[Tuple[Any, Any]]
         """Fetch per-timestamp values for 'per_bdev_stats'."""
-        lines = self.get_form_lines('per_bdev_stats')
-        threshold = time_utils.Timedelta('10 seconds')
-        bdev_values = []
-        temp = collections.defaultdict(list)  # type: collections.defaultdict
-        floor = None
-        for line in lines:
-            month, day, time, _, _, json_dump = line.split()
-            # Slightly reduce resolution of the timestamp so we can match up when logging took longer than 1 ms.
-            timestamp = time_utils.Timestamp(' '.join([month, day, time]))
-            if not floor:
-                floor = timestamp
-            elif timestamp - floor >= threshold:
-                floor = timestamp
-            else:
-                timestamp = floor
-            temp[timestamp].append(ujson.loads(json_dump, precise_float=True))
-        for timestamp, matches in iteritems(temp):
-            bdev_values.append((timestamp, matches))
-        return bdev_values
+        temp = collections.OrderedDict()  # type: collections.OrderedDict
+        for timestamp, json_dump in self._iter_bdev_dumps():
+            temp.setdefault(timestamp, []).append(json_dump)
+        return list(temp.items())
 
     def _get_stat_from_bdev_stats(self, stat):
         # type: (str) -> List[Tuple[Any, Any]]
         """Pull a single stat from each drive per timestamp."""
-        all_stats = self.get_field('per_bdev_stats')
-        parsed = []
-        temp = collections.defaultdict(dict)  # type: collections.defaultdict
-        for timestamp, json_dumps in all_stats:
-            for json_dump in json_dumps:
-                name = json_dump[1]['name'].replace(':', '')
-                stats = json_dump[1]['stats']
-                temp[timestamp][name] = stats[stat]
-        for timestamp, matches in iteritems(temp):
-            parsed.append((timestamp, matches))
-        return parsed
+        column = self.bdev_table[stat]
+        timestamps = column.index.get_level_values('Timestamp')
+        names = column.index.get_level_values('name').tolist()
+        values = column.tolist()
+        # The table is sorted by Timestamp, so each interval is a contiguous run of rows.
+        starts = [0] + (numpy.flatnonzero(timestamps[1:] != timestamps[:-1]) + 1).tolist()
+        ends = starts[1:] + [len(values)]
+        return [(timestamps[start], dict(zip(names[start:end], values[start:end])))
+                for start, end in zip(starts, ends) if start < end]
 
     def get_per_bdev_read_latency(self):
         # type: () -> List[Tuple[Any, Any]]
@@ -117,3 +160,46 @@ class CoreStructuredParser(parser_utils.ParallelLogParser):
         # type: () -> List[Tuple[Any, Any]]
         """Fetch per-timestamp values for 'bdev_write_iops'."""
         return self._get_stat_from_bdev_stats('wr_cnt')
+
+
+def _align_intervals(times, threshold):
+    # type: (numpy.ndarray, int) -> numpy.ndarray
+    """Align times to the first time of their interval; so that lines which took longer to log are matched up.
+
+    An interval starts at the first time which is at least threshold after the start of the previous interval.
+
+    Arguments:
+        times (numpy.ndarray): Times (int64 nanoseconds) in the order that they were logged.
+        threshold (int): The length of an interval in nanoseconds.
+
+    Returns:
+        A numpy.ndarray with the start time of the interval of each time.
+    """
+    if not len(times):
+        return times
+    if (times[1:] >= times[:-1]).all():
+        # In order (as logs are), so only step from the start of each interval to the next.
+        starts = []
+        index = 0
+        while index < len(times):
+            starts.append(index)
+            index = numpy.searchsorted(times, times[index] + threshold, side='left')
+        run_starts = numpy.zeros(len(times), dtype='int64')
+        run_starts[starts] = starts
+        return times[numpy.maximum.accumulate(run_starts)]
+    aligned = times.copy()
+    floor = times[0]
+    for index, timestamp in enumerate(times.tolist()):
+        if timestamp - floor >= threshold:
+            floor = timestamp
+        aligned[index] = floor
+    return aligned
+
+
+def _parse_times(time_strs, reference=None):
+    # type: (List[str], Optional[Any]) -> numpy.ndarray
+    """Parse log times without a year (i.e. 'May 10 23:18:43.123') to int64 nanoseconds.
+
+    The year is inferred from the reference (the date of the log file); see time_utils.TimestampParser.
+    """
+    return time_utils.parse_timestamps(time_strs, reference).astype('int64')
@@ -1,6 +1,7 @@
 """Contains parser definitions on how to extract data from the diagnostics log."""
 
 import collections
+import functools
 import logging
 import re
 
@@ -20,6 +21,7 @@ except ImportError:
 from photon.lib import parser_utils
 from photon.lib import format_utils
 from photon.lib import hardware_utils
+from photon.lib import table_utils
 from photon.lib import time_utils
 
 LOGGER = logging.getLogger(__name__)
@@ -132,33 +134,31 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         'volume_space': DiagLogData(['diagnostics']),
     }
     _diagnostics_sections = None
+    _section_digests = None  # type: Optional[Dict[str, List[str]]]
+    _section_index = None  # type: Optional[Dict[str, List[Tuple[str, List[str]]]]]
+    _section_lines = None  # type: Optional[Dict[str, List[Tuple[Any, List[str]]]]]
+    _section_tables = None  # type: Optional[Dict[str, Dict[str, Any]]]
+    _shared_sections = None  # type: Optional[parser_utils.SharedValues]
 
     @property
-    def diagnostics_sections(self):
-        # type: () -> Dict[str, Any]
-        """Just get raw lines from a section of diagnostics; based upon cmd name.
+    def section_index(self):
+        # type: () -> Dict[str, List[Tuple[str, List[str]]]]
+        """Index where each command's sections are; with a single scan of the section headers.
+
+        The lines of each section are not filtered or split here, that only happens for sections that we need.
 
         Returns:
-            sections (dict): Lines for one or more matched sections.
+            index (dict): Per command name, a list of (raw timestamp, unfiltered lines) for each of its sections.
         """
-        if self._diagnostics_sections:
-            return self._diagnostics_sections
-        diagnostics_sections = collections.defaultdict(list)
-        section_break = '*' * 72
-        header_break = '-' * 72
+        if self._section_index is not None:
+            return self._section_index
+        index = collections.defaultdict(list)  # type: Dict[str, List[Tuple[str, List[str]]]]
         command = None
         timestamp = None
         for lines in self.get_form_lines('diagnostics'):
             # Each set of lines could be a command header or the command output
             if command and timestamp:
-                filtered_lines = []
-                for line in lines:
-                    # Stop adding lines when the section break is seen
-                    if line.startswith(section_break):
-                        break
-                    elif not line.startswith(header_break):
-                        filtered_lines.append(line)
-                diagnostics_sections[command].append((timestamp, filtered_lines))
+                index[command].append((timestamp, lines))
                 # Reset for the next section
                 command = None
                 timestamp = None
@@ -167,12 +167,102 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
                     match = self.header_reg.search(line)
                     if match:
                         command = match.group('cmd')
-                        timestamp = time_utils.Timestamp(parse_date(match.group('timestamp')))
-        self._diagnostics_sections = dict(diagnostics_sections)
+                        timestamp = match.group('timestamp')
+        self._section_index = dict(index)
+        return self._section_index
+
+    def _get_section(self, command):
+        # type: (str) -> Optional[List[Tuple[Any, List[str]]]]
+        """Get the lines of each section of a single command; the first request for a command is memoized.
+
+        Arguments:
+            command (str): The command which generated the section (i.e. 'purevol list').
+
+        Returns:
+            sections (list): A list of (timestamp, lines) for each section; or None if the command has no sections.
+        """
+        if self._section_lines is None:
+            self._section_lines = {}
+        if command not in self._section_lines:
+            sections = self.section_index.get(command)
+            if sections is None:
+                return None
+            self._section_lines[command] = [(time_utils.Timestamp(parse_date(timestamp)), _filter_section_lines(lines))
+                                            for timestamp, lines in sections]
+        return self._section_lines[command]
+
+    def _get_section_digests(self, command):
+        # type: (str) -> List[str]
+        """Get the content hash of each section of a single command."""
+        if self._section_digests is None:
+            self._section_digests = {}
+        if command not in self._section_digests:
+            self._section_digests[command] = [parser_utils.content_hash(lines)
+                                              for _, lines in self._get_section(command) or []]
+        return self._section_digests[command]
+
+    def _map_sections(self, section, parse_function):
+        # type: (str, Any) -> parser_utils.RunLengthValues
+        """Parse each section of a command with a function; sections with the same content are only parsed once.
+
+        Arguments:
+            section (str): The diagnostics section to parse.
+            parse_function (function): Parse the lines of a section.
+
+        Returns:
+            results (parser_utils.RunLengthValues): The parsed value for each timestamp.
+        """
+        results = parser_utils.RunLengthValues()
+        sections = self._get_section(section) or []
+        for (timestamp, lines), digest in zip(sections, self._get_section_digests(section)):
+            key = (parse_function.__name__, digest)
+            results.append_shared(timestamp, key, self.shared_sections, functools.partial(parse_function, lines))
+        return results
+
+    @property
+    def shared_sections(self):
+        # type: () -> parser_utils.SharedValues
+        """Parsed sections by their content hash; most sections do not change from one timestamp to the next."""
+        if self._shared_sections is None:
+            self._shared_sections = parser_utils.SharedValues()
+        return self._shared_sections
+
+    @property
+    def diagnostics_sections(self):
+        # type: () -> Dict[str, Any]
+        """Just get raw lines from all sections of diagnostics; based upon cmd name.
+
+        This reads every section, use _get_section to only read the sections for a single command.
+
+        Returns:
+            sections (dict): Lines for one or more matched sections.
+        """
+        if self._diagnostics_sections:
+            return self._diagnostics_sections
+        self._diagnostics_sections = {command: self._get_section(command) for command in self.section_index}
         return self._diagnostics_sections
 
+    def _get_section_tables(self, section):
+        # type: (str) -> Optional[List[Tuple[Any, str, Dict[str, Any]]]]
+        """Get the (timestamp, content hash, parsed table) of each section of a command.
+
+        Tables are memoized by their content hash; so sections with the same content share a single table, which is
+        only read from (i.e. by _pull_keys) and never given out.
+        """
+        sections = self._get_section(section)
+        if sections is None:
+            return None
+        if self._section_tables is None:
+            self._section_tables = {}
+        tables = []
+        for (timestamp, lines), digest in zip(sections, self._get_section_digests(section)):
+            if digest not in self._section_tables:
+                self._section_tables[digest] = _parse_table_lines(lines)
+            tables.append((timestamp, digest, self._section_tables[digest]))
+        return tables
+
     def _pull_from(self, section, keys=None, convert_to_raw=None):
-        # type: (str, Optional[List[str]], Optional[List[str]]) -> List[Tuple[Any, Any]]
+        # type: (str, Optional[List[str]], Optional[List[str]]) -> parser_utils.RunLengthValues
         """Pull a key from a previously parsed section.
 
         Arguments:
@@ -181,44 +271,34 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
             convert_to_raw (list): One or more keys to convert to raw values while parsing.
 
         Returns:
-            results (list): A list of tuples containing (timestamp, value).
+            results (parser_utils.RunLengthValues): The value for each timestamp.
+                * Consecutive timestamps with the same section content share a single value.
         """
-        results = []
-        parsed_section = self.diagnostics_sections.get(section)
+        results = parser_utils.RunLengthValues()
+        parsed_section = self._get_section_tables(section)
         if not parsed_section:
             msg = 'The requested section "{}" does not exist.'.format(section)
             LOGGER.warning(msg)
             return results
-        for timestamp, lines in parsed_section:
-            parsed_dict = _parse_table_lines(lines)
+        for timestamp, digest, parsed_dict in parsed_section:
             keys = keys or list(parsed_dict.keys())
-            parsed_values = {}
-            for key in keys:
-                value = parsed_dict.get(key)
-                if value and convert_to_raw and key in convert_to_raw:
-                    if isinstance(value, list):
-                        value = [int(format_utils.to_raw(val)) if val != '-' else 0 for val in value]
-                    else:
-                        value = int(format_utils.to_raw(value)) if value != '-' else 0
-                parsed_values[key] = value
-            # If the length of the parsed values is 1 key; then we don't need to nest this in a dictionary.
-            if len(parsed_values) == 1:
-                parsed_values = parsed_values[keys[0]]
-            results.append((timestamp, parsed_values))
+            value_key = ('_pull_from', digest, tuple(keys), tuple(convert_to_raw or ()))
+            results.append_shared(timestamp, value_key, self.shared_sections,
+                                  functools.partial(_pull_keys, parsed_dict, keys, convert_to_raw))
         return results
 
     def get_apartments(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the apartment mappings per timestamp."""
         return self._pull_from('puredb list apartment_mappings', ['Apartment'])
 
     def get_array_name(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array_name per timestamp."""
         return self._pull_from('purearray list', ['Name'])
 
     def get_capacity(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array capacity per timestamp."""
         return self._pull_from('purearray list --space', ['Capacity'], convert_to_raw=['Capacity'])
 
@@ -241,17 +321,17 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         return serials
 
     def get_data_reduction(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array data_reduction per timestamp."""
         return self._pull_from('purearray list --space', keys=['Data Reduction'])
 
     def get_controller_mode(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the controller mode per timestamp."""
         return self._pull_from('purearray list --controller', keys=['Mode', 'Name'])
 
     def get_controller_model(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the controller model per timestamp."""
         return self._pull_from('purearray list --controller', keys=['Model', 'Name'])
 
@@ -272,12 +352,12 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         return serials
 
     def get_controller_status(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the controller status per timestamp."""
         return self._pull_from('purearray list --controller', keys=['Status', 'Name'])
 
     def get_controller_version(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the controller Purity version per timestamp."""
         return self._pull_from('purearray list --controller', keys=['Version', 'Name'])
 
@@ -304,12 +384,12 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         """Get all of the counters for each Ethernet interface."""
         temp = collections.defaultdict(dict)
         # Example: 'ethtool -S eth0' -> 'eth0'
-        interfaces = [key.split()[-1] for key in self.diagnostics_sections if 'ethtool' in key]
+        interfaces = [key.split()[-1] for key in self.section_index if 'ethtool' in key]
         # Combine counters from ethtool -d, -m, and -S on the interface name.
         for interface in interfaces:
-            eth_s = self.diagnostics_sections.get('ethtool -S {}'.format(interface))
-            eth_d = self.diagnostics_sections.get('ethtool -d {}'.format(interface))
-            eth_m = self.diagnostics_sections.get('ethtool -m {}'.format(interface))
+            eth_s = self._get_section('ethtool -S {}'.format(interface))
+            eth_d = self._get_section('ethtool -d {}'.format(interface))
+            eth_m = self._get_section('ethtool -m {}'.format(interface))
             for index, section_tuple in enumerate(eth_s):
                 timestamp = section_tuple[0]
                 parsed = _parse_ethtool_lines(section_tuple[1])
@@ -326,7 +406,7 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
     def get_finddrive_all(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get find_drive information."""
-        find_drive = self.diagnostics_sections.get(r'find_drive.py all')
+        find_drive = self._get_section(r'find_drive.py all')
         parsed = []
         for timestamp, lines in find_drive:
             parsed.append((timestamp, hardware_utils.parse_finddrive(lines)))
@@ -335,14 +415,14 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
     def get_hardware_check(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get hardware_check.py information."""
-        checks = self.diagnostics_sections.get(r'hardware_check.py')
+        checks = self._get_section(r'hardware_check.py')
         parsed = []
         for timestamp, lines in checks:
             parsed.append((timestamp, hardware_utils.parse_hardware_check(lines)))
         return parsed
 
     def get_parity(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array parity per timestamp."""
         return self._pull_from('purearray list --space', keys=['Parity'])
 
@@ -352,7 +432,7 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         # Example of raw portal state information:
         # portal state = 200c6, gen = 0x214, primary = 1
         # OPEN, DEVIO_READY, RW_READY, SYS_VOL_ALLOWED
-        sections = self.diagnostics_sections.get(r'psctl -s')
+        sections = self._get_section(r'psctl -s')
         parsed = []
         for timestamp, lines in sections:
             portal_state = {'info': []}
@@ -374,7 +454,7 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         # type: () -> List[Tuple[Any, Any]]
         """Get a count of pgroup related snapshots."""
         results = []
-        pgroup_snaps = self.diagnostics_sections.get('purepgroup list --space --total')
+        pgroup_snaps = self._get_section('purepgroup list --space --total')
         # The number of lines per timestamp will reflect the number of snapshots.
         # Subtract 1 due to the (total) line per timestamp.
         # Subtract 1 due to the header line.
@@ -395,248 +475,243 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         return parsed
 
     def get_purealert_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purealert list'."""
         return self._pull_from('purealert list')
     
     def get_purearray_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list'."""
         return self._pull_from(r'purearray list')
 
     def get_purearray_list_connect(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list --connect'."""
         return self._pull_from(r'purearray list --connect')
 
     def get_purearray_list_controller(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list --controller'."""
         return self._pull_from(r'purearray list --controller')
 
     def get_purearray_list_ntpserver(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list --ntpserver'."""
         return self._pull_from(r'purearray list --ntpserver')
 
     def get_purearray_list_phonehome(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list --phonehome'."""
         return self._pull_from(r'purearray list --phonehome')
 
     def get_purearray_list_relayhost(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list --relayhost'."""
         return self._pull_from(r'purearray list --relayhost')
     
     def get_security_token(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list --security-token'."""
         return self._pull_from(r'purearray list --security-token', ['Status'])
    
 
     def get_purearray_list_sender(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list --sender'."""
         return self._pull_from(r'purearray list --sender')
 
     def get_purearray_list_space(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purearray list --space'."""
         keys = ['Capacity', 'Shared Space', 'Snapshots', 'System', 'Total', 'Volumes']
         return self._pull_from(r'purearray list --space', convert_to_raw=keys)
 
     def get_puredb_dedup_version(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb dedup version'."""
         return self._pull_from(r'puredb dedup version')
 
     def get_puredb_npiv_status(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb npiv status'."""
         return self._pull_from(r'puredb npiv status')
 
     def get_puredb_npiv_supported(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb npiv supported'."""
         return self._pull_from(r'puredb npiv supported')
 
     def get_puredb_stats_crawler(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb stats crawler'."""
         return self._pull_from(r'puredb stats crawler')
 
     def get_puredb_list_apartment_mappings(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb list apartment_mappings'."""
         return self._pull_from(r'puredb list apartment_mappings')
 
     def get_puredb_list_reservation(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb list reservation'."""
         return self._pull_from('puredb list reservation')
 
     def get_puredb_list_tunable_diff(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb list tunable --diff'."""
         return self._pull_from(r'puredb list tunable --diff')
 
     def get_puredb_list_tunable_platform_diff(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb list tunable --platform --diff'."""
         return self._pull_from(r'puredb list tunable --platform --diff')
 
     def get_puredb_messaging_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb messaging list'."""
         return self._pull_from('puredb messaging list')
 
     def get_puredb_replication_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredb replication list'."""
         keys = ['Bytes Received', 'Bytes Sent', 'Inline Dup Bytes', 'Physical Bytes Written',
                 'Transport Dup Bytes']
         return self._pull_from(r'puredb replication list', convert_to_raw=keys)
 
     def get_puredns_list_all(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredns list --all'."""
         return self._pull_from('puredns list --all')
 
     def get_puredrive_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puredrive list --total'."""
         return self._pull_from('puredrive list --total', convert_to_raw=['Capacity'])
 
     def get_pureds_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'pureds list'."""
         return self._pull_from(r'pureds list')
 
     def get_pureds_list_groups(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'pureds list --groups'."""
         return self._pull_from(r'pureds list --groups')
 
     def get_purehost_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purehost list'."""
         return self._pull_from('purehost list')
 
     def get_purehost_list_connect(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purehost list --connect'."""
         return self._pull_from(r'purehost list --connect')
 
     def get_purehgroup_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purehgroup list'."""
         return self._pull_from('purehgroup list')
 
     def get_purehgroup_list_connect(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purehgroup list --connect'."""
         return self._pull_from(r'purehgroup list --connect')
 
     def get_purehw_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purehw list --all'."""
-        parsed = []
-        sections = self.diagnostics_sections.get(r'purehw list --all')
-        for timestamp, section in sections:
-            purehw_parsed = hardware_utils.parse_purehw_list(section)
-            parsed.append((timestamp, purehw_parsed))
-        return parsed
+        return self._map_sections(r'purehw list --all', hardware_utils.parse_purehw_list)
 
     def get_purenetwork_list_all(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purenetwork list --all'."""
         return self._pull_from('purenetwork list --all')
 
     def get_purepgroup_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purepgroup list'."""
         return self._pull_from('purepgroup list')
 
     def get_purepgroup_list_retention(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purepgroup list --retention'."""
         return self._pull_from('purepgroup list --retention')
 
     def get_purepgroup_list_schedule(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purepgroup list --schedule'."""
         return self._pull_from('purepgroup list --schedule')
 
     def get_purepgroup_list_snap_space_total(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purepgroup list --snap --space --total'."""
         return self._pull_from(r'purepgroup list --snap --space --total', convert_to_raw=['Snapshots'])
 
     def get_purepgroup_list_snap_transfer(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purepgroup list --snap --transfer'."""
         keys = ['Physical Bytes Written', 'Data Transferred']
         return self._pull_from(r'purepgroup list --snap --transfer', convert_to_raw=keys)
 
     def get_purepgroup_list_space_total(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purepgroup list --space --total'."""
         return self._pull_from(r'purepgroup list --space --total', convert_to_raw=['Snapshots'])
 
     def get_pureport_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'pureport list'."""
         return self._pull_from(r'pureport list')
 
     def get_pureport_list_initiator(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'pureport list --initiator'."""
         return self._pull_from(r'pureport list --initiator')
 
     def get_puresnmp_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puresnmp list'."""
         return self._pull_from(r'puresnmp list')
 
     def get_puresubnet_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'puresubnet list'."""
         return self._pull_from(r'puresubnet list')
 
     def get_purevol_list(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purevol list'."""
         return self._pull_from(r'purevol list', convert_to_raw=['Size'])
 
     def get_purevol_list_connect(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purevol list --connect'."""
         return self._pull_from(r'purevol list --connect', convert_to_raw=['Size'])
 
     def get_purevol_list_snap(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purevol list --snap'."""
         return self._pull_from(r'purevol list --snap', convert_to_raw=['Size'])
 
     def get_purevol_list_space_total(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the contents of 'purevol list --space --total'."""
         keys = ['System', 'Volume', 'Total', 'Shared Space', 'Snapshots', 'Size']
         return self._pull_from(r'purevol list --space --total', convert_to_raw=keys)
 
     def get_purity_version(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the purity_version per timestamp."""
         return self._pull_from('purearray list', ['Version'])
 
     def get_shared_space(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array shared_space per timestamp."""
         return self._pull_from('purearray list --space', ['Shared Space'], convert_to_raw=['Shared Space'])
 
     def get_snapshot_space(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array snapshot_space per timestamp."""
         return self._pull_from('purearray list --space', ['Snapshots'], convert_to_raw=['Snapshots'])
 
@@ -656,12 +731,12 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         return all_ssd_capacity
 
     def get_system_space(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array system_space per timestamp."""
         return self._pull_from('purearray list --space', ['System'], convert_to_raw=['System'])
 
     def get_thin_provisioning(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array thin_provisioning per timestamp."""
         return self._pull_from('purearray list --space', ['Thin Provisioning'])
 
@@ -669,7 +744,7 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         # type: () -> List[Tuple[Any, Any]]
         """Get the array timezone."""
         parsed = []
-        sections = self.diagnostics_sections.get(r'cat /etc/timezone')
+        sections = self._get_section(r'cat /etc/timezone')
         for timestamp, section in sections:
             timezone = None
             for line in section:
@@ -679,25 +754,39 @@ class DiagnosticsParser(parser_utils.ParallelLogParser):
         return parsed
 
     def get_total_reduction(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array total_reduction per timestamp."""
         return self._pull_from('purearray list --space', ['Total Reduction'])
 
     def get_tunables(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the tunables currently set on this controller."""
-        pureadm = self.diagnostics_sections.get('pureadm list-tunable')
-        parsed = []
-        for timestamp, lines in pureadm:
-            parsed.append((timestamp, _parse_tunable_lines(lines)))
-        return parsed
+        return self._map_sections('pureadm list-tunable', _parse_tunable_lines)
 
     def get_volume_space(self):
-        # type: () -> List[Tuple[Any, Any]]
+        # type: () -> parser_utils.RunLengthValues
         """Get the array volume_space per timestamp."""
         return self._pull_from('purearray list --space', ['Volumes'], convert_to_raw=['Volumes'])
 
 
+def _pull_keys(table, keys, convert_to_raw=None):
+    # type: (Dict[str, Any], List[str], Optional[List[str]]) -> Any
+    """Pull keys from a parsed table; a single key gives its value, rather than a dictionary."""
+    parsed_values = {}
+    for key in keys:
+        value = table.get(key)
+        if value and convert_to_raw and key in convert_to_raw:
+            if isinstance(value, list):
+                value = [int(format_utils.to_raw(val)) if val != '-' else 0 for val in value]
+            else:
+                value = int(format_utils.to_raw(value)) if value != '-' else 0
+        parsed_values[key] = value
+    # If the length of the parsed values is 1 key; then we don't need to nest this in a dictionary.
+    if len(parsed_values) == 1:
+        return parsed_values[keys[0]]
+    return parsed_values
+
+
 def _parse_ethtool_lines(lines):
     # type: (List[str]) -> Dict[str, Any]
     """Parse lines from ethtool."""
@@ -762,6 +851,21 @@ def _parse_tunable_lines(lines):
     return parsed
 
 
+def _filter_section_lines(lines):
+    # type: (List[str]) -> List[str]
+    """Get the lines of a section's command output; up until the section break and without header breaks."""
+    section_break = '*' * 72
+    header_break = '-' * 72
+    filtered_lines = []
+    for line in lines:
+        # Stop adding lines when the section break is seen
+        if line.startswith(section_break):
+            break
+        elif not line.startswith(header_break):
+            filtered_lines.append(line)
+    return filtered_lines
+
+
 def _filter_stripped(lines):
     # type: (List[str]) -> List[str]
     """Filter out lines for '\n' and '' and section separators."""
@@ -784,47 +888,14 @@ def _parse_table_lines(lines, headers=None):
     """
     table = collections.defaultdict(list)
     # Assumption: All sections are delimited by 2 or more spaces.
-    split_lines = [re.split(r'\s{2,}', line.strip()) for line in lines if line.strip()]
-    if not split_lines:
-        return dict(table)
-    headers = headers or split_lines[0]
-    # If the header was given, and not from line 0, we can't know its line location(s).
-    # Create a mapping of where each header begins within the headers line:
-    header_line = lines[0]
-    header_loc = {header: header_line.find(header) for header in headers}
-
-    # Now process each line by checking what data exists at that starting point; when the number of data points does
-    # not match the number of headers.  Assumption: We won't accidentally have the same number in the wrong positions...
-    for line_index, line in enumerate(split_lines[1:]):
-        if len(line) != len(headers):
-            text_line = lines[line_index + 1]
-            # We need to slice this line according to the header locations:
-            line = _slicer(text_line, sorted(header_loc.values()))
-        for index, value in enumerate(line):
-            if not value:
-                continue
-            table[headers[index]].append(value)
+    names, columns = table_utils.split_table(lines, headers)
+    for header, values in zip(names, columns):
+        # Blank cells are shown as '-', like Purity does for values which are not set.
+        if values:
+            table[header].extend(value or '-' for value in values)
 
     # Flatten scalar values.
     for key, value in iteritems(table):
         if len(value) == 1:
             table[key] = value[0]
     return dict(table)
-
-
-def _slicer(text, slices):
-    # type: (str, List[Any]) -> List[str]
-    """Slice up a string into multiple pieces defined by a list of indexes."""
-    # Note it slices from 0 -> 1, from 1 -> 2, and so on.  The last one gets from itself to the end.
-    pieces = []
-    for index, slice_value in enumerate(slices):
-        if index < len(slices) - 1:
-            next_slice = slices[index + 1]
-            piece = text[slice_value:next_slice]
-        else:
-            piece = text[slice_value:]
-        value = piece.strip()
-        if not value and piece != '\n':
-            value = '-'
-        pieces.append(value)
-    return pieces
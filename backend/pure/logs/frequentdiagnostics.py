@@ -1,6 +1,8 @@
 """Contains parser definitions on how to extract data from the frequentdiagnostics log."""
 
+import functools
 import logging
+import operator
 
 from collections import defaultdict
 
@@ -18,6 +20,8 @@ import ujson
 try:
     from typing import Any
     from typing import Dict
+    from typing import Iterable
+    from typing import Iterator
     from typing import List
     from typing import Optional
     from typing import Tuple
@@ -25,12 +29,83 @@ except ImportError:
     pass
 
 from photon.lib import parser_utils
-from photon.lib import dict_utils
 from photon.lib import format_utils
 from photon.lib import time_utils
 
 LOGGER = logging.getLogger(__name__)
 # pylint: disable=too-few-public-methods, too-many-public-methods, invalid-name, line-too-long
+# The key path to each value within the flattened fdiags; by the name which _pull_value uses for it.
+FDIAG_PATHS = {
+    'actual_system_space': ('puredb.dump.health', 'space.actual_system_space', 'value'),
+    'array_name': ('controller.info', 'array_name'),
+    'array_space': ('purearray.list.space',),
+    'cap_for_hidden': ('puredb.dump.health', 'space.cap_for_hidden', 'value'),
+    'capacity': ('purearray.list.space', 'capacity'),
+    'controller_model_local': ('controller.info', 'controller_model'),
+    'controller_num': ('controller.info', 'controller_name'),
+    'controller_serial': ('controller.info', 'controller_sn'),
+    'controllers': ('purearray.list.controller',),
+    'copyout_error_extents': ('puredb.dump.health', 'space.copyout_error_extents', 'value'),
+    'data_reduction': ('purearray.list.space', 'data_reduction'),
+    'domain_name': ('controller.info', 'sender_domain'),
+    'eradicated_vol_phys': ('puredb.dump.health', 'space.eradicated_vol_phys', 'value'),
+    'fc_array_id': ('controller.info', 'fc_array_id'),
+    'is_primary': ('controller.info', 'is_primary'),
+    'iscsi_array_id': ('controller.info', 'iscsi_array_id'),
+    'live_physical_space': ('puredb.dump.health', 'space.live_physical', 'value'),
+    'local_time': ('controller.info', 'local_time'),
+    'logical_discrepancy': ('puredb.dump.health', 'space.logical_discrepancy', 'value'),
+    'net_array_id': ('controller.info', 'net_array_id'),
+    'network_list': ('purenetwork.list',),
+    'newly_written_space': ('puredb.dump.health', 'space.space_newly_written', 'value'),
+    'pgroup_schedules': ('purepgroup.list.schedule',),
+    'pgroup_snaps': ('purepgroup.list.snap',),
+    'physical_discrepancy': ('puredb.dump.health', 'space.physical_discrepancy', 'value'),
+    'port_list': ('pureport.list',),
+    'purealert_list': ('purealert.list',),
+    'pureapp_list': ('pureapp.list',),
+    'puredb_list_drives': ('puredb.list.drives',),
+    'puredb_list_job': ('puredb.list.job',),
+    'puredrive_list': ('puredrive.list',),
+    'purehw_list': ('purehw.list',),
+    'puremessage_list_audit': ('puremessage_list_audit',),
+    'purepod_list_array': ('purepod.list.array',),
+    'purity_version': ('controller.info', 'version', 'product_version'),
+    'reclaimable_space': ('puredb.dump.health', 'space.reclaimable', 'value'),
+    'reported_pyramid': ('puredb.dump.health', 'space.reported_pyramid', 'value'),
+    'reported_raid': ('puredb.dump.health', 'space.reported_raid', 'value'),
+    'shared_space': ('purearray.list.space', 'shared_space'),
+    'snapshot_space': ('purearray.list.space', 'snapshots'),
+    'ssd_mapped': ('puredb.list.ssd_mapped', 'bytes'),
+    'system_space': ('purearray.list.space', 'system'),
+    'thin_provisioning': ('purearray.list.space', 'thin_provisioning'),
+    'total_reduction': ('purearray.list.space', 'total_reduction'),
+    'triage_error': ('puredb.dump.health', 'space.triage_error', 'value'),
+    'unknown_space': ('puredb.dump.health', 'space.space_summary_unknown', 'value'),
+    'unreachable_extent_phys': ('puredb.dump.health', 'space.unreachable_extent_phys', 'value'),
+    'unreported_pyramid': ('puredb.dump.health', 'space.unreported_pyramid', 'value'),
+    'unreported_raid': ('puredb.dump.health', 'space.unreported_raid', 'value'),
+    'unreported_ratio': ('puredb.dump.health', 'space.unreported_ratio', 'value'),
+    'vector_space': ('puredb.dump.health', 'space.vector_space', 'value'),
+    'visible_system_space': ('puredb.dump.health', 'space.visible_system_space', 'value'),
+    'volume_list': ('purevol.list.space',),
+    'volume_space': ('purearray.list.space', 'volumes'),
+}
+# Fields which are built from other (or more than one) FDIAG_PATHS; all other fields use the path of the same name.
+DERIVED_PATHS = {
+    'array_id': ('net_array_id', 'fc_array_id', 'iscsi_array_id'),
+    'controller_model': ('controllers',),
+    'num_shelves': ('purehw_list',),
+    'pgroup_settings': ('pgroup_schedules',),
+    'physical_space': ('array_space',),
+    'pslun_names': ('volume_list',),
+    'replbond_info': ('network_list',),
+    'san_targets': ('port_list',),
+    'sas_port_info': ('purehw_list',),
+    'serials': ('purehw_list',),
+    'ssd_capacity': ('puredrive_list',),
+    'unreported_space': ('ssd_mapped', 'shared_space', 'snapshot_space', 'volume_space'),
+}
 
 
 class FDiagFormData(parser_utils.FormData):
@@ -118,27 +193,66 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     }
     fields = {field: FDiagLogData(['diagnostics']) for field in _fields}
 
-    def _pull_value(self, dict_map):
-        # type: (List[str]) -> List[Tuple[time_utils.Timestamp, Any]]
-        """Delve into a multi-level fdiags dict to get a particular nested sub-value."""
-        fdiag_values = []
-        for timestamp, fdiags in self.get_field('fdiags'):
-            fdiags_tree = dict_utils.DictTree(fdiags)
-            try:
-                value = fdiags_tree.get_branch_value(dict_map)
-            except KeyError:
-                # The key mapping does not exist within this dict_tree.
-                value = None
-            fdiag_values.append((timestamp, value))
-        return sorted(fdiag_values)
+    def __init__(self, log_file, timeframe=None):
+        # type: (str, Optional[time_utils.Timeframe]) -> None
+        """
+        Arguments:
+            log_file (str): The full path to the log file to parse.
+            timeframe (time_utils.Timeframe): Only read lines within this range of time (if the log type allows it).
+        """
+        super(FDiagnosticsParser, self).__init__(log_file, timeframe)
+        # The time ordered values of each of the FDIAG_PATHS which have been pulled so far.
+        self._path_values = {}  # type: Dict[str, List[Tuple[time_utils.Timestamp, Any]]]
+
+    def _iter_json_blobs(self):
+        # type: () -> Iterator[Tuple[time_utils.Timestamp, Dict[str, Any]]]
+        """Decode the JSON blob of each diagnostics line."""
+        for diag_line in self.get_form_lines('diagnostics'):
+            time_str, contents = diag_line.split(' [monitord:WARNING] Diagnostics: ', 1)
+            yield time_utils.Timestamp(time_str), ujson.loads(contents, precise_float=True)
+
+    def _project(self, path_names):
+        # type: (Iterable[str]) -> None
+        """Pull the values of all of the given FDIAG_PATHS in a single pass; decoding each JSON blob only once.
+
+        Only the sections of each blob which the paths go through are flattened, and the blobs are not kept.
+        """
+        path_names = sorted(set(path_names).difference(self._path_values))
+        if not path_names:
+            return
+        paths = [FDIAG_PATHS[name] for name in path_names]
+        timestamps = []
+        columns = [[] for _ in paths]  # type: List[List[Any]]
+        for timestamp, json_blob in self._iter_json_blobs():
+            timestamps.append(timestamp)
+            flattened = {}  # type: Dict[str, Any]
+            for path, column in zip(paths, columns):
+                column.append(_get_path_value(json_blob, path, flattened))
+        order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+        for name, column in zip(path_names, columns):
+            self._path_values[name] = [(timestamps[index], column[index]) for index in order]
+
+    def _pull_value(self, path_name):
+        # type: (str) -> List[Tuple[time_utils.Timestamp, Any]]
+        """Get the time ordered values of one of the FDIAG_PATHS; None where a blob does not have the path."""
+        if path_name not in self._path_values:
+            # This path was not requested up front (via get_fields), so pull the rest of them in the same pass.
+            self._project(FDIAG_PATHS)
+        return self._path_values[path_name]
+
+    def get_fields(self, fields):
+        # type: (List[str]) -> Dict[str, List[Tuple[time_utils.Timestamp, Any]]]
+        """Get the requested fields; pulling the values of all of their paths in a single pass."""
+        self._project(path_name for field in fields for path_name in _get_field_paths(field))
+        return super(FDiagnosticsParser, self).get_fields(fields)
 
     def get_array_id(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for array_id."""
         results = []
-        net_ids = self._pull_value(['controller.info', 'net_array_id'])
-        fc_ids = self._pull_value(['controller.info', 'fc_array_id'])
-        iscsi_ids = self._pull_value(['controller.info', 'iscsi_array_id'])
+        net_ids = self._pull_value('net_array_id')
+        fc_ids = self._pull_value('fc_array_id')
+        iscsi_ids = self._pull_value('iscsi_array_id')
         # Array ID is composed of: 'net_id-fc_id-iscsi_id'
         for index, value_tuple in enumerate(net_ids):
             timestamp = value_tuple[0]
@@ -155,27 +269,27 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_array_name(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for array_name."""
-        return self._pull_value(['controller.info', 'array_name'])
+        return self._pull_value('array_name')
 
     def get_actual_system_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, int]]
         """Parse all fdiags for actual_system_space space."""
-        return self._pull_value(['puredb.dump.health', 'space.actual_system_space', 'value'])
+        return self._pull_value('actual_system_space')
 
     def get_cap_for_hidden(self):
         # type: () -> List[Tuple[time_utils.Timestamp, int]]
         """Parse all fdiags for cap_for_hidden space."""
-        return self._pull_value(['puredb.dump.health', 'space.cap_for_hidden', 'value'])
+        return self._pull_value('cap_for_hidden')
 
     def get_capacity(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for capacity."""
-        return self._pull_value(['purearray.list.space', 'capacity'])
+        return self._pull_value('capacity')
 
     def get_controller_num(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for ct_num."""
-        return self._pull_value(['controller.info', 'controller_name'])
+        return self._pull_value('controller_num')
 
     def get_controller_model(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
@@ -183,7 +297,7 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
         # Expected output:
         # {'Model': ['FA-420', 'FA-420'], 'Name': ['CT0', 'CT1']}
         ct_model = []
-        for timestamp, ctlr_info in self._pull_value(['purearray.list.controller']):
+        for timestamp, ctlr_info in self._pull_value('controllers'):
             model_dict = {
                 'Model': [],
                 'Name': [],
@@ -214,7 +328,7 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
             'platinum_sas_b huge':   'FA-m70r2',
         }
         ct_model = []
-        for timestamp, model in self._pull_value(['controller.info', 'controller_model']):
+        for timestamp, model in self._pull_value('controller_model_local'):
             if not model:
                 ct_model.append((timestamp, model))
                 continue
@@ -231,12 +345,12 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_controller_serial(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for ct_serial."""
-        return self._pull_value(['controller.info', 'controller_sn'])
+        return self._pull_value('controller_serial')
 
     def get_copyout_error_extents(self):
         # type: () -> List[Tuple[time_utils.Timestamp, str]]
         """Parse all fdiags for copyout_error_extents space."""
-        values = self._pull_value(['puredb.dump.health', 'space.copyout_error_extents', 'value'])
+        values = self._pull_value('copyout_error_extents')
         results = []
         # These are a count so we need a string not an int.
         for timestamp, value in values:
@@ -248,17 +362,17 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_data_reduction(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for data_reduction."""
-        return self._pull_value(['purearray.list.space', 'data_reduction'])
+        return self._pull_value('data_reduction')
 
     def get_domain_name(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for domain_name."""
-        return self._pull_value(['controller.info', 'sender_domain'])
+        return self._pull_value('domain_name')
 
     def get_eradicated_vol_phys(self):
         # type: () -> List[Tuple[time_utils.Timestamp, int]]
         """Parse all fdiags for eradicated_vol_phys space."""
-        return self._pull_value(['puredb.dump.health', 'space.eradicated_vol_phys', 'value'])
+        return self._pull_value('eradicated_vol_phys')
 
     def get_fdiags(self):
         # type: () -> List[Tuple[Any, Dict[str, Any]]]
@@ -272,44 +386,38 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_fdiags_unflattened(self):
         # type: () -> List[Tuple[Any, Dict[str, Any]]]
         """Parse the frequent diagnostics contents."""
-        parsed = []
-        for diag_line in self.get_form_lines('diagnostics'):
-            time_str, contents = diag_line.split(' [monitord:WARNING] Diagnostics: ', 1)
-            timestamp = time_utils.Timestamp(time_str)
-            json_blob = ujson.loads(contents, precise_float=True)
-            parsed.append((timestamp, json_blob))
-        return parsed
+        return list(self._iter_json_blobs())
 
     def get_is_primary(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for is_primary."""
-        return self._pull_value(['controller.info', 'is_primary'])
+        return self._pull_value('is_primary')
 
     def get_live_physical_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for live physical space."""
-        return self._pull_value(['puredb.dump.health', 'space.live_physical', 'value'])
+        return self._pull_value('live_physical_space')
 
     def get_local_time(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for local_time."""
-        return self._pull_value(['controller.info', 'local_time'])
+        return self._pull_value('local_time')
 
     def get_logical_discrepancy(self):
         # type: () -> List[Tuple[time_utils.Timestamp, int]]
         """Parse all fdiags for logical_discrepancy space."""
-        return self._pull_value(['puredb.dump.health', 'space.logical_discrepancy', 'value'])
+        return self._pull_value('logical_discrepancy')
 
     def get_newly_written_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for live physical space."""
-        return self._pull_value(['puredb.dump.health', 'space.space_newly_written', 'value'])
+        return self._pull_value('newly_written_space')
 
     def get_num_shelves(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for num_shelves."""
         hw_parts = []
-        for timestamp, parts in self._pull_value(['purehw.list']):
+        for timestamp, parts in self._pull_value('purehw_list'):
             if not parts:
                 hw_parts.append((timestamp, parts))
                 continue
@@ -321,7 +429,7 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for pgroup_settings."""
         settings = []
-        results = self._pull_value(['purepgroup.list.schedule'])
+        results = self._pull_value('pgroup_schedules')
         for timestamp, pgroups in results:
             if not pgroups:
                 settings.append((timestamp, pgroups))
@@ -335,18 +443,18 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_pgroup_snaps(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for pgroup snapshot information."""
-        return self._pull_value(['purepgroup.list.snap'])
+        return self._pull_value('pgroup_snaps')
 
     def get_physical_discrepancy(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for physical discrepancy space."""
-        return self._pull_value(['puredb.dump.health', 'space.physical_discrepancy', 'value'])
+        return self._pull_value('physical_discrepancy')
 
     def get_physical_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for physical_space."""
         physical_space = []
-        for timestamp, space_info in self._pull_value(['purearray.list.space']):
+        for timestamp, space_info in self._pull_value('array_space'):
             if not space_info:
                 physical_space.append((timestamp, space_info))
                 continue
@@ -361,7 +469,7 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for pslun_names."""
         pslun_names = []
-        for timestamp, purevol in self._pull_value(['purevol.list.space']):
+        for timestamp, purevol in self._pull_value('volume_list'):
             if not purevol:
                 pslun_names.append((timestamp, purevol))
                 continue
@@ -382,58 +490,58 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_purealert_list(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for purealert_list."""
-        return self._pull_value(['purealert.list'])
+        return self._pull_value('purealert_list')
 
     def get_pureapp_list(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for pureapp_list."""
-        return self._pull_value(['pureapp.list'])
+        return self._pull_value('pureapp_list')
 
     def get_puredb_list_drives(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for puredb_list_drives."""
-        return self._pull_value(['puredb.list.drives'])
+        return self._pull_value('puredb_list_drives')
 
     def get_puredb_list_job(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for puredb_list_job."""
-        return self._pull_value(['puredb.list.job'])
+        return self._pull_value('puredb_list_job')
 
     def get_puredrive_list(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for puredrive_list."""
-        return self._pull_value(['puredrive.list'])
+        return self._pull_value('puredrive_list')
 
     def get_purehw_list(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for purehw_list."""
-        return self._pull_value(['purehw.list'])
+        return self._pull_value('purehw_list')
 
     def get_puremessage_list_audit(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for puremessage_list_audit."""
-        return self._pull_value(['puremessage_list_audit'])
+        return self._pull_value('puremessage_list_audit')
 
     def get_purepod_list_array(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for purepod_list_array."""
-        return self._pull_value(['purepod.list.array'])
+        return self._pull_value('purepod_list_array')
 
     def get_purity_version(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for purity_version."""
-        return self._pull_value(['controller.info', 'version', 'product_version'])
+        return self._pull_value('purity_version')
 
     def get_reclaimable_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for reclaimable space."""
-        return self._pull_value(['puredb.dump.health', 'space.reclaimable', 'value'])
+        return self._pull_value('reclaimable_space')
 
     def get_replbond_info(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for replication speed and interfaces."""
         replbond_info = []
-        for timestamp, interfaces in self._pull_value(['purenetwork.list']):
+        for timestamp, interfaces in self._pull_value('network_list'):
             if not interfaces:
                 replbond_info.append((timestamp, interfaces))
                 continue
@@ -462,18 +570,18 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_reported_pyramid(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for reported pyramid space."""
-        return self._pull_value(['puredb.dump.health', 'space.reported_pyramid', 'value'])
+        return self._pull_value('reported_pyramid')
 
     def get_reported_raid(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for reported RAID space."""
-        return self._pull_value(['puredb.dump.health', 'space.reported_raid', 'value'])
+        return self._pull_value('reported_raid')
 
     def get_san_targets(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for san_targets."""
         san_targets = []
-        for timestamp, array_ports in self._pull_value(['pureport.list']):
+        for timestamp, array_ports in self._pull_value('port_list'):
             if not array_ports:
                 san_targets.append((timestamp, array_ports))
                 continue
@@ -496,7 +604,7 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
         """Parse all fdiags for sas_port_info."""
         sas_port_info = []
         sections = ('index', 'slot', 'speed', 'status')
-        for timestamp, purehw in self._pull_value(['purehw.list']):
+        for timestamp, purehw in self._pull_value('purehw_list'):
             if not purehw:
                 sas_port_info.append((timestamp, purehw))
                 continue
@@ -522,7 +630,7 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
         """Parse all fdiags for serials."""
         serials = []
         enclosure_types = ['chassis', 'controller', 'storage_shelf']
-        for timestamp, purehw in self._pull_value(['purehw.list']):
+        for timestamp, purehw in self._pull_value('purehw_list'):
             if not purehw:
                 serials.append((timestamp, purehw))
                 continue
@@ -540,18 +648,18 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_shared_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for shared_space."""
-        return self._pull_value(['purearray.list.space', 'shared_space'])
+        return self._pull_value('shared_space')
 
     def get_snapshot_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for snapshot_space."""
-        return self._pull_value(['purearray.list.space', 'snapshots'])
+        return self._pull_value('snapshot_space')
 
     def get_ssd_capacity(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for ssd_capacity."""
         ssd_capacity = []
-        for timestamp, puredrive in self._pull_value(['puredrive.list']):
+        for timestamp, puredrive in self._pull_value('puredrive_list'):
             if not puredrive:
                 ssd_capacity.append((timestamp, puredrive))
                 continue
@@ -565,37 +673,37 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_ssd_mapped(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for ssd_mapped."""
-        return self._pull_value(['puredb.list.ssd_mapped', 'bytes'])
+        return self._pull_value('ssd_mapped')
 
     def get_system_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for system_space."""
-        return self._pull_value(['purearray.list.space', 'system'])
+        return self._pull_value('system_space')
 
     def get_thin_provisioning(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for thin_provisioning."""
-        return self._pull_value(['purearray.list.space', 'thin_provisioning'])
+        return self._pull_value('thin_provisioning')
 
     def get_total_reduction(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for total_reduction."""
-        return self._pull_value(['purearray.list.space', 'total_reduction'])
+        return self._pull_value('total_reduction')
 
     def get_triage_error(self):
         # type: () -> List[Tuple[time_utils.Timestamp, int]]
         """Parse all fdiags for triage_error space."""
-        return self._pull_value(['puredb.dump.health', 'space.triage_error', 'value'])
+        return self._pull_value('triage_error')
 
     def get_unknown_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for unknown space."""
-        return self._pull_value(['puredb.dump.health', 'space.space_summary_unknown', 'value'])
+        return self._pull_value('unknown_space')
 
     def get_unreachable_extent_phys(self):
         # type: () -> List[Tuple[time_utils.Timestamp, str]]
         """Parse all fdiags for unreachable_extent_phys space."""
-        values = self._pull_value(['puredb.dump.health', 'space.unreachable_extent_phys', 'value'])
+        values = self._pull_value('unreachable_extent_phys')
         results = []
         # These are a count so we need a string not an int.
         for timestamp, value in values:
@@ -607,17 +715,17 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_unreported_pyramid(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for unreported pyramid space."""
-        return self._pull_value(['puredb.dump.health', 'space.unreported_pyramid', 'value'])
+        return self._pull_value('unreported_pyramid')
 
     def get_unreported_raid(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for unreported RAID space."""
-        return self._pull_value(['puredb.dump.health', 'space.unreported_raid', 'value'])
+        return self._pull_value('unreported_raid')
 
     def get_unreported_ratio(self):
         # type: () -> List[Tuple[time_utils.Timestamp, float]]
         """Parse all fdiags for unreported_ratio space."""
-        return self._pull_value(['puredb.dump.health', 'space.unreported_ratio', 'value'])
+        return self._pull_value('unreported_ratio')
 
     def get_unreported_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
@@ -649,17 +757,46 @@ class FDiagnosticsParser(parser_utils.ParallelLogParser):
     def get_visible_system_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, int]]
         """Parse all fdiags for visible_system_space space."""
-        return self._pull_value(['puredb.dump.health', 'space.visible_system_space', 'value'])
+        return self._pull_value('visible_system_space')
 
     def get_volume_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for volume_space."""
-        return self._pull_value(['purearray.list.space', 'volumes'])
+        return self._pull_value('volume_space')
 
     def get_vector_space(self):
         # type: () -> List[Tuple[time_utils.Timestamp, Any]]
         """Parse all fdiags for vector space."""
-        return self._pull_value(['puredb.dump.health', 'space.vector_space', 'value'])
+        return self._pull_value('vector_space')
+
+
+def _get_field_paths(field):
+    # type: (str) -> Tuple[str, ...]
+    """Get the names of the FDIAG_PATHS which a field is built from."""
+    if field in DERIVED_PATHS:
+        return DERIVED_PATHS[field]
+    return (field,) if field in FDIAG_PATHS else ()
+
+
+def _get_path_value(json_blob, path, flattened):
+    # type: (Dict[str, Any], Tuple[str, ...], Dict[str, Any]) -> Any
+    """Get the value at a key path within the flattened JSON blob; or None if the blob does not have it.
+
+    Arguments:
+        json_blob (dict): A decoded (not flattened) JSON blob.
+        path (tuple): The keys for each level of the flattened blob.
+        flattened (dict): The sections of this blob which have been flattened so far; this is updated.
+    """
+    section = path[0]
+    if section not in json_blob:
+        return None
+    if section not in flattened:
+        flattened[section] = _flatten_json_section({section: json_blob[section]})[section]
+    try:
+        return functools.reduce(operator.getitem, path[1:], flattened[section])
+    except KeyError:
+        # The key mapping does not exist within this section.
+        return None
 
 
 def _flatten_json_section(json_blob):
@@ -2,14 +2,20 @@
 
 import collections
 import glob
+import json
 import logging
 import os
+import time
 
 import pandas
 
 from six import iteritems
 
 from photon.backend.pure import DataSource
+from photon.backend.pure import META_COLUMNS
+from photon.backend.pure import apply_field_dtypes
+from photon.backend.pure import get_field_columns
+from photon.backend.pure import is_long_field
 # Due to PURE-123142 we cannot trust the contents of array_info.json
 # from photon.backend.pure.logs import array_info_json
 from photon.backend.pure.logs import bcon
@@ -33,7 +39,9 @@ from photon.backend.pure.logs import syslog
 from photon.lib import config_utils
 from photon.lib import custom_errors
 from photon.lib import file_utils
+from photon.lib import pandas_utils
 from photon.lib import parallel_utils
+from photon.lib import parser_utils
 from photon.lib import print_utils
 from photon.lib import time_utils
 from photon.lib import validation_utils
@@ -75,6 +83,8 @@ LOG_SOURCES = collections.OrderedDict([
     ('syslog', syslog.SyslogParser),
 ])  # type: collections.OrderedDict[str, DataSource]
 SETTINGS = config_utils.get_settings()
+EXPLAIN_COLUMNS = ['log_type', 'new_fields', 'files', 'bytes', 'bytes_per_second', 'lines_per_second', 'measured',
+                   'estimated_seconds', 'granularity', 'meets_granularity']
 
 # TODO: PT-1337 - Handle fields that are only on the Primary.
 
@@ -93,6 +103,13 @@ class Logs(DataSource):
         """
         super(Logs, self).__init__(ident=ident, timeframe=timeframe, controllers=controllers)
         self.field_data = pandas.DataFrame()
+        # Track which ranges of time we have already parsed per (log_file, field):
+        self._parsed = {}  # type: Dict[Tuple[str, str], List[Tuple[Any, Any]]]
+        # The name_filter which the cached values of each long layout field were parsed with:
+        self._name_filters = {}  # type: Dict[str, Any]
+        # The values of each (field, controller) from the newest log file which had any; see get_latest_fields:
+        self._latest = {}  # type: Dict[Tuple[str, str], Optional[pandas.DataFrame]]
+        self.throughput = ParseThroughput()
         self.log_files = self._get_log_files()
         self.log_files_dict = self._get_log_files_dict()
 
@@ -145,15 +162,74 @@ class Logs(DataSource):
         log_files_dict = file_utils.group_logs_by_type(self.log_files)
         return log_files_dict
 
-    def get_source_order(self, fields):
-        # type: (Union[Set[str], List[str]]) -> Union[Set[str], List[str]]
-        """Determine which log types to use to get fields, and a ranked order.
+    def _get_rank(self, log_type, log_fields, fields):
+        # type: (str, Set[str], Set[str]) -> int
+        """Rank a log type with the static weights from settings.ini; this is used to break ties in cost."""
+        rank = 0
+        if len(log_fields) == len(fields):
+            # This log_type can get everything!
+            rank += 10
+        # Increase rank based upon the number of fields it can fetch:
+        rank += len(log_fields)
+        # Reduce rank based upon the complexity of the log type:
+        complexity = SETTINGS['log_complexity'].get(log_type, 5)
+        rank -= complexity
+        # Adjust rank based upon the granularity of the timeframe and log type:
+        granularity = time_utils.Timedelta(SETTINGS['log_granularity'].get(log_type, '1ms'))
+        if granularity == self.timeframe.granularity:
+            # This log type can handle the requested granularity.
+            rank += 2
+        elif granularity < self.timeframe.granularity:
+            # This log type is more granular than requested.
+            rank += 1
+        else:
+            # This log type cannot get us the requested granularity, but keep it as a contingency.
+            rank -= 1
+        return rank
+
+    def _get_source_costs(self, fields):
+        # type: (Set[str]) -> Dict[str, Dict[str, Any]]
+        """Estimate the cost of parsing each log type which can get one or more of the fields."""
+        costs = {}
+        field_map = self.map_fields_to_sources(fields)['logs']
+        for log_type, log_fields in field_map.items():
+            if not log_fields:
+                LOGGER.debug('Log type: "{}" had no fields.'.format(log_type))
+                continue
+            if log_type not in self.log_files_dict:
+                LOGGER.warning('Log type: "{}" had no files.'.format(log_type))
+                continue
+            log_files = [log_file for log_file in self.log_files_dict[log_type]
+                         if file_utils.LogFile(log_file).controller in self.controllers]
+            size = sum(_get_file_size(log_file) for log_file in log_files)
+            throughput, measured = self.throughput.get(log_type)
+            granularity = time_utils.Timedelta(SETTINGS['log_granularity'].get(log_type, '1ms'))
+            costs[log_type] = {
+                'fields': set(log_fields),
+                'files': len(log_files),
+                'bytes': size,
+                'bytes_per_second': throughput,
+                'lines_per_second': self.throughput.get_lines_per_second(log_type),
+                'measured': measured,
+                'estimated_seconds': float(size) / throughput,
+                'granularity': granularity,
+                'meets_granularity': granularity <= self.timeframe.granularity,
+                'rank': self._get_rank(log_type, log_fields, fields),
+            }
+        return costs
+
+    def get_source_plan(self, fields):
+        # type: (Union[Set[str], List[str]]) -> List[Dict[str, Any]]
+        """Plan which log types to use to get fields based upon the estimated cost of parsing each of them.
+
+        The cheapest log type (per field which is not yet planned) that can get the requested granularity is picked
+        first.  Log types which cannot get the requested granularity are kept at the end as a contingency.
 
         Arguments:
             fields (list): One or more fields for which to get applicable log file sources.
 
         Returns:
-            log_order (list): The order in which to use log files.
+            plan (list): A dictionary of cost estimates per log type, in the order in which to use them.
         """
         if not fields:
             msg = 'No fields requested.'
@@ -161,136 +237,242 @@ class Logs(DataSource):
             raise custom_errors.LogParserError(msg)
         else:
             fields = set(fields)
-        log_ranks = {}
-        field_map = self.map_fields_to_sources(fields)['logs']
-        for log_type, log_fields in field_map.items():
-            rank = 0
-            if not log_fields:
-                LOGGER.debug('Log type: "{}" had no fields.'.format(log_type))
-                continue
-            if log_type not in self.log_files_dict:
-                LOGGER.warning('Log type: "{}" had no files.'.format(log_type))
-                continue
-            if len(log_fields) == len(fields):
-                # This log_type can get everything!
-                rank += 10
-            # Increase rank based upon the number of fields it can fetch:
-            rank += len(log_fields)
-            # Reduce rank based upon the complexity of the log type:
-            complexity = SETTINGS['log_complexity'].get(log_type, 5)
-            rank -= complexity
-            # Adjust rank based upon the granularity of the timeframe and log type:
-            granularity = time_utils.Timedelta(SETTINGS['log_granularity'].get(log_type, '1ms'))
-            if granularity == self.timeframe.granularity:
-                # This log type can handle the requested granularity.
-                rank += 2
-            elif granularity < self.timeframe.granularity:
-                # This log type is more granular than requested.
-                rank += 1
-            else:
-                # This log type cannot get us the requested granularity, but keep it as a contingency.
-                rank -= 1
-            log_ranks[log_type] = rank
+        costs = self._get_source_costs(fields)
 
         # Determine if we have a parser for every field.  If not, raise an error.
         for field in fields:
             log_types = FIELD_INDEX[field]['logs']
-            if not any(log_type in log_ranks for log_type in log_types):
+            if not any(log_type in costs for log_type in log_types):
                 msg = 'Failed to fetch "{}".  Could not find any "{}" files.'.format(field, ', '.join(log_types))
                 LOGGER.warning(msg)
 
-        # To prevent ties, we will then sort by key name (log_type) to get a predictable order.
-        log_order = sorted(log_ranks, key=lambda key: (int(log_ranks[key]), key), reverse=True)
-        LOGGER.debug('Log Ranks: {}.'.format(log_ranks))
+        plan = []
+        unplanned = set(fields)
+        # To prevent ties, we will first sort by key name (log_type) to get a predictable order.
+        remaining = sorted(costs, reverse=True)
+        while remaining:
+            def _cost_key(log_type):
+                # type: (str) -> Tuple[bool, bool, float, int]
+                """Prefer the required granularity, then new fields, then the lowest cost per new field."""
+                new_fields = costs[log_type]['fields'] & unplanned
+                cost_per_field = costs[log_type]['estimated_seconds'] / max(len(new_fields), 1)
+                return (not costs[log_type]['meets_granularity'], not new_fields, cost_per_field,
+                        -costs[log_type]['rank'])
+            log_type = min(remaining, key=_cost_key)
+            remaining.remove(log_type)
+            step = collections.OrderedDict([('log_type', log_type)])
+            step['new_fields'] = sorted(costs[log_type]['fields'] & unplanned)
+            step.update((key, costs[log_type][key]) for key in ('files', 'bytes', 'bytes_per_second', 'measured',
+                                                                 'estimated_seconds', 'granularity',
+                                                                 'meets_granularity'))
+            unplanned -= costs[log_type]['fields']
+            plan.append(step)
+        LOGGER.debug('Log Plan: {}.'.format(plan))
+        return plan
+
+    def get_source_order(self, fields):
+        # type: (Union[Set[str], List[str]]) -> Union[Set[str], List[str]]
+        """Determine which log types to use to get fields, and a ranked order.
+
+        Arguments:
+            fields (list): One or more fields for which to get applicable log file sources.
+
+        Returns:
+            log_order (list): The order in which to use log files.
+        """
+        log_order = [step['log_type'] for step in self.get_source_plan(fields)]
         LOGGER.debug('Log Order: {}'.format(', '.join(log_order)))
         return log_order
 
-    def _get_fields_from_parsers(self, needed_fields, controllers):
-        # type: (Set[str], Tuple[str, str]) -> List[pandas.DataFrame]
-        """Get fields from log parsers."""
-        completed_fields = set()
+    def explain(self, fields):
+        # type: (List[str]) -> pandas.DataFrame
+        """Get the planned log types and their cost estimates for the requested fields, without parsing anything.
+
+        Arguments:
+            fields (list): One or more fields to request.
+
+        Returns:
+            A pandas.DataFrame with one row per log type, in the order in which they would be used.
+        """
+        return pandas.DataFrame(self.get_source_plan(fields), columns=EXPLAIN_COLUMNS)
+
+    def _get_file_interval(self, log_file):
+        # type: (str) -> Tuple[time_utils.Timestamp, time_utils.Timestamp]
+        """Get the (start, end) range of time which a log file covers."""
+        log_obj = file_utils.LogFile(log_file)
+        if log_obj.start_time == time_utils.INVALID_TIMESTAMP:
+            # Logs with no log date (i.e. array_info.json) apply to the entire timeframe.
+            return self.timeframe.start, self.timeframe.end
+        elif log_obj.log_type in SETTINGS['filter_exceptions']['daily_logs']:
+            day_start = time_utils.Timestamp(log_obj.start_time.date())
+            return day_start, day_start + time_utils.Timedelta('1d')
+        return log_obj.start_time, log_obj.end_time
+
+    def _get_gaps(self, fields, controllers):
+        # type: (Set[str], Tuple[str, str]) -> Dict[str, Dict[str, List[Tuple[Any, Any]]]]
+        """Get the ranges of time within the timeframe which are not yet covered for each field and controller."""
+        gaps = {}
+        for field in fields:
+            gaps[field] = {controller: self.coverage.get_gaps(field, controller, self.timeframe.start,
+                                                              self.timeframe.end)
+                           for controller in controllers}
+        return gaps
+
+    def _get_outside_windows(self, log_file):
+        # type: (str) -> List[Tuple[time_utils.Timestamp, time_utils.Timestamp]]
+        """Get the ranges of time outside of the current timeframe which a parser will also read from a log file."""
+        if parser_utils.is_monotonic_log(file_utils.LogFile(log_file).log_type):
+            # Parsers skip any lines of these logs which are outside of the timeframe.
+            return []
+        return [(pandas.Timestamp.min, self.timeframe.start), (self.timeframe.end, pandas.Timestamp.max)]
+
+    def _get_fields_from_parsers(self, needed_fields, controllers, gaps, name_filter=None):
+        # type: (Set[str], Tuple[str, str], Dict[str, Dict[str, List[Tuple[Any, Any]]]], Any) -> List[pandas.DataFrame]
+        """Get fields from log parsers; only parse log files which fall within the gaps of each field."""
         frames = []
         field_map = self.map_fields_to_sources(needed_fields).get('logs')
+        min_window = time_utils.Timedelta(SETTINGS['parsers']['min_granularity'])
         # TODO: What if we don't have a field_map for logs?
         for log_type in self.get_source_order(needed_fields):
-            if not needed_fields:
-                # We don't need any fields.
-                break
-            elif log_type not in self.log_files_dict:
+            if log_type not in self.log_files_dict:
                 LOGGER.info('No "%s" files available...skipping this log type.' % log_type)
                 continue
             elif log_type not in field_map:
                 # This log type cannot get us the remaining fields that we need.
                 continue
 
-            # Get fields which relate to this log type; which have not been completed already.
-            applicable_fields = field_map[log_type] - completed_fields
-            if not applicable_fields:
-                continue
-            elif needed_fields == completed_fields:
-                # We have all of the needed fields done.
-                break
-            log_files = sorted(self.log_files_dict[log_type])
-            lf_count = len(log_files)
-            LOGGER.info('Parsing {} {} files.'.format(lf_count, log_type))
-            if SETTINGS['cpu']['serialize'] or lf_count < 2:
-                for log_file in sorted(log_files):
-                    print_utils.status_update('Reading %d fields from %s.' % (len(applicable_fields), log_type))
-                    result = _run_parser(log_type, log_file, applicable_fields)
-                    new_frames, new_completed = _process_results(result, log_file)
-                    frames.extend(new_frames)
-                    completed_fields = completed_fields.union(new_completed)
-                    print_utils.status_update()
-            else:
-                tasks = []
-                task_args = []
-                for log_file in sorted(log_files):
+            # Get the fields for each log file which still have a gap within the time that the file covers, and
+            # the parts of those gaps which we have not already parsed from that file.
+            file_tasks = []
+            for log_file in sorted(self.log_files_dict[log_type]):
+                controller = file_utils.LogFile(log_file).controller
+                if controller not in controllers:
                     # Don't use log files for a controller that we don't want.
-                    if file_utils.LogFile(log_file).controller not in controllers:
+                    continue
+                file_start, file_end = self._get_file_interval(log_file)
+                file_fields = {}  # type: Dict[str, List[Tuple[Any, Any]]]
+                for field in field_map[log_type] & needed_fields:
+                    field_gaps = gaps.get(field, {}).get(controller, [])
+                    # Match filter_logs_by_time, which includes files that only touch the timeframe boundaries.
+                    if not any(gap_start <= file_end and file_start <= gap_end for gap_start, gap_end in field_gaps):
                         continue
-                    else:
-                        tasks.append(_run_parser)
-                        task_args.append([log_type, log_file, applicable_fields])
-                print_utils.status_update('Reading %d fields from %s.' % (len(applicable_fields), log_type))
-                with parallel_utils.ProcessPool(processes=lf_count / SETTINGS['cpu']['max_tasks_per_child']) as pool:
-                    pool.parallelize(tasks, task_args)
-                    for index, result in enumerate(pool.get_results(ordered=True)):
-                        if not result:
-                            continue
-                        # Because the results are ordered, we can assume that the log files order will match.
-                        # We get back a dictionary of fields and a list of tuples of values for each field.
-                        log = log_files[index]
-                        new_frames, new_completed = _process_results(result, log)
-                        frames.extend(new_frames)
-                        completed_fields = completed_fields.union(new_completed)
-                print_utils.status_update()
+                    unparsed = time_utils.subtract_intervals(self.timeframe.start, self.timeframe.end,
+                                                             self._parsed.get((log_file, field), []))
+                    missing = [(start, end) for start, end in time_utils.intersect_intervals(field_gaps, unparsed)
+                               if end - start >= min_window]
+                    if missing:
+                        file_fields[field] = missing
+                if file_fields:
+                    window = (min(missing[0][0] for missing in file_fields.values()),
+                              max(missing[-1][1] for missing in file_fields.values()))
+                    file_tasks.append((log_file, file_fields, window))
+            if not file_tasks:
+                continue
+
+            lf_count = len(file_tasks)
+            LOGGER.info('Parsing {} {} files.'.format(lf_count, log_type))
+            print_utils.status_update('Reading fields from %d %s files.' % (lf_count, log_type))
+            task_args = [[log_type, log_file, set(file_fields), self._get_window_timeframe(window),
+                          name_filter if any(is_long_field(field) for field in file_fields) else None]
+                         for log_file, file_fields, window in file_tasks]
+            start = time.time()
+            counted_results = _run_counted_parsers(task_args)
+            self.throughput.record(log_type, sum(counter.bytes for counter, _ in counted_results),
+                                   sum(counter.lines for counter, _ in counted_results), time.time() - start)
+            frames.extend(self._update_coverage(file_tasks, [result for _, result in counted_results], gaps))
+            print_utils.status_update()
         return frames
 
-    def get_fields(self, fields, controllers=('CT0', 'CT1')):
-        # type: (List[str], Tuple[str, str]) -> pandas.DataFrame
-        """Get the requested fields from one or both controllers."""
+    def _get_window_timeframe(self, window):
+        # type: (Tuple[time_utils.Timestamp, time_utils.Timestamp]) -> time_utils.Timeframe
+        """Get a Timeframe for parsing only part of the current timeframe (i.e. after the end time was extended)."""
+        if window == (self.timeframe.start, self.timeframe.end):
+            return self.timeframe
+        return time_utils.Timeframe(window[0], window[1], granularity=SETTINGS['parsers']['min_granularity'])
+
+    def _update_coverage(self, file_tasks, results, gaps):
+        # type: (List[Tuple[str, Dict[str, List[Tuple[Any, Any]]], Tuple[Any, Any]]], Any, Dict[str, Dict[str, List[Tuple[Any, Any]]]]) -> List[pandas.DataFrame]
+        """Convert parser results to frames and mark the time covered by each file for the fields it had.
+
+        Only the values within the missing ranges of each field are kept; values within time that was covered by
+        another log file (or which were parsed from this file before) are dropped.
+        """
+        frames = []
+        for (log_file, file_fields, _), result in zip(file_tasks, results):
+            previously_parsed = {field: self._parsed.get((log_file, field), []) for field in file_fields}
+            outside_windows = self._get_outside_windows(log_file)
+            for field, missing in iteritems(file_fields):
+                self._parsed[(log_file, field)] = time_utils.merge_intervals(previously_parsed[field] + missing +
+                                                                             outside_windows)
+            if not result:
+                continue
+            # We get back a dictionary of fields and a list of tuples of values for each field.
+            new_frames, new_completed = _process_results(result, log_file)
+            for frame in new_frames:
+                field = [column for column in frame if column not in META_COLUMNS][0]
+                timestamps = time_utils.to_datetime_series(frame['Timestamp'])
+                # Values outside of the timeframe are kept the first time that they are parsed.
+                outside = (timestamps < self.timeframe.start) | (timestamps > self.timeframe.end)
+                keep = ((outside & ~_within_intervals(timestamps, previously_parsed[field])) |
+                        _within_intervals(timestamps, file_fields[field]))
+                frames.append(frame[keep.values])
+            controller = file_utils.LogFile(log_file).controller
+            file_start, file_end = self._get_file_interval(log_file)
+            for field in new_completed:
+                for start, end in time_utils.intersect_intervals([(file_start, file_end)], file_fields[field]):
+                    self.coverage.add(field, controller, start, end)
+                    # Later log types only need the time which this file did not cover.
+                    field_gaps = gaps.get(field, {})
+                    field_gaps[controller] = [gap for gap_start, gap_end in field_gaps.get(controller, [])
+                                              for gap in time_utils.subtract_intervals(gap_start, gap_end,
+                                                                                       [(start, end)])]
+        return frames
+
+    # pylint: disable=too-many-arguments
+    def get_fields(self, fields, controllers=('CT0', 'CT1'), gaps=None, ordered=True, name_filter=None):
+        # type: (List[str], Tuple[str, str], Optional[Dict[str, Dict[str, List[Tuple[Any, Any]]]]], bool, Any) -> pandas.DataFrame
+        """Get the requested fields from one or both controllers.
+
+        Arguments:
+            fields (list/set/tuple): One or more fields to request.
+            controllers (tuple): One or both controllers ('CT0' and/or 'CT1').
+            gaps (dict): Per field and per controller (start, end) intervals to fetch.
+                * By default, this is any time within the timeframe which has not been parsed yet.
+            ordered (bool): Merge the per-file results into time order.
+                * When False, the results are runs of per-file rows which are each in time order.
+            name_filter (str/list/set/tuple): Only get long layout fields (i.e. per_volume_read_latency) for these names.
+                * A str is used as a regular expression to search for within each name.
+                * Otherwise, this is a collection of the exact names to use.
+
+        Returns:
+            stacked (pandas.DataFrame): Per field values, including cached values.
+        """
         frames = []
-        needed_fields = set(fields)
+        self._use_name_filter([field for field in fields if is_long_field(field)], name_filter)
+        if gaps:
+            # Copy the gaps, as we will shrink them while parsing.
+            gaps = {field: dict(field_gaps) for field, field_gaps in iteritems(gaps)}
+        else:
+            gaps = self._get_gaps(set(fields), controllers)
 
         # Read fields from cache:
         for field in fields:
             if field in self.field_data:
                 LOGGER.info('Read "%s" from cache.' % field)
-                # TODO: PT-2017 - Validate cache and determine which files don't have pre-cache.
-                # Otherwise remove the files which have pre-cache, so we don't use them again.
-                frames.append(self.field_data[['Timestamp', field, 'controller', 'source']])
-                needed_fields.remove(field)
+                cached = self.field_data[self.field_data[field].notnull()]
+                frames.append(cached[get_field_columns(field)])
 
-        # If there are fields that were not cached, get them from log parsers:
+        # If there are fields with gaps in the cache, get them from log parsers:
+        needed_fields = set(field for field in fields if any(gaps.get(field, {}).values()))
         if needed_fields:
             # This returns a list of pandas.DataFrame instances.  Instead of pre-merging them, just iterate over them
             # and whenever we have actual values for a field, add that field + metadata to be merged together.
             # This way, we don't merge multiple times and skip empty data sets.
-            for frame in self._get_fields_from_parsers(needed_fields, controllers):
+            for frame in self._get_fields_from_parsers(needed_fields, controllers, gaps, name_filter):
                 for field in needed_fields:
                     if field not in frame or (field in frame and frame[field].empty):
                         continue
-                    sub_frame = frame[['Timestamp', field, 'controller', 'source']]
+                    sub_frame = frame[get_field_columns(field)]
                     frames.append(sub_frame)
                     self.field_data = self.field_data.append(sub_frame)
         # Stack everything together.
@@ -298,24 +480,251 @@ class Logs(DataSource):
             stacked = pandas.DataFrame()
         else:
             stacked = pandas.concat(frames)
-            # Ensure that all timestamps are Timestamp objects:
-            stacked['Timestamp'] = stacked['Timestamp'].apply(lambda ts_str: time_utils.Timestamp(ts_str))
-            # Sort by time and reset the index.
-            stacked.sort_values(by='Timestamp', inplace=True)
-            stacked.reset_index(drop=True, inplace=True)
+            # Use datetime64 Timestamps, categorical source/controller and the dtypes from the field_index.ini:
+            stacked = apply_field_dtypes(stacked)
+            if ordered:
+                # Each file's results are already in time order, so merge them rather than sorting everything.
+                stacked = pandas_utils.merge_sorted_runs(stacked, 'Timestamp')
+            else:
+                stacked.reset_index(drop=True, inplace=True)
         return stacked
 
+    def get_latest_fields(self, fields, controllers=('CT0', 'CT1')):
+        # type: (List[str], Tuple[str, str]) -> pandas.DataFrame
+        """Get the latest values of the requested fields; without parsing every log file within the timeframe.
+
+        Log files are parsed newest-first (a file per controller at a time) and we stop as soon as each field has a
+        value for each controller.  Monotonic logs are parsed for only the latest_window at the end of each file
+        first, which reads just the tail of a plain text file; the rest of the file is only parsed for the fields
+        which that window had no values for.
+
+        Arguments:
+            fields (list/set/tuple): One or more fields to request.
+            controllers (tuple): One or both controllers ('CT0' and/or 'CT1').
+
+        Returns:
+            stacked (pandas.DataFrame): Per field values from the newest log file which had any; so the last value of
+                each field per controller is its latest value.
+        """
+        frames = []
+        gaps = self._get_gaps(set(fields), controllers)
+        missing = set()
+        for field in fields:
+            for controller in controllers:
+                if field in self.field_data and not gaps[field][controller]:
+                    # We have already parsed the entire timeframe for this field.
+                    cached = self.field_data[(self.field_data['controller'] == controller) &
+                                             self.field_data[field].notnull()]
+                    frames.append(cached[get_field_columns(field)])
+                elif (field, controller) not in self._latest:
+                    missing.add((field, controller))
+        if missing:
+            self._get_latest_from_parsers(missing, controllers)
+        for field in fields:
+            for controller in controllers:
+                if self._latest.get((field, controller)) is not None:
+                    frames.append(self._latest[(field, controller)])
+        if not frames:
+            return pandas.DataFrame()
+        stacked = apply_field_dtypes(pandas.concat(frames))
+        return pandas_utils.merge_sorted_runs(stacked, 'Timestamp')
+
+    def _get_latest_from_parsers(self, missing, controllers):
+        # type: (Set[Tuple[str, str]], Tuple[str, str]) -> None
+        """Parse log files newest-first until each missing (field, controller) has values; see get_latest_fields."""
+        needed_fields = set(field for field, _ in missing)
+        field_map = self.map_fields_to_sources(needed_fields).get('logs', {})
+        for log_type in self.get_source_order(needed_fields):
+            if not missing:
+                break
+            elif log_type not in self.log_files_dict or log_type not in field_map:
+                continue
+            newest_files = {controller: [] for controller in controllers}  # type: Dict[str, List[str]]
+            for log_file in sorted(self.log_files_dict[log_type], key=self._get_file_interval, reverse=True):
+                controller = file_utils.LogFile(log_file).controller
+                if controller in newest_files:
+                    newest_files[controller].append(log_file)
+
+            while True:
+                # The next newest file of each controller which still has missing fields of this log type.
+                pending = []
+                for controller in controllers:
+                    if newest_files[controller] and any((field, controller) in missing
+                                                        for field in field_map[log_type]):
+                        log_file = newest_files[controller].pop(0)
+                        pending.append((log_file, controller, self._get_latest_timeframes(log_file)))
+                if not pending:
+                    break
+                for step in range(2):
+                    file_tasks = []
+                    for log_file, controller, timeframes in pending:
+                        file_fields = set(field for field in field_map[log_type] if (field, controller) in missing)
+                        if file_fields and step < len(timeframes):
+                            file_tasks.append((log_file, controller, file_fields, timeframes[step]))
+                    if not file_tasks:
+                        break
+                    LOGGER.info('Parsing {} {} files for the latest values.'.format(len(file_tasks), log_type))
+                    task_args = [[log_type, log_file, file_fields, timeframe]
+                                 for log_file, _, file_fields, timeframe in file_tasks]
+                    for (log_file, controller, _, _), (_, result) in zip(file_tasks, _run_counted_parsers(task_args)):
+                        new_frames, _ = _process_results(result, log_file)
+                        for frame in new_frames:
+                            field = [column for column in frame if column not in META_COLUMNS][0]
+                            self._latest[(field, controller)] = frame
+                            missing.discard((field, controller))
+        for key in missing:
+            # Don't search for these again; there are no values within the timeframe.
+            self._latest[key] = None
+
+    def _get_latest_timeframes(self, log_file):
+        # type: (str) -> List[time_utils.Timeframe]
+        """Get the Timeframes to parse a log file with for the latest values; the latest_window at its end first."""
+        if not parser_utils.is_monotonic_log(file_utils.LogFile(log_file).log_type):
+            # Parsers read all of these logs regardless of the timeframe.
+            return [self.timeframe]
+        # The time in the name of a log file is only approximate, so the window runs until the end of the timeframe.
+        _, file_end = self._get_file_interval(log_file)
+        window_start = min(file_end, self.timeframe.end) - time_utils.Timedelta(SETTINGS['parsers']['latest_window'])
+        if window_start <= self.timeframe.start:
+            return [self.timeframe]
+        return [self._get_window_timeframe((window_start, self.timeframe.end)),
+                self._get_window_timeframe((self.timeframe.start, window_start))]
+
+    def get_fields_in_gaps(self, fields, gaps, name_filter=None):
+        # type: (List[str], Dict[str, Dict[str, List[Tuple[Any, Any]]]], Any) -> pandas.DataFrame
+        """Get fields for only the ranges of time which are not already covered by another source."""
+        # FlashArray.get_fields puts the results from all sources into time order.
+        return self.get_fields(fields, controllers=self.controllers, gaps=gaps, ordered=False, name_filter=name_filter)
+
+    def _use_name_filter(self, fields, name_filter):
+        # type: (List[str], Any) -> None
+        """Forget the cached values of long layout fields which were parsed with a different name_filter."""
+        for field in fields:
+            if field in self._name_filters and self._name_filters[field] != name_filter:
+                LOGGER.info('Dropping cached "{}" values, as they were parsed with another name filter.'.format(field))
+                if field in self.field_data:
+                    self.field_data = self.field_data[self.field_data[field].isnull()]
+                self._parsed = {key: intervals for key, intervals in iteritems(self._parsed) if key[1] != field}
+                self.coverage.remove(field)
+            self._name_filters[field] = name_filter
+
+    def update_timeframe(self, timeframe):
+        # type: (time_utils.Timeframe) -> None
+        """Use a new timeframe and find any additional log files which apply to it."""
+        if timeframe == self.timeframe:
+            return
+        super(Logs, self).update_timeframe(timeframe)
+        self._latest = {}
+        self.log_files = self._get_log_files()
+        self.log_files_dict = self._get_log_files_dict()
+
+
+class ParseThroughput(object):
+    """Measured parse throughput (bytes and lines per second) per log type; optionally recorded between runs."""
+
+    def __init__(self, throughput_file=None, record=None):
+        # type: (Optional[str], Optional[bool]) -> None
+        """Read previously measured throughput.
+
+        Arguments:
+            throughput_file (str): A JSON file of recorded throughput per log type.
+                * By default, this is the throughput_file from the source_planner settings.
+            record (bool): Read and write the measurements in the throughput_file.
+                * By default, this is record_throughput from the source_planner settings.
+        """
+        self.throughput_file = os.path.expanduser(throughput_file or SETTINGS['source_planner']['throughput_file'])
+        self.record_throughput = SETTINGS['source_planner']['record_throughput'] if record is None else record
+        self.measured = {}  # type: Dict[str, Dict[str, float]]
+        if not self.record_throughput:
+            return
+        try:
+            with open(self.throughput_file) as json_file:
+                self.measured = json.load(json_file)
+        except (IOError, OSError, ValueError):
+            pass
+
+    def get(self, log_type):
+        # type: (str) -> Tuple[float, bool]
+        """Get the throughput (bytes per second) of a log type and whether it was measured (True) or is a default."""
+        if self.measured.get(log_type, {}).get('bytes_per_second'):
+            return float(self.measured[log_type]['bytes_per_second']), True
+        default = SETTINGS['log_throughput'].get(log_type, SETTINGS['source_planner']['default_throughput'])
+        return float(default), False
+
+    def get_lines_per_second(self, log_type):
+        # type: (str) -> Optional[float]
+        """Get how many lines per second of a log type were measured; None if it has not been measured."""
+        return self.measured.get(log_type, {}).get('lines_per_second')
+
+    def record(self, log_type, size, lines, seconds):
+        # type: (str, int, int, float) -> None
+        """Record the throughput of reading size bytes and lines of a log type in the given number of seconds.
+
+        Arguments:
+            log_type (str): The type of log which was parsed.
+            size (int): How many bytes were read; see file_utils.ReadCounter.
+            lines (int): How many lines were read.
+            seconds (float): How long (wall clock time) it took; parsers which ran in parallel are not added up.
+        """
+        if size <= 0 or seconds <= 0:
+            return
+        throughput = {'bytes_per_second': size / float(seconds), 'lines_per_second': lines / float(seconds)}
+        if log_type in self.measured:
+            # Smooth out the measurements, as the load on the host will vary between runs.
+            smoothing = SETTINGS['source_planner']['smoothing']
+            for key, value in throughput.items():
+                previous = self.measured[log_type].get(key, value)
+                throughput[key] = (1 - smoothing) * previous + smoothing * value
+        self.measured[log_type] = throughput
+        if not self.record_throughput:
+            return
+        try:
+            if not os.path.exists(os.path.dirname(self.throughput_file)):
+                os.makedirs(os.path.dirname(self.throughput_file))
+            with open(self.throughput_file, 'w') as json_file:
+                json.dump(self.measured, json_file, indent=4, sort_keys=True)
+        except (IOError, OSError) as error:
+            LOGGER.debug('Failed to record parse throughput in "{}": {}.'.format(self.throughput_file, error))
+
+
+def _get_file_size(log_file):
+    # type: (str) -> int
+    """Get the size of the text of a log file in bytes; files which we cannot access have no size."""
+    try:
+        return file_utils.get_text_size(log_file)
+    except (IOError, OSError):
+        return 0
+
 
 def _process_results(result, log_file):
     # type: (Dict[str, Any], str) -> Tuple[List[pandas.DataFrame], Set[str]]
-    """Process results from a parser and convert to a list of pandas.DataFrames."""
+    """Process results from a parser and convert to a list of pandas.DataFrames.
+
+    Arguments:
+        result (dict): Per field results from a parser.
+        log_file (str): The log file which the results are from.
+
+    Returns:
+        frames (list): A pandas.DataFrame per field.
+        completed_fields (set): The fields which had any values.
+    """
     completed_fields = set()
     frames = []
     for field, field_data in iteritems(result):
-        if not field_data:
+        if isinstance(field_data, parser_utils.RunLengthValues):
+            if not field_data:
+                continue
+            frame = field_data.to_frame(field)
+        elif isinstance(field_data, pandas.DataFrame):
+            # Long layout fields already have one row per timestamp and name.
+            if field_data.empty:
+                continue
+            frame = field_data.rename(columns={'value': field})
+        elif not field_data:
             continue
-        frame = pandas.DataFrame({field: [item[1] for item in field_data],
-                                  'Timestamp': [item[0] for item in field_data]})
+        else:
+            frame = pandas.DataFrame({field: [item[1] for item in field_data],
+                                      'Timestamp': [item[0] for item in field_data]})
         # Set the 'source' equal to the log file's path and name.
         frame['source'] = log_file
         completed_fields.add(field)
@@ -324,13 +733,44 @@ def _process_results(result, log_file):
     return frames, completed_fields
 
 
-def _run_parser(log_type, log_file, fields):
-    # type: (str, str, List[str]) -> Dict[str, Any]
-    """Run a single log parser against a log file for the requested fields."""
+def _run_counted_parser(log_type, log_file, fields, timeframe=None, name_filter=None):
+    # type: (str, str, List[str], Optional[time_utils.Timeframe], Any) -> Tuple[file_utils.ReadCounter, Dict[str, Any]]
+    """Run a single log parser and count the lines and bytes which it read from the log file."""
     parser = LOG_SOURCES.get(log_type)
     if not parser:
         msg = 'No log parser exists for "%s".' % log_type
         raise custom_errors.LogParserError(msg)
     # Instantiate a parser and run get_fields.
-    parser_inst = parser(log_file=log_file)
-    return parser_inst.get_fields(fields)
+    # Only parsers with long layout fields (i.e. StatsParser) accept a name_filter.
+    kwargs = {'name_filter': name_filter} if name_filter is not None else {}
+    parser_inst = parser(log_file=log_file, timeframe=timeframe, **kwargs)
+    result = parser_inst.get_fields(fields)
+    counter = getattr(parser_inst, 'read_counter', None)
+    if counter is None:
+        # This parser reads the log file some other way; so assume that it read all of it.
+        counter = file_utils.ReadCounter()
+        counter.bytes = _get_file_size(log_file)
+    return counter, result
+
+
+def _run_counted_parsers(task_args):
+    # type: (List[List[Any]]) -> List[Tuple[file_utils.ReadCounter, Dict[str, Any]]]
+    """Run _run_counted_parser for each of the task arguments; in parallel unless there is only one task."""
+    if SETTINGS['cpu']['serialize'] or len(task_args) < 2:
+        return [_run_counted_parser(*args) for args in task_args]
+    tasks = [_run_counted_parser] * len(task_args)
+    with parallel_utils.ProcessPool(processes=len(task_args) / SETTINGS['cpu']['max_tasks_per_child']) as pool:
+        pool.parallelize(tasks, task_args)
+        # Because the results are ordered, we can assume that the log files order will match.
+        return list(pool.get_results(ordered=True))
+
+
+def _within_intervals(timestamps, intervals):
+    # type: (pandas.Series, List[Tuple[Any, Any]]) -> pandas.Series
+    """Get a boolean mask of the timestamps which are within any of the (start, end) intervals; which include both
+    their start and end, like FieldCoverage.
+    """
+    within = pandas.Series(False, index=timestamps.index)
+    for start, end in intervals:
+        within |= (timestamps >= start) & (timestamps <= end)
+    return within
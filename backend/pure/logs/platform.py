@@ -14,7 +14,6 @@ except ImportError:
     pass
 
 from photon.lib import parser_utils
-from photon.lib import time_utils
 
 LOGGER = logging.getLogger(__name__)
 TIME_REG = r'(?P<timestamp>\w+\s+\d{1,2}\s+(\d{2}:?){3}\.\d{3})'
@@ -247,15 +246,10 @@ class PlatformParser(parser_utils.ParallelLogParser):
     def _pull_from_line(self, form_name):
         # type: (str) -> List[Tuple[Any, Any]]
         """Get timestamp tuple from lines."""
-        timestamped_results = []
-        results = self.get_form_lines(form_name)
-        for line in results:
-            if not line or isinstance(line, float):
-                # Skip empty and nan values.
-                continue
-            timestamp = time_utils.get_timestamp_from_line(line)
-            timestamped_results.append((timestamp, line))
-        return timestamped_results
+        # Skip empty and nan values.
+        lines = [line for line in self.get_form_lines(form_name) if line and not isinstance(line, float)]
+        table = parser_utils.timestamp_lines(lines, self.log_date)
+        return list(zip(table['Timestamp'].tolist(), table['line'].tolist()))
 
     def get_dev_info(self):
         # type: () -> List[Tuple[Any, Any]]
@@ -3,7 +3,6 @@
 import logging
 
 from photon.lib import parser_utils
-from photon.lib import time_utils
 
 LOGGER = logging.getLogger(__name__)
 
@@ -42,12 +41,7 @@ class RdmaoopsdParser(parser_utils.ParallelLogParser):
     def _pull_from_line(self, form_name):
         # type: (str) -> List[Tuple[Any, Any]]
         """Get timestamp tuple from lines."""
-        timestamped_results = []
-        results = self.get_form_lines(form_name)
-        for line in results:
-            timestamp = time_utils.get_timestamp_from_line(line)
-            timestamped_results.append((timestamp, line))
-        return timestamped_results
+        return self.pull_timestamped_lines(form_name)
 
     def get_zero_line(self):
         return self._pull_from_line('zero_line')
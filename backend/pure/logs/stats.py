@@ -3,10 +3,13 @@
 import collections
 import logging
 
-from six import iteritems
+import numpy
+import pandas
 
+from six import string_types
+
+from photon.lib import custom_errors
 from photon.lib import parser_utils
-from photon.lib import format_utils
 from photon.lib import time_utils
 
 # pylint: disable=unused-import
@@ -20,8 +23,37 @@ except ImportError:
     pass
 
 LOGGER = logging.getLogger(__name__)
-
-# TODO: Make a universal field/parser for all of these so we don't go over the form lines multiple times.
+# Multipliers for each unit; Purity puts everything into base2, even when it only shows a single character.
+BINARY_UNITS = {'': 1., 'B': 1., 'K': 1024., 'KiB': 1024., 'M': 1024. ** 2, 'MiB': 1024. ** 2, 'G': 1024. ** 3,
+                'GiB': 1024. ** 3, 'T': 1024. ** 4, 'TiB': 1024. ** 4, 'P': 1024. ** 5, 'PiB': 1024. ** 5,
+                'E': 1024. ** 6, 'EiB': 1024. ** 6}
+IOPS_UNITS = {'': 1., 'k': 1000., 'm': 1000. ** 2, 'b': 1000. ** 3, 't': 1000. ** 4}
+# A number with an optional unit suffix; i.e. '19.96K' or '-5':
+VALUE_UNIT_REGEX = r'^\s*(?P<number>-?\d+(?:\.\d+)?)\s*(?P<unit>[A-Za-z]*)\s*$'
+# Header column names and their respective table column names:
+STATS_COLUMNS = {
+    'Name': 'name',
+    'Time': 'Timestamp',
+    'B/s (read)': 'read_bw',
+    'B/s (write)': 'write_bw',
+    'op/s (read)': 'read_iops',
+    'op/s (write)': 'write_iops',
+    'us/op (read)': 'read_ms',
+    'SAN us/op (read)': 'read_san_ms',
+    'us/op (write)': 'write_ms',
+    'SAN us/op (write)': 'write_san_ms',
+}
+STATS_HEADERS = (
+    # In some Purity versions there are no SAN latency columns:
+    ('Name', 'Time', 'B/s (read)', 'B/s (write)', 'op/s (read)', 'op/s (write)', 'us/op (read)', 'us/op (write)'),
+    ('Name', 'Time', 'B/s (read)', 'B/s (write)', 'op/s (read)', 'op/s (write)', 'us/op (read)',
+     'SAN us/op (read)', 'us/op (write)', 'SAN us/op (write)'),
+)
+PER_NAME_FIELDS = frozenset('per_{}_{}'.format(kind, metric) for kind in ('host', 'volume') for metric in (
+    'read_bandwidth', 'write_bandwidth', 'read_iops', 'write_iops', 'read_latency', 'write_latency',
+    'read_san_latency', 'write_san_latency'))
+STATS_METRICS = ('read_bw', 'write_bw', 'read_iops', 'write_iops', 'read_ms', 'write_ms', 'read_san_ms',
+                 'write_san_ms')
 
 
 class StatsFormData(parser_utils.FormData):
@@ -83,8 +115,153 @@ class StatsParser(parser_utils.ParallelLogParser):
         'volume_write_latency': StatsLogData(['all_data']),
         'volume_read_san_latency': StatsLogData(['all_data']),
         'volume_write_san_latency': StatsLogData(['all_data']),
+        # Per Host Stats (one row per timestamp and name):
+        'per_host_read_bandwidth': StatsLogData(['all_data']),
+        'per_host_write_bandwidth': StatsLogData(['all_data']),
+        'per_host_read_iops': StatsLogData(['all_data']),
+        'per_host_write_iops': StatsLogData(['all_data']),
+        'per_host_read_latency': StatsLogData(['all_data']),
+        'per_host_write_latency': StatsLogData(['all_data']),
+        'per_host_read_san_latency': StatsLogData(['all_data']),
+        'per_host_write_san_latency': StatsLogData(['all_data']),
+        # Per Volume Stats (one row per timestamp and name):
+        'per_volume_read_bandwidth': StatsLogData(['all_data']),
+        'per_volume_write_bandwidth': StatsLogData(['all_data']),
+        'per_volume_read_iops': StatsLogData(['all_data']),
+        'per_volume_write_iops': StatsLogData(['all_data']),
+        'per_volume_read_latency': StatsLogData(['all_data']),
+        'per_volume_write_latency': StatsLogData(['all_data']),
+        'per_volume_read_san_latency': StatsLogData(['all_data']),
+        'per_volume_write_san_latency': StatsLogData(['all_data']),
     }
     _all_perf_data = None
+    _grouped_lines = None
+    _name_table = None
+    _stats_table = None
+    _total_table = None
+
+    def __init__(self, log_file, timeframe=None, name_filter=None):
+        # type: (str, Optional[time_utils.Timeframe], Any) -> None
+        """
+        Arguments:
+            log_file (str): The full path to the log file to parse.
+            timeframe (time_utils.Timeframe): Only read lines within this range of time (if the log type allows it).
+            name_filter (str/list/set/tuple): Only get per name fields (i.e. per_volume_read_latency) for these names.
+                * A str is used as a regular expression to search for within each name.
+                * Otherwise, this is a collection of the exact names to use.
+        """
+        super(StatsParser, self).__init__(log_file, timeframe)
+        self.name_filter = name_filter
+
+    def _group_lines(self):
+        # type: () -> Tuple[Dict[Tuple[str, ...], List[str]], Dict[Tuple[str, ...], List[int]], Dict[int, str]]
+        """Group the lines of all intervals by their header, so that each group is split and converted at once.
+
+        Returns:
+            lines_by_header (dict): The lines (without the header line) of all intervals which share a header.
+            intervals_by_header (dict): The interval number of each of those lines.
+            empty_intervals (dict): The time of each interval which has no volumes/hosts.
+        """
+        if self._grouped_lines is not None:
+            return self._grouped_lines
+        lines_by_header = collections.defaultdict(list)  # type: Dict[Tuple[str, ...], List[str]]
+        intervals_by_header = collections.defaultdict(list)  # type: Dict[Tuple[str, ...], List[int]]
+        empty_intervals = {}  # type: Dict[int, str]
+        form_lines = self.get_form_lines('all_data')
+        for interval, lines in enumerate(form_lines):
+            if len(lines) == 2:
+                # PT-2276 - This is an array which has no volumes... just the header line and '(total)'.
+                # We can assume that the (total) values are all 0, as there are no volumes to read/write.
+                empty_intervals[interval] = split_stats_line(lines[1])[1]
+                continue
+            header = tuple(split_stats_line(lines[0]))
+            if header not in STATS_HEADERS:
+                msg = 'Unrecognized header columns in stats file.\n{}'.format(header)
+                LOGGER.error(msg)
+                raise ValueError(msg)
+            # Skip the header line (first line).
+            lines_by_header[header].extend(lines[1:])
+            intervals_by_header[header].extend([interval] * (len(lines) - 1))
+        self._grouped_lines = (lines_by_header, intervals_by_header, empty_intervals)
+        return self._grouped_lines
+
+    def _build_table(self, name_filter=None):
+        # type: (Any) -> pandas.DataFrame
+        """Convert all of the intervals into one columnar table of per name stats; optionally only for some names."""
+        lines_by_header, intervals_by_header, _ = self._group_lines()
+        frames = [_lines_to_table(lines_by_header[header], intervals_by_header[header], header, name_filter)
+                  for header in lines_by_header]
+        if frames:
+            return pandas.concat(frames).sort_index(kind='mergesort')
+        return pandas.DataFrame(columns=['Timestamp', 'name'] + list(STATS_METRICS))
+
+    def _build_tables(self):
+        # type: () -> None
+        """Convert all of the intervals into one columnar table of per name stats and one of per interval totals."""
+        table = self._build_table()
+        empty_intervals = self._group_lines()[2]
+        # PURE-123058 - Purity 5.0/5.1 the '(total)' row is always 0.  We skip it and make a total from the others.
+        grouped = table.groupby(level=0)
+        totals = grouped[list(STATS_METRICS)].sum(min_count=1)
+        totals.insert(0, 'Timestamp', grouped['Timestamp'].first())
+        if empty_intervals:
+            empty = pandas.DataFrame(0., index=sorted(empty_intervals), columns=list(STATS_METRICS))
+            times = pandas.Series(empty_intervals).sort_index()
+            empty.insert(0, 'Timestamp', time_utils.to_datetime_series(times.str[:-4]).values)
+            totals = pandas.concat([totals, empty]).sort_index()
+        self._stats_table = table
+        self._total_table = totals
+
+    def get_fields(self, fields):
+        # type: (List[str]) -> Dict[str, Any]
+        """Get the requested fields."""
+        if self.name_filter is not None and any(field not in PER_NAME_FIELDS for field in fields):
+            # The other fields need every name, so build the full table once and filter the per name fields from it.
+            self._build_tables()
+        return super(StatsParser, self).get_fields(fields)
+
+    @property
+    def name_table(self):
+        # type: () -> pandas.DataFrame
+        """Per name (volume or host) statistics for each interval; only for names which match the name_filter.
+
+        Lines of other names are dropped before their values are converted.
+
+        Returns:
+            A pandas.DataFrame indexed by the interval number with 'Timestamp', 'name' and STATS_METRICS columns.
+        """
+        if self._name_table is None:
+            if self.name_filter is None:
+                self._name_table = self.stats_table
+            elif self._stats_table is not None:
+                self._name_table = self._stats_table[_name_mask(self._stats_table['name'], self.name_filter)]
+            else:
+                self._name_table = self._build_table(self.name_filter)
+        return self._name_table
+
+    @property
+    def stats_table(self):
+        # type: () -> pandas.DataFrame
+        """Per name (volume or host) statistics for each interval.
+
+        Returns:
+            A pandas.DataFrame indexed by the interval number with 'Timestamp', 'name' and STATS_METRICS columns.
+        """
+        if self._stats_table is None:
+            self._build_tables()
+        return self._stats_table
+
+    @property
+    def total_table(self):
+        # type: () -> pandas.DataFrame
+        """The (total) statistics of all names for each interval.
+
+        Returns:
+            A pandas.DataFrame indexed by the interval number with 'Timestamp' and STATS_METRICS columns.
+        """
+        if self._total_table is None:
+            self._build_tables()
+        return self._total_table
 
     @property
     def all_perf_data(self):
@@ -93,116 +270,60 @@ class StatsParser(parser_utils.ParallelLogParser):
         if self._all_perf_data:
             return self._all_perf_data
         all_stats = []
-        no_san_header = ('Name', 'Time', 'B/s (read)', 'B/s (write)', 'op/s (read)', 'op/s (write)', 'us/op (read)',
-                         'us/op (write)')
-        san_header = ('Name', 'Time', 'B/s (read)', 'B/s (write)', 'op/s (read)', 'op/s (write)', 'us/op (read)',
-                      'SAN us/op (read)', 'us/op (write)', 'SAN us/op (write)')
-        for lines in self.get_form_lines('all_data'):
-            if len(lines) == 2:
-                # PT-2276 - This is an array which has no volumes... just the header line and '(total)'.
-                # We can assume that the (total) values are all 0, as there are no volumes to read/write.
-                split_line = split_stats_line(lines[1])
-                timestamp = time_utils.Timestamp(split_line[1][:-4])
-                stats = {
-                    '(total)': {'read_bw': 0, 'write_bw': 0, 'read_iops': 0, 'write_iops': 0, 'read_ms': 0,
-                                'write_ms': 0, 'read_san_ms': 0, 'write_san_ms': 0}
-                }
-                all_stats.append((timestamp, stats))
-                continue
-            header = tuple(split_stats_line(lines[0]))
-            timestamp = None
-            stats = {
-                # Adding a placeholder so that we can aggregate all of the values here.
-                '(total)': collections.defaultdict(int)
-            }
-            # Skip the header line (first line).
-            for line in lines[1:]:
-                if '(total)' in line:
-                    # PURE-123058 - Purity 5.0/5.1 the '(total)' row is always 0.
-                    # We skip this and manually create a total below.
-                    continue
-                split_line = split_stats_line(line)
-                if not split_line:
-                    continue
-                elif not timestamp:
-                    # TODO: PT-1875 - Add support for Timezone.
-                    # Exclude the Timezone until this is supported.
-                    # Example: '2018-06-13 12:19:07 PDT'
-                    timestamp = time_utils.Timestamp(split_line[1][:-4])
-                name = split_line[0]
-                stats[name] = {
-                    'read_bw': _to_raw(split_line[2], 'binary_bytes'),
-                    'write_bw': _to_raw(split_line[3], 'binary_bytes'),
-                    'read_iops': _to_raw(split_line[4], 'iops'),
-                    'write_iops': _to_raw(split_line[5], 'iops'),
-                }
-                # In some Purity versions there are no SAN latency columns:
-                if header == no_san_header:
-                    stats[name]['read_ms'] = _ms_latency(split_line[6])
-                    stats[name]['write_ms'] = _ms_latency(split_line[7])
-                    # Add a placeholder:
-                    stats[name]['read_san_ms'] = None
-                    stats[name]['write_san_ms'] = None
-                elif header == san_header:
-                    stats[name]['read_ms'] = _ms_latency(split_line[6])
-                    stats[name]['read_san_ms'] = _ms_latency(split_line[7])
-                    stats[name]['write_ms'] = _ms_latency(split_line[8])
-                    stats[name]['write_san_ms'] = _ms_latency(split_line[9])
-                else:
-                    msg = 'Unrecognized header columns in stats file.\n{}'.format(header)
-                    LOGGER.error(msg)
-                    raise ValueError(msg)
-
-                # Manually add values to the (total):
-                for stat_name, value in iteritems(stats[name]):
-                    # For SAN Latency, we may have None.
-                    if value is None:
-                        stats['(total)'][stat_name] = None
-                    else:
-                        stats['(total)'][stat_name] += value
-
-            # Convert sub defaultdict to a dict for compatibility:
-            stats['(total)'] = dict(stats['(total)'])
-
-            # Append the stats per-timestamp.
-            all_stats.append((timestamp, stats))
+        per_interval = self._per_interval_records(list(STATS_METRICS))
+        for interval, total in zip(self.total_table.index, _to_records(self.total_table, list(STATS_METRICS))):
+            stats = {name: values for name, values in per_interval.get(interval, [])}
+            stats['(total)'] = total
+            all_stats.append((self.total_table['Timestamp'][interval], stats))
         self._all_perf_data = all_stats
         return self._all_perf_data
 
+    def _per_interval_records(self, metrics):
+        # type: (List[str]) -> Dict[int, List[Tuple[str, Dict[str, Any]]]]
+        """Get a list of (name, {metric: value}) for each interval."""
+        table = self.stats_table
+        records = list(zip(table['name'], _to_records(table, metrics)))
+        per_interval = collections.defaultdict(list)  # type: Dict[int, List[Tuple[str, Dict[str, Any]]]]
+        for interval, record in zip(table.index, records):
+            per_interval[interval].append(record)
+        return per_interval
+
     def fetch_total_metric(self, metric):
         # type: (str) -> List[Tuple[Any, Any]]
         """Get per-timestamp of the requested metric for (total)."""
-        total = []
-        for timestamp, stats in self.all_perf_data:
-            total_stats = stats['(total)']
-            total.append((timestamp, total_stats.get(metric, 0)))
-        return total
+        values = self.total_table[metric].astype(object).where(self.total_table[metric].notnull(), None)
+        return list(zip(self.total_table['Timestamp'], values))
 
     def fetch_individual_metric(self, metric):
         # type: (str) -> List[Tuple[Any, Any]]
         """Get per-timestamp of the requested metric for all volumes."""
-        metrics = []
+        table = self.stats_table
+        if metric in ('host_name', 'volume_name'):
+            values = table['name']
+        else:
+            # For each volume/host get the value of each statistic, if there is not a value associated with it
+            # then add a placeholder.  This is true for SAN latency, which may or may not have a value in some
+            # Purity versions.
+            values = table[metric].astype(object).where(table[metric].notnull(), None)
+        per_interval = collections.defaultdict(dict)  # type: Dict[int, Dict[str, Any]]
+        for interval, name, value in zip(table.index, table['name'], values):
+            per_interval[interval][name] = value
         # These are placeholders for totals or when there are no volumes.
-        # We don't care about totals in this context, just the individual components.
-        for timestamp, stats in self.all_perf_data:
-            if metric in ('host_name', 'volume_name'):
-                filtered_stats = {name: name for name in stats if name != '(total)'}
-            else:
-                # For each volume/host get the value of each statistic, if there is not a value associated with it
-                # then add a placeholder.  This is true for SAN latency, which may or may not have a value in some
-                # Purity versions.
-                filtered_stats = {name: stats[name].get(metric, 0) for name in stats if name != '(total)'}
-            metrics.append((timestamp, filtered_stats))
-        return metrics
+        return [(timestamp, per_interval.get(interval, {}))
+                for interval, timestamp in zip(self.total_table.index, self.total_table['Timestamp'])]
+
+    def fetch_name_metric(self, metric):
+        # type: (str) -> pandas.DataFrame
+        """Get one row per timestamp and name of the requested metric; for names which match the name_filter."""
+        table = self.name_table
+        return pandas.DataFrame({'Timestamp': table['Timestamp'].values,
+                                 'name': pandas.Categorical(table['name'].values),
+                                 'value': table[metric].values.astype(float)})
 
     def get_perf_stats(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get per-timestamp of all of the metrics for (total)."""
-        total = []
-        for timestamp, stats in self.all_perf_data:
-            total_stats = stats['(total)']
-            total.append((timestamp, total_stats))
-        return total
+        return list(zip(self.total_table['Timestamp'], _to_records(self.total_table, list(STATS_METRICS))))
 
     def get_read_bandwidth(self):
         # type: () -> List[Tuple[Any, Any]]
@@ -295,6 +416,47 @@ class StatsParser(parser_utils.ParallelLogParser):
         """Get host write SAN latency for each timestamp."""
         return self.fetch_individual_metric('write_san_ms')
 
+    # Per Host Stats (one row per timestamp and host):
+    def get_per_host_read_bandwidth(self):
+        # type: () -> pandas.DataFrame
+        """Get the read bandwidth of each host for each timestamp."""
+        return self.fetch_name_metric('read_bw')
+
+    def get_per_host_write_bandwidth(self):
+        # type: () -> pandas.DataFrame
+        """Get the write bandwidth of each host for each timestamp."""
+        return self.fetch_name_metric('write_bw')
+
+    def get_per_host_read_iops(self):
+        # type: () -> pandas.DataFrame
+        """Get the read iops of each host for each timestamp."""
+        return self.fetch_name_metric('read_iops')
+
+    def get_per_host_write_iops(self):
+        # type: () -> pandas.DataFrame
+        """Get the write iops of each host for each timestamp."""
+        return self.fetch_name_metric('write_iops')
+
+    def get_per_host_read_latency(self):
+        # type: () -> pandas.DataFrame
+        """Get the read latency of each host for each timestamp."""
+        return self.fetch_name_metric('read_ms')
+
+    def get_per_host_read_san_latency(self):
+        # type: () -> pandas.DataFrame
+        """Get the read SAN latency of each host for each timestamp."""
+        return self.fetch_name_metric('read_san_ms')
+
+    def get_per_host_write_latency(self):
+        # type: () -> pandas.DataFrame
+        """Get the write latency of each host for each timestamp."""
+        return self.fetch_name_metric('write_ms')
+
+    def get_per_host_write_san_latency(self):
+        # type: () -> pandas.DataFrame
+        """Get the write SAN latency of each host for each timestamp."""
+        return self.fetch_name_metric('write_san_ms')
+
     # Per Volume Stats:
     def get_volume_name(self):
         # type: () -> List[Tuple[Any, Any]]
@@ -346,24 +508,141 @@ class StatsParser(parser_utils.ParallelLogParser):
         """Get volume write SAN latency for each timestamp."""
         return self.fetch_individual_metric('write_san_ms')
 
-
-def _ms_latency(value):
-    # type: (str) -> int
-    """Convert a latency value to milliseconds."""
-    return round(time_utils.Timedelta.from_microseconds(value).milliseconds, 2)
-
-
-def _to_raw(raw_value, scale):
-    # type: (str, str) -> int
-    """Add expected unit helpers before converting to raw."""
-    if 'byte' in scale and 'B' not in raw_value:
-        # The bytes scales expect 'B' to be present.
-        if scale == 'binary_bytes' and not raw_value[-1].isdigit():
-            raw_value += 'i'
-        raw_value += 'B'
-    elif scale == 'iops':
-        raw_value = raw_value.lower()
-    return format_utils.to_raw(raw_value, scale)
+    # Per Volume Stats (one row per timestamp and volume):
+    def get_per_volume_read_bandwidth(self):
+        # type: () -> pandas.DataFrame
+        """Get the read bandwidth of each volume for each timestamp."""
+        return self.fetch_name_metric('read_bw')
+
+    def get_per_volume_write_bandwidth(self):
+        # type: () -> pandas.DataFrame
+        """Get the write bandwidth of each volume for each timestamp."""
+        return self.fetch_name_metric('write_bw')
+
+    def get_per_volume_read_iops(self):
+        # type: () -> pandas.DataFrame
+        """Get the read iops of each volume for each timestamp."""
+        return self.fetch_name_metric('read_iops')
+
+    def get_per_volume_write_iops(self):
+        # type: () -> pandas.DataFrame
+        """Get the write iops of each volume for each timestamp."""
+        return self.fetch_name_metric('write_iops')
+
+    def get_per_volume_read_latency(self):
+        # type: () -> pandas.DataFrame
+        """Get the read latency of each volume for each timestamp."""
+        return self.fetch_name_metric('read_ms')
+
+    def get_per_volume_read_san_latency(self):
+        # type: () -> pandas.DataFrame
+        """Get the read SAN latency of each volume for each timestamp."""
+        return self.fetch_name_metric('read_san_ms')
+
+    def get_per_volume_write_latency(self):
+        # type: () -> pandas.DataFrame
+        """Get the write latency of each volume for each timestamp."""
+        return self.fetch_name_metric('write_ms')
+
+    def get_per_volume_write_san_latency(self):
+        # type: () -> pandas.DataFrame
+        """Get the write SAN latency of each volume for each timestamp."""
+        return self.fetch_name_metric('write_san_ms')
+
+
+def _lines_to_table(lines, intervals, header, name_filter=None):
+    # type: (List[str], List[int], Tuple[str, ...], Any) -> pandas.DataFrame
+    """Split and convert the lines of intervals which share the same header into a table.
+
+    Arguments:
+        lines (list): The lines of each interval, without the header line.
+        intervals (list): The interval number of each line.
+        header (tuple): The column names from the header line.
+        name_filter (str/list/set/tuple): Only keep lines for these names; see StatsParser.
+
+    Returns:
+        A pandas.DataFrame indexed by the interval number with 'Timestamp', 'name' and STATS_METRICS columns.
+    """
+    raw = pandas.Series(lines, index=intervals).str.strip()
+    raw = raw[(raw != '') & ~raw.str.contains('(total)', regex=False)]
+    # Names have no spaces, so splitting on whitespace gives: name, date, time, timezone and then the values.
+    split = raw.str.split(expand=True)
+    if len(split.columns) == len(header) + 2:
+        split[1] = split[1] + ' ' + split[2] + ' ' + split[3]
+        split = split.drop([2, 3], axis=1)
+        split.columns = range(len(header))
+    else:
+        # Fall back to the column spacing, like split_stats_line.
+        split = raw.str.split(r'\s{2,}', expand=True)
+    if name_filter is not None:
+        # Drop the lines of other names before we spend any time converting their values.
+        split = split[_name_mask(split[0], name_filter)]
+    table = pandas.DataFrame(index=split.index)
+    for position, column in enumerate(header):
+        values = split[position] if position in split else pandas.Series(None, index=split.index)
+        table[STATS_COLUMNS[column]] = values
+    # The timestamp of each interval is the time on its first line.
+    # TODO: PT-1875 - Add support for Timezone.
+    # Exclude the Timezone until this is supported.
+    # Example: '2018-06-13 12:19:07 PDT'
+    first_times = table['Timestamp'].groupby(level=0).first().str[:-4]
+    times = pandas.Series(time_utils.to_datetime_series(first_times).values, index=first_times.index)
+    table['Timestamp'] = times.reindex(table.index).values
+    for metric in ('read_bw', 'write_bw'):
+        table[metric] = _to_raw_column(table[metric], BINARY_UNITS)
+    for metric in ('read_iops', 'write_iops'):
+        table[metric] = _to_raw_column(table[metric].str.lower(), IOPS_UNITS)
+    for metric in ('read_ms', 'write_ms', 'read_san_ms', 'write_san_ms'):
+        if metric in table:
+            table[metric] = _ms_latency_column(table[metric])
+        else:
+            # In some Purity versions there are no SAN latency columns:
+            table[metric] = numpy.nan
+    return table[['Timestamp', 'name'] + list(STATS_METRICS)]
+
+
+def _name_mask(names, name_filter):
+    # type: (pandas.Series, Any) -> pandas.Series
+    """Get a boolean mask of the names which match a name_filter; a regular expression or a collection of names."""
+    if isinstance(name_filter, string_types) or hasattr(name_filter, 'search'):
+        return names.str.contains(name_filter, regex=True).astype(bool)
+    return names.isin(list(name_filter))
+
+
+def _ms_latency_column(values):
+    # type: (pandas.Series) -> pandas.Series
+    """Convert latency values (in microseconds) to milliseconds."""
+    return (pandas.to_numeric(values) / 1000.).round(2)
+
+
+def _to_raw_column(values, units_map):
+    # type: (pandas.Series, Dict[str, float]) -> pandas.Series
+    """Convert values with an optional unit suffix (i.e. '19.96K') to raw values.
+
+    Arguments:
+        values (pandas.Series): String values.
+        units_map (dict): The multiplier for each known unit suffix.
+
+    Returns:
+        A pandas.Series of floats.
+    """
+    if values.empty or values.isnull().all():
+        return pandas.Series(numpy.nan, index=values.index, dtype=float)
+    parts = values.str.extract(VALUE_UNIT_REGEX, expand=True)
+    multipliers = parts['unit'].map(units_map)
+    unknown = values[values.notnull() & multipliers.isnull()]
+    if not unknown.empty:
+        msg = 'Unit in "{}" is not in a known scale.'.format(unknown.iloc[0])
+        LOGGER.error(msg)
+        raise custom_errors.FormatError(msg)
+    return pandas.to_numeric(parts['number']) * multipliers
+
+
+def _to_records(table, metrics):
+    # type: (pandas.DataFrame, List[str]) -> List[Dict[str, Any]]
+    """Convert rows of metrics to dictionaries; with None for missing values (i.e. no SAN latency)."""
+    values = table[metrics].astype(object).where(table[metrics].notnull(), None)
+    return values.to_dict('records')
 
 
 def split_stats_line(line):
@@ -2,6 +2,9 @@
 
 import collections
 import logging
+import re
+
+import pandas
 
 from photon.lib import parser_utils
 from photon.lib import format_utils
@@ -11,6 +14,7 @@ from photon.lib import time_utils
 try:
     from typing import Any
     from typing import Dict
+    from typing import Iterator
     from typing import List
     from typing import Optional
     from typing import Tuple
@@ -190,6 +194,16 @@ class SyslogFormData(parser_utils.FormData):
     )
 
 
+SYSLOG_FORMS = SyslogFormData()
+# The Fibre Channel (qla2xxx) and SCSI target events which are classified together in a single pass over the lines;
+# each event type is the name of its form.
+FC_EVENTS = ('abort_cmd_found', 'els_notify', 'fc_firmware_dump', 'fc_loop_up', 'fc_port_down', 'fc_port_gone',
+             'fc_port_updates', 'fc_qlt_free', 'fc_rscn_changes', 'fc_session_added', 'session_map')
+FC_EVENT_INDEX = ('wwn', 'pci_addr', 'port')
+FC_EVENT_REGEXES = {event: [re.compile(regex) for regex in SYSLOG_FORMS[event].regexes.values()]
+                    for event in FC_EVENTS}
+
+
 class SyslogData(parser_utils.LogData):
     """ Container for syslog data based on parser_utils.LogData."""
     def __init__(self, needed_forms):
@@ -236,6 +250,60 @@ class SyslogParser(parser_utils.ParallelLogParser):
         'req_fail': SyslogData(['req_fail']),
     }
 
+    _fc_event_table = None
+
+    def _iter_fc_events(self):
+        # type: () -> Iterator[Dict[str, Any]]
+        """Pull the fields of each FC event line from the form_lines; a line can be part of more than one event."""
+        form_lines = self.form_lines
+        events = [event for event in FC_EVENTS if event in form_lines]
+        if 'raw_lines' not in form_lines or not events:
+            return
+        matched = form_lines[events].notnull()
+        has_event = matched.any(axis=1).values
+        for line, line_matched in zip(form_lines['raw_lines'].values[has_event], matched.values[has_event]):
+            for event, is_event in zip(events, line_matched):
+                if not is_event:
+                    continue
+                for regex in FC_EVENT_REGEXES[event]:
+                    match = regex.match(line)
+                    if match:
+                        fields = match.groupdict()
+                        fields['event'] = event
+                        yield fields
+                        break
+
+    @property
+    def fc_event_table(self):
+        # type: () -> pandas.DataFrame
+        """All FC events in time order; i.e. to correlate port flaps with aborts.
+
+        Returns:
+            A pandas.DataFrame indexed by FC_EVENT_INDEX ('wwn', 'pci_addr', 'port'; NaN if an event does not have
+            one) with a datetime 'Timestamp', a categorical 'event' (one of FC_EVENTS) and a column per field of
+            the events.
+        """
+        if self._fc_event_table is None:
+            table = pandas.DataFrame.from_records(list(self._iter_fc_events()))
+            for column in FC_EVENT_INDEX + ('timestamp', 'event', 'ctrl'):
+                if column not in table:
+                    table[column] = None
+            table.insert(0, 'Timestamp', self.timestamp_parser.parse_many(table.pop('timestamp').values))
+            for column in ('event', 'ctrl'):
+                table[column] = table[column].astype('category')
+            table = table.sort_values('Timestamp', kind='mergesort')
+            self._fc_event_table = table.set_index(list(FC_EVENT_INDEX))
+        return self._fc_event_table
+
+    def _pull_fc_event(self, event):
+        # type: (str) -> List[Tuple[Any, Any]]
+        """Get the fields of one FC event type from the fc_event_table; the same as pull_from_regex would."""
+        table = self.fc_event_table
+        events = table[(table['event'] == event).values].reset_index()
+        keys = [key for regex in FC_EVENT_REGEXES[event][:1] for key in regex.groupindex if key != 'timestamp']
+        values = events[keys].astype(object).where(events[keys].notnull(), None).to_dict('records')
+        return list(zip(events['Timestamp'], values))
+
     def _pull_from_interval(self, form_name):
         # type: (str) -> List[Tuple[Any, Any]]
         """Get timestamp tuple from interval form."""
@@ -259,7 +327,7 @@ class SyslogParser(parser_utils.ParallelLogParser):
     def get_abort_cmd_found(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for abort_cmd_found."""
-        return self.pull_from_regex('abort_cmd_found')
+        return self._pull_fc_event('abort_cmd_found')
 
     def get_ce_events(self):
         # type: () -> List[Tuple[Any, Any]]
@@ -269,7 +337,7 @@ class SyslogParser(parser_utils.ParallelLogParser):
     def get_els_notify(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for els_notify."""
-        return self.pull_from_regex('els_notify')
+        return self._pull_fc_event('els_notify')
 
     def get_expander(self):
         # type: () -> List[Tuple[Any, Any]]
@@ -279,42 +347,42 @@ class SyslogParser(parser_utils.ParallelLogParser):
     def get_fc_firmware_dump(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for fc_firmware_dump."""
-        return self.pull_from_regex('fc_firmware_dump')
+        return self._pull_fc_event('fc_firmware_dump')
 
     def get_fc_loop_up(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for fc_loop_up."""
-        return self.pull_from_regex('fc_loop_up')
+        return self._pull_fc_event('fc_loop_up')
 
     def get_fc_port_down(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for fc_port_down."""
-        return self.pull_from_regex('fc_port_down')
+        return self._pull_fc_event('fc_port_down')
 
     def get_fc_port_gone(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for fc_port_gone."""
-        return self.pull_from_regex('fc_port_gone')
+        return self._pull_fc_event('fc_port_gone')
 
     def get_fc_port_updates(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for fc_port_updates."""
-        return self.pull_from_regex('fc_port_updates')
+        return self._pull_fc_event('fc_port_updates')
 
     def get_fc_rscn_changes(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for fc_rscn_changes."""
-        return self.pull_from_regex('fc_rscn_changes')
+        return self._pull_fc_event('fc_rscn_changes')
 
     def get_fc_session_added(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for fc_session_added."""
-        return self.pull_from_regex('fc_session_added')
+        return self._pull_fc_event('fc_session_added')
 
     def get_fc_qlt_free(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for fc_qlt_free."""
-        return self.pull_from_regex('fc_qlt_free')
+        return self._pull_fc_event('fc_qlt_free')
 
     def get_gather_hw_logs(self):
         # type: () -> List[Tuple[Any, Any]]
@@ -400,7 +468,7 @@ class SyslogParser(parser_utils.ParallelLogParser):
     def get_session_map(self):
         # type: () -> List[Tuple[Any, Any]]
         """Get form lines for session_map."""
-        return self.pull_from_regex('session_map')
+        return self._pull_fc_event('session_map')
 
     def get_upgrade(self):
         # type: () -> List[Tuple[Any, Any]]
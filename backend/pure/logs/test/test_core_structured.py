@@ -4,11 +4,14 @@ import gzip
 import os
 import unittest
 
+import numpy
 import ujson
 
 from six import itervalues
 
 from photon.backend.pure.logs import core_structured
+from photon.lib import test_utils
+from photon.lib.time_utils import Timestamp
 
 PATH = os.path.dirname(__file__)
 LOG_FILE = os.path.join(PATH, 'test_files/core-structured-test.gz')
@@ -82,3 +85,51 @@ class CoreStructuredParserTestCase(unittest.TestCase):
         expected = EXPECTED_RESULTS['per_bdev_write_iops']
         result = ujson.dumps(sorted(self.parser.get_per_bdev_write_iops())[0])
         self.assertEqual(ujson.loads(result), sorted(expected)[0])
+
+
+class BdevTableTestCase(unittest.TestCase):
+    """Unit tests for the bdev_table."""
+    lines = [
+        'May 10 23:18:43.001 host core[1]: ["per_bdev_stats",{"name":":ssd_a:","stats":{"rd_avg_lat":5,"rd_bytes":1,'
+        '"rd_cnt":1,"wr_avg_lat":2,"wr_bytes":3,"wr_cnt":4}}]',
+        'May 10 23:18:44.500 host core[1]: ["per_bdev_stats",{"name":":ssd_b:","stats":{"rd_avg_lat":7,"rd_bytes":1,'
+        '"rd_cnt":1,"wr_avg_lat":2,"wr_bytes":3,"wr_cnt":4}}]',
+        'May 10 23:18:53.002 host core[1]: ["per_bdev_stats",{"name":":ssd_a:","stats":{"rd_avg_lat":6,"rd_bytes":1,'
+        '"rd_cnt":1,"wr_avg_lat":2,"wr_bytes":3,"wr_cnt":4}}]',
+    ]
+
+    def setUp(self):
+        """Reset testing parameters."""
+        self.parser = test_utils.mock_parser(core_structured.CoreStructuredParser)
+        self.parser._form_data = {'per_bdev_stats': self.lines}
+        self.parser._bdev_table = None
+
+    def test_intervals(self):
+        """Ensure that lines within 10 seconds of the start of an interval are in that interval."""
+        # The mock log file is from 2018_01_01.
+        first, second = Timestamp('2018 May 10 23:18:43.001'), Timestamp('2018 May 10 23:18:53.002')
+        expected = [(first, {'ssd_a': 5, 'ssd_b': 7}), (second, {'ssd_a': 6})]
+        self.assertEqual(self.parser.get_per_bdev_read_latency(), expected)
+
+    def test_matrix(self):
+        """Ensure that a stat is an interval x device matrix."""
+        matrix = self.parser.bdev_matrix('rd_avg_lat')
+        self.assertEqual(list(matrix.columns), ['ssd_a', 'ssd_b'])
+        self.assertEqual(matrix['ssd_a'].tolist(), [5, 6])
+        self.assertTrue(numpy.isnan(matrix['ssd_b'].iloc[1]))
+
+
+class AlignIntervalsTestCase(unittest.TestCase):
+    """Unit tests for _align_intervals."""
+
+    def test_in_order(self):
+        """Each interval starts at the first time which is at least the threshold after the previous start."""
+        times = numpy.array([0, 3, 9, 10, 15, 19, 20, 31], dtype='int64')
+        expected = [0, 0, 0, 10, 10, 10, 20, 31]
+        self.assertEqual(core_structured._align_intervals(times, 10).tolist(), expected)
+
+    def test_out_of_order(self):
+        """Times before the start of the current interval are part of it."""
+        times = numpy.array([10, 3, 19, 22, 12], dtype='int64')
+        expected = [10, 10, 10, 22, 22]
+        self.assertEqual(core_structured._align_intervals(times, 10).tolist(), expected)
@@ -3,9 +3,12 @@
 import os
 import unittest
 
+import pandas
+
 from six import iteritems
 from six import string_types
 
+from photon.lib import config_utils
 from photon.lib import parser_utils
 from photon.backend.pure.logs import diagnostics as diags
 
@@ -143,6 +146,49 @@ class DiagnosticsParserTestCase(unittest.TestCase):
             self.assertTrue(datum in DiagnosticsKnownDataTestCases.expected_results, msg=msg)
 
 
+class SectionIndexTestCase(unittest.TestCase):
+    """Unit tests for the lazy section index of the DiagnosticsParser."""
+    # pylint: disable=protected-access
+    log_file = os.path.join(PATH, 'test_files/diagnostics-test.gz')
+
+    def test_index(self):
+        """Ensure that the index has each command, without reading any of the sections."""
+        parser = diags.DiagnosticsParser(log_file=self.log_file)
+        self.assertIn('purevol list', parser.section_index)
+        self.assertIn('puredrive list --total', parser.section_index)
+        self.assertIsNone(parser._section_lines)
+
+    def test_only_needed_sections(self):
+        """Ensure that only the sections for the requested fields are read and parsed."""
+        parser = diags.DiagnosticsParser(log_file=self.log_file)
+        parser.get_fields(['purevol_list'])
+        self.assertEqual(['purevol list'], list(parser._section_lines))
+        self.assertEqual({'purevol list'}, set(parser._section_digests))
+
+    def test_memoized_tables(self):
+        """Ensure that fields from the same section share a single parsed table."""
+        parser = diags.DiagnosticsParser(log_file=self.log_file)
+        parser.get_fields(['capacity', 'parity'])
+        tables = dict(parser._section_tables)
+        parser.get_field('system_space')
+        self.assertEqual(tables.keys(), parser._section_tables.keys())
+        for key, table in tables.items():
+            self.assertIs(table, parser._section_tables[key])
+
+    def test_shared_sections(self):
+        """Ensure that parsed sections are only shared within a parser; and other parsers get their own values."""
+        first = diags.DiagnosticsParser(log_file=self.log_file).get_fields(['purevol_list', 'tunables'])
+        second = diags.DiagnosticsParser(log_file=self.log_file).get_fields(['purevol_list', 'tunables'])
+        for field in ('purevol_list', 'tunables'):
+            self.assertEqual(first[field], second[field])
+            self.assertIsNot(first[field][0][1], second[field][0][1])
+
+    def test_missing_section(self):
+        """Ensure that a command without sections has no lines."""
+        parser = diags.DiagnosticsParser(log_file=self.log_file)
+        self.assertIsNone(parser._get_section('no such command'))
+
+
 class DiagnosticsKnownDataTestCases(unittest.TestCase):
     """Unit tests for individual known datum in the DiagnosticsParser."""
     expected_results = {
@@ -268,6 +314,17 @@ class DiagnosticsKnownDataTestCases(unittest.TestCase):
             msg = 'The Form Parser "{}" did not get the expected result.  Result was "{}".'.format(getter, value)
             self.assertEqual(self.expected_results[form_parser], value, msg=msg)
 
+    def test_field_dtypes(self):
+        """Ensure that the values of each field fit the dtype which the field_index.ini declares for it."""
+        field_index = config_utils.get_field_index()
+        for form_parser in FORMS:
+            dtype = field_index.get(form_parser, {}).get('dtype')
+            if not dtype:
+                continue
+            values = pandas.Series([value for _, value in getattr(self.parser, 'get_{}'.format(form_parser))()])
+            msg = 'Field "{}" has values which are not "{}".'.format(form_parser, dtype)
+            self.assertEqual(str(values.astype(dtype).dtype), dtype, msg=msg)
+
 
 def _get_length(result):
     """Get the length of the values within the list of tuples."""
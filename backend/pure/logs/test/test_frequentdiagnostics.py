@@ -10,6 +10,8 @@ from six import iteritems
 from photon.lib import parser_utils
 from photon.backend.pure.logs import frequentdiagnostics as freq
 from photon.lib import custom_errors
+from photon.lib import test_utils
+from photon.lib.time_utils import Timestamp
 
 # The test file contains 123 unique timestamps
 EXPECTED_TIMESTAMPS = 123
@@ -73,6 +75,58 @@ class FDiagnosticsParserTestCase(unittest.TestCase):
             self.assertIn(getter.split('_', 1)[1], self.parser.fields, msg=msg)
 
 
+class ProjectionTestCase(unittest.TestCase):
+    """Unit tests for pulling values from the JSON blobs."""
+    lines = [
+        '2017 Dec 18 23:20:16 [monitord:WARNING] Diagnostics: {"controller.info": [{"array_name": "pure2"}], '
+        '"purearray.list.space": [{"volumes": 20, "shared_space": 2, "snapshots": 3, "system": 0}]}',
+        '2017 Dec 18 23:19:46 [monitord:WARNING] Diagnostics: {"controller.info": [{"array_name": "pure1"}]}',
+    ]
+
+    def setUp(self):
+        """Reset testing parameters."""
+        self.parser = test_utils.mock_parser(freq.FDiagnosticsParser)
+        self.parser._form_data = {'diagnostics': self.lines}
+        self.decoded = []
+        iter_json_blobs = self.parser._iter_json_blobs
+
+        def _counted():
+            for blob in iter_json_blobs():
+                self.decoded.append(blob)
+                yield blob
+        self.parser._iter_json_blobs = _counted
+
+    def test_single_pass(self):
+        """Ensure that all of the requested fields are pulled while decoding each blob once."""
+        result = self.parser.get_fields(['array_name', 'volume_space', 'snapshot_space'])
+        self.assertEqual(len(self.decoded), 2)
+        first, second = Timestamp('2017 Dec 18 23:19:46'), Timestamp('2017 Dec 18 23:20:16')
+        self.assertEqual(result['array_name'], [(first, 'pure1'), (second, 'pure2')])
+        # The first blob does not have the purearray.list.space section.
+        self.assertEqual(result['volume_space'], [(first, None), (second, 20)])
+        self.assertEqual(result['snapshot_space'], [(first, None), (second, 3)])
+        self.assertNotIn('fdiags', self.parser.field_data)
+
+    def test_derived_fields(self):
+        """Ensure that fields which are built from other paths are also pulled up front."""
+        self.parser.get_fields(['physical_space', 'array_id'])
+        self.parser.get_field('array_name')
+        # The other paths are pulled together on the first path which was not requested up front.
+        self.assertEqual(len(self.decoded), 4)
+        self.parser.get_field('capacity')
+        self.assertEqual(len(self.decoded), 4)
+
+    def test_field_paths(self):
+        """Ensure that every field other than the fdiags themselves is built from known paths."""
+        for field in self.parser.fields:
+            if field in ('fdiags', 'fdiags_unflattened'):
+                continue
+            paths = freq._get_field_paths(field)
+            self.assertTrue(paths, msg='Field "{}" has no paths.'.format(field))
+            for path_name in paths:
+                self.assertIn(path_name, freq.FDIAG_PATHS)
+
+
 class KnownDataTestCases(unittest.TestCase):
     """Unit tests for all fields in the FDiagnosticsParser."""
 
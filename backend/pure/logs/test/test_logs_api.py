@@ -1,11 +1,20 @@
 """Unit tests for the logs API."""
 
+import gzip
 import os
+import shutil
+import tempfile
 import unittest
 
+import pandas
+
+from photon.backend.pure import FieldCoverage
+from photon.backend.pure import apply_field_dtypes
 from photon.backend.pure.logs import logs_api
 from photon.lib import array_utils
 from photon.lib import custom_errors
+from photon.lib import file_utils
+from photon.lib import parser_utils
 from photon.lib import test_utils
 from photon.lib import time_utils
 
@@ -29,6 +38,8 @@ class GetSourceOrderTestCase(unittest.TestCase):
         self.api.log_files = set()
         self.api.log_files_dict = {}
         self.api.timeframe.granularity = time_utils.Timedelta('1h')
+        # Only use the default throughput from settings.ini:
+        self.api.throughput = logs_api.ParseThroughput(os.path.join(PATH, 'no_such_throughput.json'))
 
     def test_no_fields(self):
         """Test what happens when we request no fields."""
@@ -98,5 +109,295 @@ class GetSourceOrderTestCase(unittest.TestCase):
         self.assertEqual(expected, result)
 
 
+    def test_cheaper_log_type(self):
+        """Test that a cheaper log type is used first, even if it has a lower static rank."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            diagnostics = os.path.join(temp_dir, 'diagnostics.log-2017121100.gz')
+            fdiagnostics = os.path.join(temp_dir, 'frequentdiagnostics.log-2017121100.gz')
+            with gzip.open(diagnostics, 'wb') as log_file:
+                log_file.write(b'0' * 100000)
+            with gzip.open(fdiagnostics, 'wb') as log_file:
+                log_file.write(b'0' * 1000)
+            self.api.log_files_dict = {'diagnostics.log': [diagnostics], 'frequentdiagnostics.log': [fdiagnostics]}
+            result = self.api.get_source_order(fields=['purity_version'])
+            self.assertEqual(['frequentdiagnostics.log', 'diagnostics.log'], result)
+            explained = self.api.explain(fields=['purity_version'])
+            self.assertEqual([1000, 100000], explained['bytes'].tolist())
+            self.assertEqual([['purity_version'], []], explained['new_fields'].tolist())
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class ApplyFieldDtypesTestCase(unittest.TestCase):
+    """Unit tests for the output schema of get_fields."""
+
+    def test_schema(self):
+        """Test that Timestamps, meta columns and typed fields are converted."""
+        frame = pandas.DataFrame({
+            'Timestamp': [time_utils.Timestamp('2017-12-11 00:00:00'), time_utils.Timestamp('2017-12-11 01:00:00')],
+            'controller': ['CT0', 'CT1'],
+            'source': ['path/diagnostics.log-2017121100.gz', 'path/diagnostics.log-2017121100.gz'],
+            'capacity': [1024, None],
+            'pgroup_snap_count': [1, 2],
+            'array_name': ['array', None],
+        })
+        result = apply_field_dtypes(frame)
+        self.assertEqual('datetime64[ns]', str(result['Timestamp'].dtype))
+        self.assertEqual('category', str(result['controller'].dtype))
+        self.assertEqual('category', str(result['source'].dtype))
+        self.assertEqual('float64', str(result['capacity'].dtype))
+        self.assertEqual('int64', str(result['pgroup_snap_count'].dtype))
+        self.assertEqual('object', str(result['array_name'].dtype))
+
+    def test_invalid_values(self):
+        """Test that a field which does not match its dtype is kept as objects."""
+        frame = pandas.DataFrame({'Timestamp': ['2017-12-11 00:00:00'], 'capacity': ['unknown']})
+        self.assertEqual('object', str(apply_field_dtypes(frame)['capacity'].dtype))
+
+
+class ProcessResultsTestCase(unittest.TestCase):
+    """Unit tests for _process_results."""
+    log_file = 'path/vol_stats.log-2017121100.gz'
+
+    def test_long_layout(self):
+        """Test that long layout results keep one row per timestamp and name."""
+        timestamp = time_utils.Timestamp('2017-12-11 00:00:00')
+        result = {'per_volume_read_latency': pandas.DataFrame({'Timestamp': [timestamp, timestamp],
+                                                               'name': ['vol1', 'vol2'],
+                                                               'value': [0.5, 1.5]}),
+                  'read_latency': [(timestamp, 1.)],
+                  'write_latency': []}
+        frames, completed = logs_api._process_results(result, self.log_file)
+        self.assertEqual({'per_volume_read_latency', 'read_latency'}, completed)
+        long_frame = [frame for frame in frames if 'per_volume_read_latency' in frame][0]
+        self.assertEqual(['vol1', 'vol2'], long_frame['name'].tolist())
+        self.assertEqual([0.5, 1.5], long_frame['per_volume_read_latency'].tolist())
+        self.assertEqual(self.log_file, long_frame['source'][0])
+
+    def test_run_length_values(self):
+        """Test that run length encoded values get a row per timestamp."""
+        values = parser_utils.RunLengthValues()
+        for hour in ('00', '01'):
+            values.append(time_utils.Timestamp('2017-12-11 {}:00:00'.format(hour)), {'vol1': 1024}, 'hash1')
+        frames, completed = logs_api._process_results({'purevol_list': values}, self.log_file)
+        self.assertEqual({'purevol_list'}, completed)
+        self.assertEqual([{'vol1': 1024}] * 2, frames[0]['purevol_list'].tolist())
+        self.assertEqual(self.log_file, frames[0]['source'][0])
+
+    def test_empty_long_layout(self):
+        """Test that long layout results without any rows are not completed."""
+        result = {'per_volume_read_latency': pandas.DataFrame(columns=['Timestamp', 'name', 'value'])}
+        self.assertEqual(([], set()), logs_api._process_results(result, self.log_file))
+
+
+class GetLatestFieldsTestCase(unittest.TestCase):
+    """Unit tests for Logs.get_latest_fields."""
+    # Per log file, the array_id values which a parser would find within each parse window:
+    values = {
+        'path/array-ct0/frequentdiagnostics.log-2017121101.gz': [('2017-12-11 01:50:00', 'ct0_newest')],
+        'path/array-ct0/frequentdiagnostics.log-2017121100.gz': [('2017-12-11 00:50:00', 'ct0_older')],
+        'path/array-ct1/frequentdiagnostics.log-2017121101.gz': [('2017-12-11 01:10:00', 'ct1_rest')],
+        'path/array-ct1/frequentdiagnostics.log-2017121100.gz': [('2017-12-11 00:50:00', 'ct1_older')],
+    }
+
+    def setUp(self):
+        """Use the log files from self.values and record which files are parsed."""
+        self.api = logs_api.Logs(ident=IDENT, timeframe=TIMEFRAME)
+        self.api.log_files_dict = {'frequentdiagnostics.log': sorted(self.values)}
+        self.parsed = []
+        self._run_counted_parsers = logs_api._run_counted_parsers
+        logs_api._run_counted_parsers = self._fake_parsers
+
+    def tearDown(self):
+        """Restore the real parsers."""
+        logs_api._run_counted_parsers = self._run_counted_parsers
+
+    def _fake_parsers(self, task_args):
+        """Get the values of each log file which are within the parse window."""
+        results = []
+        for _, log_file, _, timeframe in task_args:
+            self.parsed.append((log_file, str(timeframe.start)))
+            values = [(time_utils.Timestamp(timestamp), value) for timestamp, value in self.values[log_file]
+                      if timeframe.start <= time_utils.Timestamp(timestamp) <= timeframe.end]
+            results.append((file_utils.ReadCounter(), {'array_id': values}))
+        return results
+
+    def test_newest_first(self):
+        """The end of the newest file is parsed first; and older files are not parsed once we have values."""
+        result = self.api.get_latest_fields(['array_id'])
+        self.assertEqual(['ct1_rest', 'ct0_newest'], result['array_id'].tolist())
+        self.assertEqual(['CT1', 'CT0'], result['controller'].tolist())
+        expected = [('path/array-ct0/frequentdiagnostics.log-2017121101.gz', '2017-12-11 01:45:00'),
+                    ('path/array-ct1/frequentdiagnostics.log-2017121101.gz', '2017-12-11 01:45:00'),
+                    ('path/array-ct1/frequentdiagnostics.log-2017121101.gz', '2017-12-11 00:00:00')]
+        self.assertEqual(expected, self.parsed)
+
+    def test_cached(self):
+        """The latest values are only searched for once."""
+        self.api.get_latest_fields(['array_id'], controllers=('CT0',))
+        self.api.get_latest_fields(['array_id'], controllers=('CT0',))
+        self.assertEqual(1, len(self.parsed))
+
+    def test_no_values(self):
+        """Every file is parsed when a controller has no values; which is only done once."""
+        self.values = dict(self.values)
+        self.values['path/array-ct1/frequentdiagnostics.log-2017121100.gz'] = []
+        self.values['path/array-ct1/frequentdiagnostics.log-2017121101.gz'] = []
+        result = self.api.get_latest_fields(['array_id'], controllers=('CT1',))
+        self.assertTrue(result.empty)
+        self.assertEqual(4, len(self.parsed))
+        self.api.get_latest_fields(['array_id'], controllers=('CT1',))
+        self.assertEqual(4, len(self.parsed))
+
+
+class GetFieldsCoverageTestCase(unittest.TestCase):
+    """Unit tests for how Logs.get_fields only parses the time which is not covered yet."""
+    # Per log file, the read_iops values which a parser would find within each parse window:
+    values = {
+        'path/array-ct0/host_stats.log-2017121100.gz': [('2017-12-11 00:10:00', 1.), ('2017-12-11 00:50:00', 2.)],
+        'path/array-ct0/vol_stats.log-2017121100.gz': [('2017-12-11 00:20:00', 10.), ('2017-12-11 00:40:00', 20.)],
+        'path/array-ct0/vol_stats.log-2017121101.gz': [('2017-12-11 01:20:00', 30.), ('2017-12-11 01:40:00', 40.)],
+    }
+
+    def setUp(self):
+        """Use the log files from self.values and record which part of each file is parsed."""
+        self.api = logs_api.Logs(ident=IDENT, timeframe=time_utils.Timeframe('2017-12-11 00:00:00',
+                                                                             '2017-12-11 02:00:00'))
+        self.api.log_files_dict = {}
+        for log_file in self.values:
+            self.api.log_files_dict.setdefault(file_utils.LogFile(log_file).log_type, []).append(log_file)
+        # host_stats.log is the preferred source of read_iops:
+        self.api.get_source_order = lambda fields: ['host_stats.log', 'vol_stats.log']
+        self.parsed = []
+        self._run_counted_parsers = logs_api._run_counted_parsers
+        logs_api._run_counted_parsers = self._fake_parsers
+
+    def tearDown(self):
+        """Restore the real parsers."""
+        logs_api._run_counted_parsers = self._run_counted_parsers
+
+    def _fake_parsers(self, task_args):
+        """Get the values of each log file which are within the parse window."""
+        results = []
+        for _, log_file, _, timeframe, _ in task_args:
+            self.parsed.append((log_file, str(timeframe.start), str(timeframe.end)))
+            values = [(time_utils.Timestamp(timestamp), value) for timestamp, value in self.values[log_file]
+                      if timeframe.start <= time_utils.Timestamp(timestamp) <= timeframe.end]
+            results.append((file_utils.ReadCounter(), {'read_iops': values}))
+        return results
+
+    def test_extended_end(self):
+        """When the end time is extended past what is covered, only the new time is parsed."""
+        self.api.log_files_dict = {'vol_stats.log': sorted(f for f in self.values if 'vol_stats' in f)}
+        self.api.timeframe = time_utils.Timeframe('2017-12-11 00:00:00', '2017-12-11 01:00:00')
+        result = self.api.get_fields(['read_iops'], controllers=('CT0',))
+        self.assertEqual([10., 20.], result['read_iops'].tolist())
+        self.parsed = []
+        self.api.timeframe = time_utils.Timeframe('2017-12-11 00:00:00', '2017-12-11 02:00:00')
+        result = self.api.get_fields(['read_iops'], controllers=('CT0',))
+        self.assertEqual([10., 20., 30., 40.], result['read_iops'].tolist())
+        self.assertTrue(self.parsed)
+        for _, start, end in self.parsed:
+            self.assertEqual(('2017-12-11 01:00:00', '2017-12-11 02:00:00'), (start, end))
+
+    def test_partial_coverage(self):
+        """Time which a preferred source covers is not fetched again from the next source; only the gap is."""
+        result = self.api.get_fields(['read_iops'], controllers=('CT0',))
+        self.assertEqual([1., 2., 30., 40.], result['read_iops'].tolist())
+        expected = ['path/array-ct0/host_stats.log-2017121100.gz'] * 2 + ['path/array-ct0/vol_stats.log-2017121101.gz'] * 2
+        self.assertEqual(expected, result['source'].tolist())
+        vol_stats = [(start, end) for log_file, start, end in self.parsed if 'vol_stats' in log_file]
+        self.assertTrue(vol_stats)
+        for start, end in vol_stats:
+            self.assertEqual(('2017-12-11 01:00:00', '2017-12-11 02:00:00'), (start, end))
+
+
+class IntervalBoundariesTestCase(unittest.TestCase):
+    """Unit tests for the timestamps at the start and end of FieldCoverage intervals and Logs parse windows."""
+
+    def setUp(self):
+        """A value at the start, within, at the end and after an hour."""
+        self.frame = pandas.DataFrame({
+            'Timestamp': pandas.to_datetime(['2017-12-11 00:00:00', '2017-12-11 00:30:00', '2017-12-11 01:00:00',
+                                             '2017-12-11 01:00:01']),
+            'controller': ['CT0'] * 4,
+        })
+        self.start = time_utils.Timestamp('2017-12-11 00:00:00')
+        self.end = time_utils.Timestamp('2017-12-11 01:00:00')
+
+    def test_covered_rows(self):
+        """Values at the start and end of a covered interval are covered."""
+        coverage = FieldCoverage()
+        coverage.add('read_iops', 'CT0', self.start, self.end)
+        self.assertEqual([True, True, True, False], coverage.covered_rows('read_iops', self.frame).tolist())
+        self.assertEqual([False] * 4, coverage.covered_rows('write_iops', self.frame).tolist())
+
+    def test_gaps(self):
+        """A gap shares its endpoints with the covered interval; so the shared endpoint is both covered and within
+        the gap.
+        """
+        coverage = FieldCoverage()
+        coverage.add('read_iops', 'CT0', self.start, self.end)
+        gaps = coverage.get_gaps('read_iops', 'CT0', self.start, time_utils.Timestamp('2017-12-11 02:00:00'))
+        self.assertEqual([(self.end, time_utils.Timestamp('2017-12-11 02:00:00'))], gaps)
+        within = logs_api._within_intervals(self.frame['Timestamp'], gaps)
+        covered = coverage.covered_rows('read_iops', self.frame)
+        self.assertEqual([False, False, True, True], within.tolist())
+        # FlashArray.get_fields only keeps the values from the gap which are not covered yet.
+        self.assertEqual([False, False, False, True], (within & ~covered).tolist())
+
+    def test_within_intervals(self):
+        """Values at the start and end of a parse window are within it; like the covered intervals."""
+        within = logs_api._within_intervals(self.frame['Timestamp'], [(self.start, self.end)])
+        self.assertEqual([True, True, True, False], within.tolist())
+
+
+class ParseThroughputTestCase(unittest.TestCase):
+    """Unit tests for ParseThroughput."""
+
+    def setUp(self):
+        """Use a temporary throughput file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.throughput_file = os.path.join(self.temp_dir, 'log_throughput.json')
+
+    def tearDown(self):
+        """Remove the temporary throughput file."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_default(self):
+        """Test that we use the settings.ini throughput before anything is measured."""
+        throughput = logs_api.ParseThroughput(self.throughput_file)
+        self.assertEqual((8000000., False), throughput.get('diagnostics.log'))
+        self.assertIsNone(throughput.get_lines_per_second('diagnostics.log'))
+
+    def test_record(self):
+        """Test that measurements are smoothed and recorded between runs."""
+        throughput = logs_api.ParseThroughput(self.throughput_file, record=True)
+        throughput.record('diagnostics.log', 1000, 10, 1)
+        self.assertEqual((1000., True), throughput.get('diagnostics.log'))
+        self.assertEqual(10., throughput.get_lines_per_second('diagnostics.log'))
+        throughput.record('diagnostics.log', 2000, 20, 1)
+        smoothing = logs_api.SETTINGS['source_planner']['smoothing']
+        expected = (1 - smoothing) * 1000 + smoothing * 2000
+        recorded = logs_api.ParseThroughput(self.throughput_file, record=True)
+        self.assertEqual((expected, True), recorded.get('diagnostics.log'))
+        self.assertEqual(expected / 100, recorded.get_lines_per_second('diagnostics.log'))
+
+    def test_not_recorded(self):
+        """Test that measurements are only used by the current run, unless recording them is enabled."""
+        throughput = logs_api.ParseThroughput(self.throughput_file, record=False)
+        throughput.record('diagnostics.log', 1000, 10, 1)
+        self.assertEqual((1000., True), throughput.get('diagnostics.log'))
+        self.assertFalse(os.path.exists(self.throughput_file))
+
+    def test_ignore_empty(self):
+        """Test that we don't record a measurement without any bytes or time."""
+        throughput = logs_api.ParseThroughput(self.throughput_file, record=True)
+        throughput.record('diagnostics.log', 0, 0, 1)
+        throughput.record('diagnostics.log', 1000, 10, 0)
+        self.assertFalse(os.path.exists(self.throughput_file))
+
+
 if __name__ == '__main__':
     unittest.main()
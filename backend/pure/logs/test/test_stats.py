@@ -5,8 +5,11 @@ from __future__ import unicode_literals
 import os
 import unittest
 
+import pandas
+
 from six import iteritems
 
+from photon.lib import custom_errors
 from photon.lib import parser_utils
 from photon.backend.pure.logs import stats
 from photon.lib import test_utils
@@ -77,6 +80,10 @@ class AllPerfDataTestCase(unittest.TestCase):
         """Reset testing parameters."""
         self.parser._form_data = {}
         self.parser._all_perf_data = None
+        self.parser._stats_table = None
+        self.parser._total_table = None
+        self.parser._grouped_lines = None
+        self.parser._name_table = None
 
     def test_no_san(self):
         """Test when we have no SAN latency columns."""
@@ -151,6 +158,67 @@ class AllPerfDataTestCase(unittest.TestCase):
             self.parser.get_perf_stats()
 
 
+class PerNameFieldsTestCase(unittest.TestCase):
+    """Unit tests for the long layout (per name) fields."""
+    log_file = os.path.join(PATH, 'test_files/host_stats.log-test.gz')
+
+    def test_layout(self):
+        """Ensure that there is one numeric row per timestamp and name."""
+        result = stats.StatsParser(self.log_file).get_field('per_host_read_latency')
+        self.assertEqual(['Timestamp', 'name', 'value'], list(result.columns))
+        self.assertEqual('category', str(result['name'].dtype))
+        self.assertEqual('float64', str(result['value'].dtype))
+        self.assertFalse(result.duplicated(['Timestamp', 'name']).any())
+
+    def test_name_list(self):
+        """Ensure that only the requested names are returned, with the same values."""
+        everything = stats.StatsParser(self.log_file).get_field('per_host_write_bandwidth')
+        names = everything['name'].unique()[:2].tolist()
+        result = stats.StatsParser(self.log_file, name_filter=names).get_field('per_host_write_bandwidth')
+        expected = everything[everything['name'].isin(names)].reset_index(drop=True)
+        self.assertEqual(sorted(names), sorted(result['name'].unique().tolist()))
+        self.assertEqual(expected['value'].tolist(), result['value'].tolist())
+
+    def test_name_regex(self):
+        """Ensure that a str is used as a regular expression."""
+        everything = stats.StatsParser(self.log_file).get_field('per_host_read_iops')
+        name = everything['name'].iloc[0]
+        result = stats.StatsParser(self.log_file, name_filter='^{}$'.format(name)).get_field('per_host_read_iops')
+        self.assertEqual([name], result['name'].unique().tolist())
+
+    def test_totals_unfiltered(self):
+        """Ensure that the name_filter does not change the totals."""
+        expected = stats.StatsParser(self.log_file).get_field('read_bandwidth')
+        parser = stats.StatsParser(self.log_file, name_filter=['no_such_host'])
+        result = parser.get_fields(['read_bandwidth', 'per_host_read_bandwidth'])
+        self.assertEqual(expected, result['read_bandwidth'])
+        self.assertTrue(result['per_host_read_bandwidth'].empty)
+
+
+class ToRawColumnTestCase(unittest.TestCase):
+    """Unit tests for _to_raw_column."""
+
+    def test_units(self):
+        """Ensure that unit suffixes are converted to raw values."""
+        values = pandas.Series(['19.96K', '-5', '12M', None, '0'])
+        result = stats._to_raw_column(values, stats.BINARY_UNITS)
+        self.assertEqual(result.fillna(-1).tolist(), [20439.04, -5., 12582912., -1, 0.])
+
+    def test_long_units(self):
+        """Ensure that units with more than one character are converted to raw values."""
+        values = pandas.Series(['1.5KiB', '2'])
+        self.assertEqual(stats._to_raw_column(values, stats.BINARY_UNITS).tolist(), [1536., 2.])
+
+    def test_empty(self):
+        """Ensure that an empty column is handled."""
+        self.assertTrue(stats._to_raw_column(pandas.Series([]), stats.IOPS_UNITS).empty)
+
+    def test_unknown_unit(self):
+        """Ensure that an unknown unit raises a FormatError."""
+        with self.assertRaises(custom_errors.FormatError):
+            stats._to_raw_column(pandas.Series(['1Q']), stats.BINARY_UNITS)
+
+
 @unittest.skip('Not implemented.')
 class KnownDataTestCases(unittest.TestCase):
     """Unit tests for all Fields in the StatsParser."""
@@ -202,3 +202,29 @@ class SyslogParserTestCase(unittest.TestCase):
                       'wwn': '20:00:00:25:b5:20:00:7f'})]
         result = self.parser.get_session_map()
         self.assertEqual(expected, result)
+
+
+class FCEventTableTestCase(unittest.TestCase):
+    """Unit tests for the fc_event_table."""
+    parser = syslog.SyslogParser(LOG_FILE)
+
+    def test_layout(self):
+        """Ensure that events are indexed by wwn, pci_addr and port; with typed columns."""
+        table = self.parser.fc_event_table
+        self.assertEqual(list(table.index.names), ['wwn', 'pci_addr', 'port'])
+        self.assertEqual(str(table['Timestamp'].dtype), 'datetime64[ns]')
+        self.assertEqual(str(table['event'].dtype), 'category')
+        self.assertTrue(table['Timestamp'].is_monotonic_increasing)
+
+    def test_events(self):
+        """Ensure that there is a row for each line of each FC event."""
+        table = self.parser.fc_event_table
+        self.assertEqual(set(table['event']), set(syslog.FC_EVENTS))
+        for event in syslog.FC_EVENTS:
+            self.assertEqual(len(getattr(self.parser, 'get_{}'.format(event))()), (table['event'] == event).sum())
+
+    def test_index_values(self):
+        """Ensure that each event's wwn, pci_addr and port are in the index."""
+        table = self.parser.fc_event_table
+        qlt_free = table[table['event'] == 'fc_qlt_free']
+        self.assertEqual(qlt_free.index.tolist(), [('21:00:00:24:ff:59:bd:de', '0000:03:00', '3')])
@@ -24,6 +24,8 @@ except ImportError:
 
 HOME = os.path.expanduser('~')
 LOGGER = logging.getLogger(__name__)
+METRIC_INDEX_PATH = 'report/configuration/metric_index.ini'
+TABLE_INDEX_PATH = 'report/configuration/table_index.ini'
 
 
 def _apply_types(items, static_types=None):
@@ -96,11 +98,22 @@ def get_config(ini_file):
 def get_index(path):
     # type: (str) -> Dict[str, Any]
     """Get the full path to the respective index.ini files."""
+    information_index = get_config(get_index_file(path))  # type: Dict[str, Any]
+    return information_index
+
+
+def get_index_file(path):
+    # type: (str) -> str
+    """Get the full path of an index.ini file; from its path within photon."""
     # From the path of the config_utils.py (__file__), go back one dir and then join to path.
     # We need to use relative paths since we don't know where photon will live.
-    index_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), path)  # type: str
-    information_index = get_config(index_file)  # type: Dict[str, Any]
-    return information_index
+    return os.path.join(os.path.dirname(os.path.dirname(__file__)), path)
+
+
+def get_index_mtime(path):
+    # type: (str) -> float
+    """Get when an index.ini file was last modified; i.e. to tell when something built from it is out of date."""
+    return os.path.getmtime(get_index_file(path))
 
 
 def get_field_index():
@@ -113,8 +126,7 @@ def get_field_index():
 def get_metric_index():
     # type: () -> Dict[str, Any]
     """Get the metric_index.ini file contents for all ReportAPI metrics."""
-    path = 'report/configuration/metric_index.ini'  # type: str
-    return get_index(path)
+    return get_index(METRIC_INDEX_PATH)
 
 
 def get_settings():
@@ -136,8 +148,7 @@ def get_settings():
 def get_table_index():
     # type: () -> Dict[str, Any]
     """Get the table_index.ini file contents for all ReportAPI metrics."""
-    path = 'report/configuration/table_index.ini'  # type: str
-    return get_index(path)
+    return get_index(TABLE_INDEX_PATH)
 
 
 def get_vmware_index():
@@ -7,6 +7,7 @@ import gzip
 import logging
 import os
 import re
+import struct
 import tarfile
 
 # pylint: disable=unused-import
@@ -14,6 +15,7 @@ try:
     from typing import Any
     from typing import Dict
     from typing import Generator
+    from typing import Iterable
     from typing import List
     from typing import Optional
 except ImportError:
@@ -26,6 +28,8 @@ from photon.lib import parallel_utils
 
 LOGGER = logging.getLogger(__name__)
 SETTINGS = config_utils.get_settings()
+# How many bytes to read at a time when reading a file backward from its end; see timeframe_lines_generator.
+TAIL_BLOCK_SIZE = 65536
 
 
 class LogFile(object):
@@ -216,6 +220,36 @@ class LogFile(object):
         return self._log_type
 
 
+class ReadCounter(object):
+    """Count the lines and bytes (of text; after decompression) which are read from log files."""
+
+    def __init__(self):
+        # type: () -> None
+        self.lines = 0
+        self.bytes = 0
+
+    def count(self, lines):
+        # type: (Iterable[str]) -> Generator[str]
+        """Yield each of the lines; counting them as they are read."""
+        for line in lines:
+            self.lines += 1
+            self.bytes += len(line)
+            yield line
+
+
+def get_text_size(filename):
+    # type: (str) -> int
+    """Get the size of the text in a log file in bytes; the same as a ReadCounter would count for the entire file.
+
+    The uncompressed size of a gzip file is in its last 4 bytes (modulo 2 ** 32); so we don't need to read it all.
+    """
+    if os.path.splitext(filename)[1] != '.gz':
+        return os.path.getsize(filename)
+    with open(filename, 'rb') as open_file:
+        open_file.seek(-4, os.SEEK_END)
+        return struct.unpack('<I', open_file.read(4))[0]
+
+
 def file_lines_generator(files, mode='rb'):
     # type: (List[str], str) -> Generator[str]
     """Open a file and yield it's lines.
@@ -251,6 +285,105 @@ def file_lines_generator(files, mode='rb'):
                 continue
 
 
+def timeframe_lines_generator(filename, timeframe, patterns=None, block_size=TAIL_BLOCK_SIZE, out_of_order_lines=None,
+                              counter=None):
+    # type: (str, Any, Optional[List[str]], int, Optional[int], Optional[ReadCounter]) -> Generator[str]
+    """Yield the lines of a log file which are within a timeframe; assumes that the line timestamps are in order.
+
+    Plain text files which begin before the timeframe are read backward from their end, a block at a time, until we
+    are before the start of the timeframe; so a timeframe at the end of a large file only reads the tail of it.
+    Compressed files cannot be read backward (gzip has no index of where each block begins), so they are read
+    forward from the start.
+
+    Arguments:
+        filename (str): A log file to read.
+        timeframe (time_utils.Timeframe): The range of time to keep lines from.
+        patterns (list/set/tuple): Only keep lines which contain one of these; see iter_matching_lines.
+            * This is done before comparing timestamps, as it is much cheaper.
+        block_size (int): How many bytes to read at a time from the end of a plain text file.
+        out_of_order_lines (int): How many timestamped lines in a row outside of the timeframe to stop after.
+            * Defaults to the 'out_of_order_lines' line_filtering setting.
+        counter (ReadCounter): Count each line which is read from the file; before any are filtered out.
+
+    Yields:
+        line (str): A line which is within the timeframe.
+    """
+    if os.path.splitext(filename)[1] == '.gz':
+        lines = file_lines_generator([filename])
+    else:
+        offset = _find_timeframe_offset(filename, timeframe, block_size, out_of_order_lines)
+        lines = _file_lines_from_offset(filename, offset)
+    if counter is not None:
+        lines = counter.count(lines)
+    if patterns:
+        lines = iter_matching_lines(lines, patterns)
+    for line in iter_lines_in_timeframe(lines, timeframe, out_of_order_lines):
+        yield line
+
+
+def _file_lines_from_offset(filename, offset):
+    # type: (str, int) -> Generator[str]
+    """Yield the lines of a plain text file from a byte offset; see file_lines_generator."""
+    LOGGER.debug('Reading file: "{}" from byte {}.'.format(filename, offset))
+    with open(filename, 'rb') as open_file:
+        open_file.seek(offset)
+        for line in open_file:
+            yield codecs.decode(line, 'utf-8', 'ignore')
+
+
+def _find_timeframe_offset(filename, timeframe, block_size, out_of_order_lines=None):
+    # type: (str, Any, int, Optional[int]) -> int
+    """Find the byte offset to read a plain text file from for a timeframe; 0 reads the entire file.
+
+    This is the offset of the earliest line of the last out_of_order_lines timestamped lines in a row which are before
+    the start of the timeframe.  We begin at that line rather than the one after it, so iter_lines_in_timeframe skips
+    any continuation lines which follow it.
+    """
+    start_key = timeframe.line_key_range()[0]
+    max_before_start = out_of_order_lines or SETTINGS['line_filtering']['out_of_order_lines']
+    with open(filename, 'rb') as open_file:
+        for _ in range(max_before_start):
+            first_key = _get_line_key(open_file.readline(), timeframe)
+            if first_key is not None:
+                if first_key >= start_key:
+                    # The file begins within the timeframe; so there is nothing to skip.
+                    return 0
+                break
+        open_file.seek(0, os.SEEK_END)
+        position = open_file.tell()
+        partial = b''
+        before_start = 0
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            open_file.seek(position)
+            lines = (open_file.read(read_size) + partial).split(b'\n')
+            # Unless this block is the start of the file, its first line may begin in the previous block.
+            partial = lines.pop(0) if position else b''
+            offsets = []
+            offset = position + len(partial) + 1 if position else 0
+            for line in lines:
+                offsets.append(offset)
+                offset += len(line) + 1
+            for line, offset in zip(reversed(lines), reversed(offsets)):
+                line_key = _get_line_key(line, timeframe)
+                if line_key is None:
+                    continue
+                elif line_key >= start_key:
+                    before_start = 0
+                    continue
+                before_start += 1
+                if before_start >= max_before_start:
+                    return offset
+    return 0
+
+
+def _get_line_key(line, timeframe):
+    # type: (bytes, Any) -> Optional[str]
+    """Get the time key of a raw line; only the timestamp prefix of the line is needed for it."""
+    return lib.time_utils.get_line_time_key(codecs.decode(line[:64], 'utf-8', 'ignore'), timeframe.start)
+
+
 def group_logs_by_type(logs):
     # type: (List[str]) -> Dict[str, List[str]]
     """Get logs in a directory sorted by type."""
@@ -297,6 +430,41 @@ def iter_file_matching_lines(files, patterns):
         yield line
 
 
+def iter_lines_in_timeframe(lines, timeframe, out_of_order_lines=None):
+    # type: (List[str], Any, Optional[int]) -> str
+    """Yield lines which are within a timeframe; assumes that the line timestamps are (mostly) in order.
+
+    Lines outside of the timeframe are skipped by comparing their timestamp prefixes, and we stop reading entirely
+    once out_of_order_lines timestamped lines in a row are past the end of the timeframe.  Lines without a timestamp
+    (i.e. continuation lines) follow the line which came before them.
+
+    Arguments:
+        lines (list/set/tuple): One or more lines to filter.
+        timeframe (time_utils.Timeframe): The range of time to keep lines from.
+        out_of_order_lines (int): How many timestamped lines in a row past the end of the timeframe to stop after.
+            * Defaults to the 'out_of_order_lines' line_filtering setting.
+
+    Yields:
+        line (str): A line which is within the timeframe.
+    """
+    start_key, end_key = timeframe.line_key_range()
+    max_past_end = out_of_order_lines or SETTINGS['line_filtering']['out_of_order_lines']
+    past_end = 0
+    keep = True
+    for line in lines:
+        line_key = lib.time_utils.get_line_time_key(line, timeframe.start)
+        if line_key is not None:
+            if line_key > end_key:
+                past_end += 1
+                if past_end >= max_past_end:
+                    break
+            else:
+                past_end = 0
+            keep = start_key <= line_key <= end_key
+        if keep:
+            yield line
+
+
 def iter_matching_lines(lines, patterns):
     # type: (List[str], List[str]) -> str
     """Get all matching lines in lines.
@@ -1,10 +1,15 @@
 """Common functions to parse flutter lines from log files."""
 
+import collections
+import itertools
+
+import numpy
 import pandas
 
 # pylint: disable=unused-import
 try:
     from typing import Any
+    from typing import Dict
     from typing import Generator
     from typing import List
     from typing import Optional
@@ -17,8 +22,7 @@ from photon.lib import time_utils
 def _get_columns(line):
     # type: (str) -> List[str]
     """ Parses headers from a header line. """
-    columns = [column.strip() for column in line.split('flutter')[-1].split()]
-    return columns
+    return line.rpartition('flutter')[2].split()
 
 
 class Flutter(object):
@@ -28,14 +32,15 @@ class Flutter(object):
         # type: (Any) -> None
         self._timestamps = set()
         self._headers = set()
-        self.flutters = []
+        self._flutters = None  # type: Optional[List[Dict[str, Any]]]
+        self.instances = []  # type: List[FlutterInstance]
         self.name = None
 
         for flutter_data in flutters:
             flutter_instance = FlutterInstance(flutter_data)
             self._timestamps.add(flutter_instance.timestamp)
             self._headers.update(set(flutter_instance.headers))
-            self.flutters.extend(flutter_instance)
+            self.instances.append(flutter_instance)
             if not self.name:
                 self.name = flutter_instance.name
 
@@ -55,6 +60,14 @@ class Flutter(object):
         # type: () -> str
         return '< {}({}) at {} >'.format('Flutter', self.name, hex(id(self)))
 
+    @property
+    def flutters(self):
+        # type: () -> List[Dict[str, Any]]
+        """ Return a dict per data line of all of the flutter instances. """
+        if self._flutters is None:
+            self._flutters = [row for instance in self.instances for row in instance.flutter_data]
+        return self._flutters
+
     @property
     def timestamps(self):
         # type: () -> List[str]
@@ -69,8 +82,35 @@ class Flutter(object):
 
     def to_dataframe(self):
         # type: () -> pandas.DataFrame
-        """ Return a dataframe of the flutter set. """
-        return pandas.DataFrame(self.flutters)
+        """ Return a dataframe of the flutter set.
+
+        The data lines of all instances which share headers are built into one frame at once (without a dict per
+        line), numeric columns are converted in bulk and 'timestamp' and 'flutter_type' are categorical.
+        """
+        groups = collections.OrderedDict()  # type: collections.OrderedDict
+        for instance in self.instances:
+            groups.setdefault(tuple(instance.headers), []).append(instance)
+        frames = []
+        for headers, instances in groups.items():
+            rows = [row for instance in instances for row in instance.rows]
+            if all(len(row) == len(headers) for row in rows):
+                values = numpy.array(list(itertools.chain.from_iterable(rows)), dtype=object)
+                frame = pandas.DataFrame(values.reshape(len(rows), len(headers)), columns=list(headers))
+            else:
+                # Some lines are missing values.
+                frame = pandas.DataFrame(rows, columns=list(headers))
+            for header in headers:
+                frame[header] = _to_numeric(frame[header])
+            counts = [len(instance.rows) for instance in instances]
+            frame.insert(0, 'flutter_type', numpy.repeat([instance.name for instance in instances], counts))
+            frame.insert(0, 'timestamp', pandas.to_datetime([instance.timestamp for instance in instances]).repeat(counts))
+            frames.append(frame)
+        if not frames:
+            return pandas.DataFrame(columns=['timestamp', 'flutter_type'])
+        frame = frames[0] if len(frames) == 1 else pandas.concat(frames, ignore_index=True, sort=False)
+        for column in ('timestamp', 'flutter_type'):
+            frame[column] = frame[column].astype('category')
+        return frame
 
 
 class FlutterInstance(object):
@@ -99,8 +139,7 @@ class FlutterInstance(object):
         self.timestamp = time_utils.get_timestamp_from_line(self.lines[0])
         self.name = self._get_flutter_type()
         self.headers = sorted(_get_columns(self.lines[1]))
-        self.flutter_data = []
-        self._append_flutter_data()
+        self.rows = self._split_rows()
 
     def __iter__(self):
         # type: () -> Generator[Any]
@@ -121,20 +160,42 @@ class FlutterInstance(object):
         end = self.lines[0].index(')')
         return self.lines[0][start:end]
 
-    def _append_flutter_data(self):
-        # type: () -> None
-        """ Gets flutter data from data lines. """
+    @property
+    def flutter_data(self):
+        # type: () -> List[Dict[str, Any]]
+        """ Return a dict per data line with the timestamp, flutter type and each header's value. """
+        flutter_data = []
+        for row in self.rows:
+            # Create a dict with the timestamp and flutter type, then add each header's value under its key.
+            temp_dict = {'timestamp': self.timestamp,
+                         'flutter_type': self.name}
+            temp_dict.update(zip(self.headers, row))
+            flutter_data.append(temp_dict)
+        return flutter_data
+
+    def _split_rows(self):
+        # type: () -> List[List[str]]
+        """ Split each data line once; into a value per header. """
         # Line 0 is the flutter start
         # line 1 is flutter headers
         # line 2 starts data
         # last line ends flutter, so we want the second to last line (Slice
         # notation is non-inclusive)
-        for line in self.lines[2:-1]:
-            # Create empty dict and add timestamp and flutter type.
-            temp_dict = {'timestamp': self.timestamp,
-                         'flutter_type': self.name}
-            # Go through the headers and add each header to the dict under it's key.
-            for index in range(len(self.headers)):
-                temp_dict[self.headers[index]] = _get_columns(line)[index]
-            # Append the dict to the main list object.
-            self.flutter_data.append(temp_dict)
+        num_headers = len(self.headers)
+        # Inline _get_columns, as this is done for every data line of every flutter.
+        return [line.rpartition('flutter')[2].split()[:num_headers] for line in self.lines[2:-1]]
+
+
+def _to_numeric(column):
+    # type: (pandas.Series) -> pandas.Series
+    """ Convert a column of str values to numbers; unless any of its values are not numeric. """
+    for dtype in ('int64', 'float64'):
+        try:
+            return pandas.Series(column.values.astype(dtype), index=column.index, name=column.name)
+        except (TypeError, ValueError, OverflowError):
+            # Not all of the values are of this type; or some are missing.
+            continue
+    converted = pandas.to_numeric(column, errors='coerce')
+    if converted.isnull().sum() != column.isnull().sum():
+        return column
+    return converted
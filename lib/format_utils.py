@@ -128,6 +128,38 @@ def auto_scale(value, unit_type, precision=2):
     return '{:.{}f} {}'.format(lowest_value, precision, lowest_unit)
 
 
+def auto_scale_values(values, unit_type, precision=2):
+    # type: (Any, str, int) -> List[str]
+    """Scale many values at once; like auto_scale for each value, but the scaling is done on all of them together.
+
+    Arguments:
+        values (list/numpy.ndarray/pandas.Series): Values to scale; see to_raw.
+        unit_type (str): A unit_type to use for conversion: binary_bytes, bytes, bits, or latency.
+        precision (int): How many values to preserve after the decimal point.
+
+    Returns:
+        A list with a string of each converted value with units.  i.e. ['1.75 MB', '145.12 B']
+    """
+    if unit_type not in UNIT_SCALES:
+        raise IndexError('Unknown scale requested: "{}".'.format(unit_type))
+    base = UNIT_SCALES[unit_type]['base']
+    units = UNIT_SCALES[unit_type]['units']
+    raw_values = _to_raw_values(values)
+    lowest_values = raw_values.copy()
+    unit_indexes = numpy.zeros(len(raw_values), dtype=int)
+    # Values keep moving up the unit_type while they stay > 1 (unit).
+    scaling = numpy.ones(len(raw_values), dtype=bool)
+    for unit_index in range(1, len(units)):
+        raw_values = math_utils.safe_divide_values(raw_values, base)
+        scaling &= raw_values >= 1.
+        if not scaling.any():
+            break
+        lowest_values[scaling] = raw_values[scaling]
+        unit_indexes[scaling] = unit_index
+    template = '{{:.{}f}} {{}}'.format(precision)
+    return [template.format(value, units[index]) for value, index in zip(lowest_values.tolist(), unit_indexes.tolist())]
+
+
 def get_newest_log_date(path):
     # type: (str) -> str
     """Clean up a path so if it's a base path or a fuse path it has dates."""
@@ -415,6 +447,18 @@ def to_raw(value, scale=None, precision=2):
     raise custom_errors.FormatError('Unit "{}" is not in any known scale.'.format(unit))
 
 
+def _to_raw_values(values):
+    # type: (Any) -> numpy.ndarray
+    """Convert many values to raw floats at once; see to_raw."""
+    try:
+        raw_values = numpy.array(values, dtype=float)
+    except (TypeError, ValueError):
+        # Some of the values include a unit; i.e. '12.07 KB'.
+        raw_values = numpy.array([to_raw(value) for value in values], dtype=float)
+    raw_values[numpy.isnan(raw_values)] = 0.
+    return raw_values
+
+
 def zero(value):
     # type: (Union[int, float]) -> int
     """If a value is less than 0, set it to 0."""
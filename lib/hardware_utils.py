@@ -18,6 +18,7 @@ except ImportError:
 from photon.lib import custom_errors
 from photon.lib import file_utils
 from photon.lib import format_utils
+from photon.lib import table_utils
 
 LOGGER = logging.getLogger(__name__)
 
@@ -144,22 +145,11 @@ def parse_purehw_list(purehw_lines):
     Returns:
         hardware_dict (dict): Per-device information.
     """
-    # Skip the headers.
-    skip_lines = ('-' * 72, 'Name')
-    header = ['Name', 'Status', 'Identify', 'Slot', 'Index', 'Speed', 'Temperature',
-              'Voltage', 'Type', 'Handle', 'Parent']
-    hardware_dict = collections.defaultdict(dict)
-    for line in purehw_lines:
-        if line.strip().startswith(skip_lines):
-            continue
-        sline = [piece.strip() for piece in line.split('  ') if piece.strip()]
-        if not sline:
-            continue
-        device_name = sline[0]
-        for index, name in enumerate(header):
-            value = sline[index]
-            hardware_dict[device_name][name] = value
-    return dict(hardware_dict)
+    # Blank cells are shown as '-', like Purity does for values which are not set.
+    table = table_utils.parse_table(list(purehw_lines)).fillna('-')
+    if 'Name' not in table:
+        return {}
+    return {device['Name']: device for device in table.to_dict('records')}
 
 
 class HardwareComponent(object):
@@ -56,3 +56,28 @@ def safe_divide(numerator, denominator, precision=2):
         return 0
     result = float(numerator) / float(denominator)
     return round(result, precision)
+
+
+def safe_divide_values(numerators, denominators, precision=2):
+    # type: (Any, Any, int) -> numpy.ndarray
+    """Safely divide many numbers at once; like safe_divide for each pair of values.
+
+    Arguments:
+        numerators (list/numpy.ndarray/pandas.Series): The values to be divided.
+        denominators (list/numpy.ndarray/pandas.Series/int/float): The values (or a single value) doing the dividing.
+        precision (int): The decimal precision to round up to.
+
+    Returns:
+        results (numpy.ndarray): The float division results; 0.0 where the denominator is 0.
+    """
+    numerators = numpy.asarray(numerators, dtype=float)
+    denominators = numpy.asarray(denominators, dtype=float)
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        results = numpy.where(denominators == 0., 0., numerators / denominators)
+    rounded = numpy.round(results, precision)
+    # numpy.round scales by 10 ** precision first, so values near a half can round the other way from round().
+    scaled = numpy.abs(results) * 10. ** precision
+    near_half = numpy.flatnonzero(numpy.abs(scaled - numpy.floor(scaled) - .5) < 1e-6)
+    for index in near_half.tolist():
+        rounded.flat[index] = round(float(results.flat[index]), precision)
+    return rounded
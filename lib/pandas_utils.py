@@ -25,19 +25,26 @@
 -/osyhdmmNNNMMMMMMNmmddmmNMMMMMMMMMMMMNNNmmdhyso/-
 """
 
+import collections
+import hashlib
 import logging
 import warnings
 
+import numpy
 import pandas
 
+from pandas.core.resample import Resampler
 from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
 
 # pylint: disable=unused-import
 try:
     from typing import Any
     from typing import Dict
     from typing import List
+    from typing import Optional
     from typing import Set
+    from typing import Union
 except ImportError:
     pass
 
@@ -52,6 +59,11 @@ FREQ_REPLACE = {
     'T': {'second': 0, 'microsecond': 0},  # T == Minutes
     'S': {'microsecond': 0},  # S == Seconds
 }  # type: Dict[str, Dict[str, int]]
+# How many ResampleGroupers to keep; see get_resample_grouper.
+GROUPER_CACHE_SIZE = 32
+# Aggregations which fill empty buckets with 0 instead of NaN (the same as a pandas Resampler).
+ZERO_FILLED_OPERATIONS = ('count', 'sum')
+_GROUPER_CACHE = collections.OrderedDict()  # type: collections.OrderedDict
 
 
 def get_latest_values(frame, fields, both_controllers=False):
@@ -147,19 +159,204 @@ def merge_on_timestamp(frames, ts_column='Timestamp'):
     return merged
 
 
-def resample_frame(frame, frequency):
-    # type: (pandas.DataFrame, Any) -> pandas.DataFrame
-    """Re-sample a pandas DataFrame at the given frequency."""
+def merge_sorted_runs(frame, column='Timestamp'):
+    # type: (pandas.DataFrame, str) -> pandas.DataFrame
+    """Order a frame which is made up of stacked runs of rows that are each already sorted by a column.
+
+    This is meant for stacked per-file or per-source results, which come out of each parser in time order.
+    The runs are found where the column steps backwards, then neighbouring runs are merged together in pairs
+    until one is left; instead of sorting all of the rows from scratch.  Rows with the same value keep the order
+    in which they were stacked.
+
+    Arguments:
+        frame (pandas.DataFrame): Stacked runs of sorted rows.
+        column (str): The column which each run is sorted by.
+
+    Returns:
+        merged (pandas.DataFrame): The rows ordered by the column, with a new index.
+    """
+    if frame.empty:
+        return frame
+    if column not in frame:
+        error_msg = 'Column "{}" is not in the frame.'.format(column)
+        LOGGER.error(error_msg)
+        raise KeyError(error_msg)
+    values = frame[column].values
+    # Each run starts where a value is lower than the one before it.
+    starts = numpy.flatnonzero(values[1:] < values[:-1]) + 1
+    if not len(starts):
+        merged = frame.copy()
+    else:
+        runs = numpy.split(numpy.arange(len(values)), starts)
+        while len(runs) > 1:
+            pairs = [_merge_runs(values, runs[index], runs[index + 1]) for index in range(0, len(runs) - 1, 2)]
+            if len(runs) % 2:
+                pairs.append(runs[-1])
+            runs = pairs
+        merged = frame.take(runs[0])
+    merged.reset_index(drop=True, inplace=True)
+    return merged
+
+
+def floor_timestamps(timestamps, frequency):
+    # type: (pandas.Series, Any) -> pandas.Series
+    """Zero out the parts of each Timestamp which are finer than the frequency; see FREQ_REPLACE.
+
+    Arguments:
+        timestamps (pandas.Series): Timestamps to floor.
+        frequency (str/pandas.Timedelta): The frequency which the Timestamps will be re-sampled at.
+
+    Returns:
+        A pandas.Series of the floored Timestamps.
+    """
     freq = to_offset(frequency).name  # type: str
     # Pick the frequency at which to work with the Timestamp.
-    freq_choice = FREQ_REPLACE.get(freq, FREQ_REPLACE['H'])
+    floor_freq = freq if freq in FREQ_REPLACE else 'H'
+    return _to_datetimes(timestamps).dt.floor(floor_freq)
+
+
+def resample_frame(frame, frequency):
+    # type: (pandas.DataFrame, Any) -> Any
+    """Re-sample a pandas DataFrame at the given frequency."""
     # Have to adjust the Timestamp to reflect the requested frequency to avoid odd values.
-    frame['Timestamp'] = frame['Timestamp'].apply(lambda t: t.replace(**freq_choice))
+    frame['Timestamp'] = floor_timestamps(frame['Timestamp'], frequency)
     # Re-sample with the frequency in the array_api. Setting Timestamp column as the index.
     table_rs = frame.resample(to_offset(frequency), on='Timestamp')  # type: Any
     return table_rs
 
 
+class ResampleGrouper(object):
+    """The re-sampling buckets of a set of Timestamps; shared by every frame which has the same Timestamps.
+
+    This gives the same results as resample_frame, but the buckets are only worked out once; then each aggregation
+    is a groupby on the bucket of each row.
+    """
+
+    def __init__(self, timestamps, frequency):
+        # type: (pandas.Series, Any) -> None
+        """
+        Arguments:
+            timestamps (pandas.Series): The Timestamp column of the frames to re-sample.
+            frequency (str/pandas.Timedelta): The frequency to re-sample at.
+        """
+        self.offset = to_offset(frequency)
+        self.timestamps = floor_timestamps(timestamps, self.offset)
+        # The bucket of each row (-1 for rows without a Timestamp) and the Timestamp of each bucket.
+        self.codes = None  # type: Optional[numpy.ndarray]
+        self.index = None  # type: Optional[pandas.DatetimeIndex]
+        if isinstance(self.offset, Tick) and self.timestamps.dt.tz is None:
+            self._set_buckets()
+
+    def _set_buckets(self):
+        # type: () -> None
+        """Bucket the Timestamps the same way as a pandas Resampler; from the start of the day of the first one."""
+        values = self.timestamps.values.view('int64')
+        valid = ~numpy.isnat(self.timestamps.values)
+        self.codes = numpy.full(len(values), -1, dtype='int64')
+        if not valid.any():
+            self.index = pandas.DatetimeIndex([], name='Timestamp')
+            return
+        day = 24 * 3600 * 10 ** 9
+        origin = values[valid].min() // day * day
+        buckets = (values[valid] - origin) // self.offset.nanos
+        first = buckets.min()
+        self.codes[valid] = buckets - first
+        bucket_times = origin + numpy.arange(first, buckets.max() + 1, dtype='int64') * self.offset.nanos
+        self.index = pandas.DatetimeIndex(bucket_times, name='Timestamp')
+
+    def aggregate(self, frame, operations):
+        # type: (pandas.DataFrame, Union[str, Dict[str, str]]) -> pandas.DataFrame
+        """Aggregate the rows of a frame in each bucket; all of the operations are done on one grouping of the rows.
+
+        Arguments:
+            frame (pandas.DataFrame): A frame with the same Timestamps as this grouper.
+            operations (str/dict): A Resampler method (i.e. 'last') for every column; or per column.
+
+        Returns:
+            A pandas.DataFrame indexed by the Timestamp of each bucket; like resample_frame(...).<operation>().
+        """
+        if isinstance(operations, dict):
+            by_operation = collections.OrderedDict()  # type: collections.OrderedDict
+            for column, operation in operations.items():
+                by_operation.setdefault(operation, []).append(column)
+        else:
+            columns = [column for column in frame.columns if column != 'Timestamp']
+            by_operation = collections.OrderedDict([(operations, columns)])
+        for operation in by_operation:
+            if not hasattr(Resampler, operation):
+                error_msg = 'The resampling operation "{}" is not defined.'.format(operation)
+                LOGGER.error(error_msg)
+                raise ValueError(error_msg)
+
+        if self.codes is None:
+            # Offsets which are not a fixed length (i.e. months) and timezones are left to pandas.
+            resampler = frame.assign(Timestamp=self.timestamps.values).resample(self.offset, on='Timestamp')
+            results = [getattr(resampler[columns], operation)() for operation, columns in by_operation.items()]
+            return pandas.concat(results, axis=1)
+
+        rows = self.codes >= 0
+        codes = self.codes
+        if not rows.all():
+            frame = frame[rows]
+            codes = codes[rows]
+        grouped = frame.groupby(codes)
+        results = []
+        for operation, columns in by_operation.items():
+            result = getattr(grouped[columns], operation)()
+            fill_value = 0 if operation in ZERO_FILLED_OPERATIONS else numpy.nan
+            result = result.reindex(range(len(self.index)), fill_value=fill_value)
+            results.append(result)
+        aggregated = pandas.concat(results, axis=1)
+        aggregated.index = self.index
+        return aggregated
+
+
+def get_resample_grouper(timestamps, frequency):
+    # type: (pandas.Series, Any) -> ResampleGrouper
+    """Get the ResampleGrouper for a Timestamp column at a frequency.
+
+    The groupers are cached by the frequency and the Timestamps themselves; so each metric of a report which uses
+    the same rows (of the same dataset and controller) shares one grouper.
+
+    Arguments:
+        timestamps (pandas.Series): The Timestamp column of the frame to re-sample.
+        frequency (str/pandas.Timedelta): The frequency to re-sample at.
+
+    Returns:
+        A ResampleGrouper.
+    """
+    timestamps = _to_datetimes(timestamps)
+    digest = hashlib.sha1(numpy.ascontiguousarray(timestamps.values.view('int64'))).hexdigest()
+    key = (to_offset(frequency).freqstr, str(timestamps.dt.tz), len(timestamps), digest)
+    grouper = _GROUPER_CACHE.pop(key, None)
+    if grouper is None:
+        grouper = ResampleGrouper(timestamps, frequency)
+    _GROUPER_CACHE[key] = grouper
+    while len(_GROUPER_CACHE) > GROUPER_CACHE_SIZE:
+        _GROUPER_CACHE.popitem(last=False)
+    return grouper
+
+
+def _merge_runs(values, left, right):
+    # type: (numpy.ndarray, numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+    """Merge the row positions of two sorted runs; rows of the left run go first when their values are equal."""
+    left_values = values[left]
+    right_values = values[right]
+    merged = numpy.empty(len(left) + len(right), dtype=left.dtype)
+    # Each row moves up by the number of rows from the other run which go before it.
+    merged[numpy.arange(len(left)) + numpy.searchsorted(right_values, left_values, side='left')] = left
+    merged[numpy.arange(len(right)) + numpy.searchsorted(left_values, right_values, side='right')] = right
+    return merged
+
+
+def _to_datetimes(timestamps):
+    # type: (pandas.Series) -> pandas.Series
+    """Convert a Timestamp column to datetimes; unless it already is (pandas.to_datetime copies it to objects)."""
+    if pandas.api.types.is_datetime64_any_dtype(timestamps):
+        return timestamps
+    return pandas.to_datetime(timestamps)
+
+
 def sort_by_index_and_columns(frame, columns):
     # type: (pandas.DataFrame, List[str]) -> Any
     """Sort a pandas.DataFrame by the given columns and and then by the index."""
@@ -1,14 +1,19 @@
 """Common objects used through photon.backend.logs."""
 
 import abc
+import collections
+import copy
+import hashlib
 import logging
 import re
 
+import numpy
 import pandas
 
 from future.utils import with_metaclass
 from six import string_types
 
+from photon.lib import config_utils
 from photon.lib import file_utils
 from photon.lib import time_utils
 
@@ -24,6 +29,7 @@ except ImportError:
     pass
 
 LOGGER = logging.getLogger(__name__)
+SETTINGS = config_utils.get_settings()
 
 
 # TODO: PT-1472 - Convert all of these objects to a dictionary or namedtuple...
@@ -193,14 +199,25 @@ class ParallelLogParser(with_metaclass(abc.ABCMeta, object)):
 
     fields = abc.abstractproperty(None)  # type: Dict[str, LogData]
     forms = abc.abstractproperty(None)  # type: Dict[str, Any]
+    _timestamp_parser = None  # type: Optional[time_utils.TimestampParser]
 
-    def __init__(self, log_file):
-        # type: (str) -> None
+    def __init__(self, log_file, timeframe=None):
+        # type: (str, Optional[time_utils.Timeframe]) -> None
+        """
+        Arguments:
+            log_file (str): The full path to the log file to parse.
+            timeframe (time_utils.Timeframe): Only read lines within this range of time (if the log type allows it).
+        """
         self._form_lines = None
         self.field_data = {}  # type: Dict[str, Any]
+        # The lines and bytes which are read from the log file; i.e. to measure how quickly they are parsed.
+        self.read_counter = file_utils.ReadCounter()
         self.log_file = log_file
+        self.timeframe = timeframe
         self.text_to_match = self._get_text_to_match()
-        self.controller_name = file_utils.LogFile(log_file).controller
+        log_obj = file_utils.LogFile(log_file)
+        self.controller_name = log_obj.controller
+        self.log_type = log_obj.log_type
         # TODO: PT-2131 - Multi-thread fetch_raw_lines, form_lines, get_fields?
 
     def _get_text_to_match(self):
@@ -219,10 +236,14 @@ class ParallelLogParser(with_metaclass(abc.ABCMeta, object)):
     def fetch_raw_lines(self):
         # type: () -> List[str]
         """Get all of the needed raw lines from the log files."""
-        if not self.text_to_match:
-            lines_gen = file_utils.file_lines_generator([self.log_file])
-        else:
-            lines_gen = file_utils.iter_file_matching_lines([self.log_file], self.text_to_match)
+        if self.timeframe and is_monotonic_log(self.log_type):
+            # Drop lines outside of the timeframe before we spend any time parsing them; the (cheaper) text matching
+            # is done first, so only the matching lines have their timestamps compared.
+            return file_utils.timeframe_lines_generator(self.log_file, self.timeframe, self.text_to_match,
+                                                        counter=self.read_counter)
+        lines_gen = self.read_counter.count(file_utils.file_lines_generator([self.log_file]))
+        if self.text_to_match:
+            lines_gen = file_utils.iter_matching_lines(lines_gen, self.text_to_match)
         return lines_gen
 
     @property
@@ -245,11 +266,26 @@ class ParallelLogParser(with_metaclass(abc.ABCMeta, object)):
                     # we should be pointed to the raw_lines.
                     if form.text_to_match:
                         # Put placeholders in place for all rows where we don't match lines.
-                        form_lines[form_name] = None
-                        form_lines[form_name] = form_lines[form_lines['raw_lines'].str.contains(form.text_to_match)]
+                        raw_lines = form_lines['raw_lines']
+                        form_lines[form_name] = raw_lines.where(raw_lines.str.contains(form.text_to_match))
             self._form_lines = form_lines
         return self._form_lines
 
+    @property
+    def log_date(self):
+        # type: () -> Optional[time_utils.Timestamp]
+        """The date of the log file (from its name or path); None if it does not have one."""
+        start_time = file_utils.LogFile(self.log_file).start_time
+        return None if start_time == time_utils.INVALID_TIMESTAMP else start_time
+
+    @property
+    def timestamp_parser(self):
+        # type: () -> time_utils.TimestampParser
+        """Reads the timestamps of this log; year-less timestamps are in the year of the log_date."""
+        if self._timestamp_parser is None:
+            self._timestamp_parser = time_utils.TimestampParser(self.log_date)
+        return self._timestamp_parser
+
     def get_form_lines(self, form_name):
         # type: (str) -> List[str]
         """Fetch the form_lines for a single form."""
@@ -358,12 +394,18 @@ class ParallelLogParser(with_metaclass(abc.ABCMeta, object)):
         # These are used for generating fields... but perhaps we should have a regex form...
         timestamped_results = []
         for group_dict in self._get_regex_matches_dict(form):
-            timestamp = time_utils.Timestamp(group_dict['timestamp'])
+            timestamp = self.timestamp_parser.parse(group_dict['timestamp'])
             keys = keys or [key for key in list(group_dict.keys()) if key != 'timestamp']
             values = {key: group_dict.get(key) for key in keys}
             timestamped_results.append((timestamp, values))
         return timestamped_results
 
+    def pull_timestamped_lines(self, form_name):
+        # type: (str) -> List[Tuple[Any, Any]]
+        """Pair each line of a form with the timestamp at the start of the line; see timestamp_lines."""
+        table = timestamp_lines(self.get_form_lines(form_name), self.log_date)
+        return list(zip(table['Timestamp'].tolist(), table['line'].tolist()))
+
     def _get_regex_matches_dict(self, form_name):
         # type: (str) -> List[Any]
         """Helper function for a form's regex patterns.  Returns a list of named groups matched from lines."""
@@ -388,3 +430,192 @@ class ParallelLogParser(with_metaclass(abc.ABCMeta, object)):
         if not matches:
             LOGGER.warning('There were no regex matches!')
         return matches
+
+
+class RunLengthValues(object):
+    """Per timestamp values of a field; stored as runs of a single value and each timestamp which has that value.
+
+    Each run has a key which identifies its content (i.e. a content_hash), consecutive values with the same key are
+    stored once.  Iterating over this gives the expanded (timestamp, value) pairs, like any other field results.
+    The timestamps of a run share its value; so the values should be treated as read-only.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.runs = []  # type: List[Tuple[Any, Any, List[Any]]]
+
+    def __eq__(self, other):
+        # type: (Any) -> bool
+        if isinstance(other, (list, RunLengthValues)):
+            return self.expand() == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        # type: (Any) -> bool
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        # type: () -> str
+        return 'RunLengthValues({!r})'.format(self.expand())
+
+    def __iter__(self):
+        # type: () -> Iterator[Tuple[Any, Any]]
+        for _, value, timestamps in self.runs:
+            for timestamp in timestamps:
+                yield timestamp, value
+
+    def __len__(self):
+        # type: () -> int
+        return sum(len(timestamps) for _, _, timestamps in self.runs)
+
+    def __getitem__(self, index):
+        # type: (Any) -> Any
+        if isinstance(index, slice):
+            return self.expand()[index]
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            # Find the run which has this index, rather than expanding every run.
+            for _, value, timestamps in self.runs:
+                if index < len(timestamps):
+                    return timestamps[index], value
+                index -= len(timestamps)
+        raise IndexError('RunLengthValues index out of range')
+
+    def append(self, timestamp, value, key=None):
+        # type: (Any, Any, Any) -> None
+        """Add a value for a timestamp; values without a key are never combined with the previous run."""
+        if key is not None and self.runs and self.runs[-1][0] == key:
+            self.runs[-1][2].append(timestamp)
+        else:
+            self.runs.append((key, value, [timestamp]))
+
+    def append_shared(self, timestamp, key, shared, build):
+        # type: (Any, Any, SharedValues, Any) -> None
+        """Add the value of a key for a timestamp; it is only taken (copied) from shared when a new run begins.
+
+        Arguments:
+            timestamp (time_utils.Timestamp): The timestamp of the value.
+            key (Any): Identifies the content of the value (i.e. a content_hash).
+            shared (SharedValues): Values which were already built; by their key.
+            build (function): Build the value (i.e. parse the content) if shared does not have it.
+        """
+        if self.runs and self.runs[-1][0] == key:
+            self.runs[-1][2].append(timestamp)
+        else:
+            self.runs.append((key, shared.get(key, build), [timestamp]))
+
+    def expand(self):
+        # type: () -> List[Tuple[Any, Any]]
+        """Get the (timestamp, value) pairs."""
+        return list(self)
+
+    def to_frame(self, field):
+        # type: (str) -> pandas.DataFrame
+        """Get a DataFrame with a 'Timestamp' and a field column; without expanding the runs into pairs first.
+
+        Arguments:
+            field (str): The name of the value column.
+
+        Returns:
+            frame (pandas.DataFrame): A row per timestamp; the rows of a run share its value.
+        """
+        values = numpy.empty(len(self.runs), dtype=object)
+        values[:] = [value for _, value, _ in self.runs]
+        counts = [len(timestamps) for _, _, timestamps in self.runs]
+        timestamps = [timestamp for _, _, run_timestamps in self.runs for timestamp in run_timestamps]
+        return pandas.DataFrame({field: numpy.repeat(values, counts), 'Timestamp': timestamps},
+                                columns=[field, 'Timestamp'])
+
+
+class SharedValues(object):
+    """A bounded cache of values by a key which identifies their content (i.e. a content_hash).
+
+    Content which is parsed once is copied for everything else with the same content, rather than being parsed
+    again.  Each value given out is a copy, so changing it never changes the cached value (or any other copy).
+    The least recently used values are dropped when there are more than max_size values.
+    """
+
+    def __init__(self, max_size=None):
+        # type: (Optional[int]) -> None
+        self.max_size = max_size or SETTINGS['parsers']['shared_values']
+        self._values = collections.OrderedDict()  # type: collections.OrderedDict
+
+    def __contains__(self, key):
+        # type: (Any) -> bool
+        return key in self._values
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._values)
+
+    def get(self, key, build):
+        # type: (Any, Any) -> Any
+        """Get a copy of the value for a key; build it (i.e. parse the content) only if we don't already have it."""
+        if key in self._values:
+            # Move this to the end, so it is the most recently used.
+            value = self._values.pop(key)
+        else:
+            value = build()
+        self._values[key] = value
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+        return copy.deepcopy(value)
+
+
+def content_hash(lines):
+    # type: (List[str]) -> str
+    """Get a hash of the content of some lines; i.e. to find sections which did not change between timestamps."""
+    digest = hashlib.sha1()
+    for line in lines:
+        if not isinstance(line, bytes):
+            line = line.encode('utf-8')
+        digest.update(line)
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def parse_line_timestamps(lines, reference=None):
+    # type: (List[str], Optional[Any]) -> pandas.Series
+    """Parse the timestamp at the start of each line in bulk; like time_utils.get_timestamp_from_line per line.
+
+    Arguments:
+        lines (list): Log lines which may begin with a timestamp.
+        reference (time_utils.Timestamp): The date of the log file; used to infer the year of timestamps without one.
+            * Defaults to the current year.
+
+    Returns:
+        A datetime64 pandas.Series with a timestamp per line; time_utils.INVALID_TIMESTAMP for lines without one.
+    """
+    prefixes = []
+    for line in lines:
+        match = time_utils.OPTIONAL_DATE_MS.match(line)
+        prefixes.append(match.group() if match else None)
+    times = pandas.Series(time_utils.parse_timestamps(prefixes, reference))
+    return times.fillna(time_utils.INVALID_TIMESTAMP)
+
+
+def timestamp_lines(lines, reference=None):
+    # type: (List[str], Optional[Any]) -> pandas.DataFrame
+    """Build a table of lines which are each an event; with the timestamp at the start of the line.
+
+    Arguments:
+        lines (list): Log lines which may begin with a timestamp.
+        reference (time_utils.Timestamp): The date of the log file; see parse_line_timestamps.
+
+    Returns:
+        A pandas.DataFrame with a datetime64 'Timestamp' column and a 'line' column; a row per line, in order.
+            * Lines without a timestamp have time_utils.INVALID_TIMESTAMP.
+    """
+    lines = list(lines)
+    return pandas.DataFrame({'Timestamp': parse_line_timestamps(lines, reference), 'line': pandas.Series(lines, dtype=object)},
+                            columns=['Timestamp', 'line'])
+
+
+def is_monotonic_log(log_type):
+    # type: (str) -> bool
+    """Check if the lines of a log type are written in timestamp order; see settings.ini [line_filtering]."""
+    return log_type in SETTINGS.get('line_filtering', {}).get('monotonic_logs', [])
@@ -0,0 +1,155 @@
+"""Common utility functions related to parsing fixed width text tables; i.e. the output of 'purevol list'."""
+
+import logging
+import re
+
+import numpy
+import pandas
+
+# pylint: disable=unused-import
+try:
+    from typing import Any
+    from typing import List
+    from typing import Optional
+    from typing import Tuple
+except ImportError:
+    pass
+
+LOGGER = logging.getLogger(__name__)
+# Header names are separated by 2 or more spaces; i.e. 'Name    Host Group    Size':
+HEADER_REGEX = re.compile(r'\S+(?: \S+)*')
+# Lines which only separate sections of the table; i.e. '-' * 72:
+SEPARATOR_REGEX = re.compile(r'^\s*([-=*])\1{2,}\s*$')
+VALUE_SPLIT = r'\s{2,}'
+
+
+def find_columns(header_line, headers=None):
+    # type: (str, Optional[List[str]]) -> List[Tuple[str, int, int]]
+    """Find the name, start and end of each column name within a header line.
+
+    Arguments:
+        header_line (str): The header line of a table.
+        headers (list): The column names to find; by default, any text which is separated by 2 or more spaces.
+
+    Returns:
+        columns (list): A (name, start, end) tuple per column.
+    """
+    if not headers:
+        return [(match.group(), match.start(), match.end()) for match in HEADER_REGEX.finditer(header_line)]
+    columns = []
+    position = 0
+    for header in headers:
+        start = header_line.find(header, position)
+        if start == -1:
+            msg = 'Column "{}" is not in the header line "{}".'.format(header, header_line.strip())
+            LOGGER.error(msg)
+            raise ValueError(msg)
+        position = start + len(header)
+        columns.append((header, start, position))
+    return columns
+
+
+def _get_cuts(columns, all_space):
+    # type: (List[Tuple[str, int, int]], numpy.ndarray) -> List[int]
+    """Get where to cut each row; between the end of a column's name and the start of the next column's name.
+
+    Values are usually aligned with the start of their column name, but some are right aligned or wider than their
+    column name.  So cut at the right-most position where every line has a space before it.
+    """
+    cuts = [0]
+    for (_, _, previous_end), (_, start, _) in zip(columns, columns[1:]):
+        cut = start
+        for position in range(start, previous_end, -1):
+            if all_space[position - 1]:
+                cut = position
+                break
+        cuts.append(cut)
+    return cuts
+
+
+def split_table(lines, headers=None):
+    # type: (List[str], Optional[List[str]]) -> Tuple[List[str], List[List[Optional[str]]]]
+    """Split the lines of a fixed width table into columns of values.
+
+    The column boundaries are found once from the header line and the whitespace of all lines, then every row is
+    sliced at once.  Rows which do not fit the boundaries (i.e. a value which overflows its column) are split on
+    2 or more spaces instead, when that gives one value per column.
+
+    Arguments:
+        lines (list): The lines of the table; the first line with text is the header line.
+        headers (list): Column names to use; by default, any text which is separated by 2 or more spaces.
+
+    Returns:
+        names (list): The name of each column.
+        columns (list): The values of each column, one per row; blank cells are None.
+    """
+    lines = [line.rstrip('\r\n') for line in lines if _is_row(line)]
+    if not lines:
+        return list(headers or []), [[] for _ in headers or []]
+    columns = find_columns(lines[0], headers)
+    names = [name for name, _, _ in columns]
+    rows = lines[1:]
+    if not rows or not columns:
+        return names, [[] for _ in names]
+
+    width = max(len(line) for line in lines)
+    padded = numpy.array([line.ljust(width) for line in lines], dtype='U{}'.format(width))
+    characters = padded.view('U1').reshape(len(lines), width)
+    is_space = characters == ' '
+    cuts = _get_cuts(columns, is_space.all(axis=0))
+    # Replace trailing spaces of every cell with NUL characters, which numpy drops from the end of each str.
+    characters = characters[1:].copy()
+    is_space = is_space[1:]
+    cells = []
+    for index, start in enumerate(cuts):
+        end = cuts[index + 1] if index + 1 < len(cuts) else width
+        cell_spaces = is_space[:, start:end]
+        trailing = numpy.logical_and.accumulate(cell_spaces[:, ::-1], axis=1)[:, ::-1]
+        cell_characters = characters[:, start:end]
+        cell_characters[trailing] = ''
+        values = numpy.ascontiguousarray(cell_characters).view('U{}'.format(end - start)).ravel().tolist()
+        # Only right aligned (or blank) cells have leading spaces.
+        for row_index in numpy.flatnonzero(cell_spaces[:, 0]):
+            values[row_index] = values[row_index].lstrip()
+        cells.append([value or None for value in values])
+
+    # A row fits the cuts when there is a space before every cut (or the cut is past the end of the row).
+    fits = is_space[:, [cut - 1 for cut in cuts[1:]]].all(axis=1)
+    for row_index in numpy.flatnonzero(~fits):
+        split = re.split(VALUE_SPLIT, rows[row_index].strip())
+        if len(split) == len(columns):
+            for column, value in zip(cells, split):
+                column[row_index] = value
+    return names, cells
+
+
+def parse_table(lines, headers=None, join_wrapped=False):
+    # type: (List[str], Optional[List[str]], bool) -> pandas.DataFrame
+    """Parse the lines of a fixed width table into a DataFrame; with one row per line and one column per header.
+
+    See split_table for how the lines are split into columns.
+
+    Arguments:
+        lines (list): The lines of the table; the first line with text is the header line.
+        headers (list): Column names to use; by default, any text which is separated by 2 or more spaces.
+        join_wrapped (bool): Join rows which continue the previous row (the first column is blank) into that row.
+
+    Returns:
+        table (pandas.DataFrame): A column of str values per header; blank cells are None.
+    """
+    names, cells = split_table(lines, headers)
+    table = pandas.DataFrame(dict(enumerate(cells)), columns=range(len(names)), dtype=object)
+    if join_wrapped and not table.empty:
+        # Rows without a value in the first column are the rest of the values from the previous row.
+        group_ids = table[0].notnull().cumsum()
+        table = table.groupby(group_ids, sort=False).agg(
+            lambda values: ' '.join(value for value in values if value is not None) or None).reset_index(drop=True)
+    table.columns = names
+    return table
+
+
+def _is_row(line):
+    # type: (str) -> bool
+    """Check if a line is part of a table; not a blank or separator line."""
+    stripped = line.strip()
+    return bool(stripped) and not (stripped[0] in '-=*' and SEPARATOR_REGEX.match(stripped))
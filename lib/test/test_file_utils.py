@@ -3,7 +3,9 @@
 import gzip
 import os
 import pytest
+import shutil
 import tarfile
+import tempfile
 import unittest
 
 from photon.lib import file_utils
@@ -210,6 +212,115 @@ class IterMatchingLinesTestCase(unittest.TestCase):
         self.assertEqual([line for line in file_iter], expected)
 
 
+class IterLinesInTimeframeTestCase(unittest.TestCase):
+    """Unit tests for iter_lines_in_timeframe."""
+    timeframe = time_utils.Timeframe('2018-01-28 23:17:00', '2018-01-28 23:18:00', granularity='1s')
+
+    def test_empty(self):
+        """Should raise StopIteration."""
+        line_iter = file_utils.iter_lines_in_timeframe([], self.timeframe)
+        with self.assertRaises(StopIteration):
+            next(line_iter)
+
+    def test_skip_before_start(self):
+        """Lines before the start (and their continuation lines) should be skipped."""
+        lines = ['Jan 28 23:16:59.999 before', 'continued before', 'Jan 28 23:17:00.100 within', 'continued within']
+        result = list(file_utils.iter_lines_in_timeframe(lines, self.timeframe))
+        self.assertEqual(result, ['Jan 28 23:17:00.100 within', 'continued within'])
+
+    def test_out_of_order(self):
+        """Lines which are slightly out of order past the end should not stop the reading."""
+        lines = ['Jan 28 23:17:30 within', 'Jan 28 23:18:01 after', 'continued after', 'Jan 28 23:17:45 out of order']
+        result = list(file_utils.iter_lines_in_timeframe(lines, self.timeframe, 2))
+        self.assertEqual(result, ['Jan 28 23:17:30 within', 'Jan 28 23:17:45 out of order'])
+
+    def test_stop_after_end(self):
+        """We should stop reading once enough lines in a row are past the end, even if later lines are in range."""
+        lines = ['Jan 28 23:17:30 within', 'Jan 28 23:18:01 after', 'Jan 28 23:18:02 after', 'Jan 28 23:17:45 late']
+        result = list(file_utils.iter_lines_in_timeframe(lines, self.timeframe, 2))
+        self.assertEqual(result, ['Jan 28 23:17:30 within'])
+
+    def test_iso_timestamps(self):
+        """ISO formatted timestamps should be compared as well."""
+        lines = ['2018-01-28 23:16:00 before', '2018-01-28 23:17:30 within', '2018-01-28 23:19:00 after']
+        result = list(file_utils.iter_lines_in_timeframe(lines, self.timeframe))
+        self.assertEqual(result, ['2018-01-28 23:17:30 within'])
+
+    def test_no_timestamps(self):
+        """Lines without any timestamps should all be kept."""
+        lines = ['garbage line', 'another garbage line']
+        result = list(file_utils.iter_lines_in_timeframe(lines, self.timeframe))
+        self.assertEqual(result, lines)
+
+
+class TimeframeLinesGeneratorTestCase(unittest.TestCase):
+    """Unit tests for timeframe_lines_generator."""
+    lines = ['Jan 28 23:15:00 first', 'Jan 28 23:16:30 before', 'continued before', 'Jan 28 23:17:00 within',
+             'continued within', 'Jan 28 23:17:30 within', 'Jan 28 23:18:30 after']
+    timeframe = time_utils.Timeframe('2018-01-28 23:17:00', '2018-01-28 23:18:00', granularity='1s')
+
+    def setUp(self):
+        """Write the lines to a plain text and a compressed log file."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.temp_dir, 'core.log-2018012823')
+        content = '\n'.join(self.lines) + '\n'
+        with open(self.log_file, 'w') as log_file:
+            log_file.write(content)
+        with gzip.open(self.log_file + '.gz', 'wt') as log_file:
+            log_file.write(content)
+
+    def tearDown(self):
+        """Remove the log files."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_tail_blocks(self):
+        """Reading backward gives the same lines as reading forward; with any size of block."""
+        expected = ['Jan 28 23:17:00 within\n', 'continued within\n', 'Jan 28 23:17:30 within\n']
+        for block_size in (1, 10, file_utils.TAIL_BLOCK_SIZE):
+            result = list(file_utils.timeframe_lines_generator(self.log_file, self.timeframe,
+                                                                block_size=block_size, out_of_order_lines=1))
+            self.assertEqual(expected, result)
+
+    def test_only_tail(self):
+        """Only the blocks after the last line before the timeframe are read."""
+        offset = file_utils._find_timeframe_offset(self.log_file, self.timeframe, 10, 1)
+        self.assertEqual(len('\n'.join(self.lines[:1])) + 1, offset)
+
+    def test_out_of_order(self):
+        """We only stop reading backward once enough lines in a row are before the timeframe."""
+        self.assertEqual(0, file_utils._find_timeframe_offset(self.log_file, self.timeframe, 10, 2))
+        self.assertEqual(0, file_utils._find_timeframe_offset(self.log_file, self.timeframe, 10, 3))
+
+    def test_entire_file(self):
+        """The entire file is read when there is no line before the timeframe."""
+        timeframe = time_utils.Timeframe('2018-01-28 23:00:00', '2018-01-28 23:59:00', granularity='1s')
+        self.assertEqual(0, file_utils._find_timeframe_offset(self.log_file, timeframe, 10))
+        result = list(file_utils.timeframe_lines_generator(self.log_file, timeframe, block_size=10))
+        self.assertEqual([line + '\n' for line in self.lines], result)
+
+    def test_compressed(self):
+        """Compressed files are read forward; with the same lines."""
+        expected = list(file_utils.timeframe_lines_generator(self.log_file, self.timeframe))
+        result = list(file_utils.timeframe_lines_generator(self.log_file + '.gz', self.timeframe))
+        self.assertEqual(expected, result)
+
+    def test_counter(self):
+        """Every line which is read is counted; including the lines which are not within the timeframe."""
+        counter = file_utils.ReadCounter()
+        list(file_utils.timeframe_lines_generator(self.log_file, self.timeframe, ['23:17'], counter=counter))
+        self.assertEqual(len(self.lines), counter.lines)
+        self.assertEqual(file_utils.get_text_size(self.log_file), counter.bytes)
+
+    def test_text_size(self):
+        """Compressed files have the size of their text."""
+        self.assertEqual(file_utils.get_text_size(self.log_file), file_utils.get_text_size(self.log_file + '.gz'))
+
+    def test_patterns(self):
+        """Only the lines which match one of the patterns are kept."""
+        result = list(file_utils.timeframe_lines_generator(self.log_file, self.timeframe, ['23:17']))
+        self.assertEqual(['Jan 28 23:17:00 within\n', 'Jan 28 23:17:30 within\n'], result)
+
+
 class ParallelGrepTestCase(unittest.TestCase):
     """Tests for parallel_grep."""
 
@@ -94,3 +94,37 @@ class TestFlutterInstance(unittest.TestCase):
         """ Test timestamps is expected. """
         self.assertEqual(self.flutter_instance.timestamp,
                          Timestamp('Jan 28 23:17:23.545000'))
+
+
+class TestFlutterToDataFrame(unittest.TestCase):
+    """ Test Flutter.to_dataframe. """
+    frame = flutter_utils.Flutter(TEST_FLUTTER_RAW).to_dataframe()
+
+    def test_columns(self):
+        """ Test columns are the timestamp, flutter type and sorted headers. """
+        self.assertEqual(list(self.frame.columns),
+                         ['timestamp', 'flutter_type', 'connection_id', 'count', 'tcpi_rcv_space'])
+
+    def test_categorical(self):
+        """ Test timestamp and flutter_type are categorical. """
+        self.assertEqual(str(self.frame['timestamp'].dtype), 'category')
+        self.assertEqual(str(self.frame['flutter_type'].dtype), 'category')
+        self.assertEqual(self.frame['timestamp'].tolist(),
+                         [Timestamp('Jan 28 23:17:23.545000')] * 2 + [Timestamp('Jan 28 23:20:23.545000')] * 2)
+
+    def test_numeric(self):
+        """ Test numeric columns are converted. """
+        self.assertEqual(str(self.frame['count'].dtype), 'int64')
+        self.assertEqual(self.frame['connection_id'].tolist(), [0, 8291, 0, 8291])
+
+    def test_not_numeric(self):
+        """ Test columns with text values are kept as str. """
+        lines = [
+            'Jan 28 23:17:23.545 000000000CE4 C      flutter ->dump(svc::example)\r\n',
+            'Jan 28 23:17:23.545 000000000CE4 I          flutter     name   value\r\n',
+            'Jan 28 23:17:23.545 000000000CE4 I          flutter     first   1.5\r\n',
+            'Jan 28 23:17:23.545 000000000CE4 I          flutter     second\r\n',
+            'Jan 28 23:17:23.545 000000000CE4 C      flutter <-dump\r\n']
+        frame = flutter_utils.Flutter([lines]).to_dataframe()
+        self.assertEqual(frame['name'].tolist(), ['first', 'second'])
+        self.assertEqual(str(frame['value'].dtype), 'float64')
@@ -193,6 +193,32 @@ class AutoScaleTestCase(unittest.TestCase):
             self.assertEqual(result, after[index], msg=msg)
 
 
+class AutoScaleValuesTestCase(unittest.TestCase):
+    """Unit tests for auto_scale_values."""
+
+    def test_nan(self):
+        """Test a numpy.nan value."""
+        self.assertEqual(format_utils.auto_scale_values([nan, 1000], 'bytes'), ['0.00 B', '1.00 KB'])
+
+    def test_value_with_units(self):
+        """Test values with units being converted to their highest scale."""
+        before = ('1000MB', '102233.2 KB', 10.7, '11.4B')
+        after = ['1.00 GB', '102.23 MB', '10.70 B', '11.40 B']
+        self.assertEqual(format_utils.auto_scale_values(before, 'bytes'), after)
+
+    def test_same_as_auto_scale(self):
+        """Each value is scaled the same as auto_scale."""
+        before = (0, 1098.7, 1024.0, 1048575.99, 23423423.723423, 1e+15)
+        for unit_type in ('bytes', 'bits', 'binary_bytes', 'bandwidth'):
+            expected = [format_utils.auto_scale(value, unit_type) for value in before]
+            self.assertEqual(format_utils.auto_scale_values(before, unit_type), expected)
+
+    def test_unknown_scale(self):
+        """Test an unknown unit_type."""
+        with self.assertRaises(IndexError):
+            format_utils.auto_scale_values([1], 'fake')
+
+
 class ConvertToUnitTestCase(unittest.TestCase):
     """Unit tests for convert_to_unit."""
 
@@ -44,3 +44,24 @@ class SafeDivideTestCase(unittest.TestCase):
         self.assertEqual(result, 5., msg='Division 10/2 failed.')
         result = math_utils.safe_divide(-10, 7)
         self.assertEqual(result, -1.43, msg='Division -10/7 failed')
+
+
+class SafeDivideValuesTestCase(unittest.TestCase):
+    """Unit tests for safe_divide_values."""
+
+    def test_with_zero(self):
+        """Division by zero is 0."""
+        result = math_utils.safe_divide_values([1, 0, 10], [0, 1, 0])
+        self.assertEqual(result.tolist(), [0., 0., 0.])
+
+    def test_same_as_safe_divide(self):
+        """Each result is the same as safe_divide; including values which are near a half when rounded."""
+        numerators = [10, -10, 1.005, 2.675, 12345.6789, 0.125]
+        denominators = [2, 7, 1, 1, 1024, 1]
+        expected = [math_utils.safe_divide(num, den) for num, den in zip(numerators, denominators)]
+        self.assertEqual(math_utils.safe_divide_values(numerators, denominators).tolist(), expected)
+
+    def test_single_denominator(self):
+        """A single denominator divides every numerator."""
+        result = math_utils.safe_divide_values([1000, 1500, 10], 1000)
+        self.assertEqual(result.tolist(), [1., 1.5, 0.01])
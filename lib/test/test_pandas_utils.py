@@ -2,6 +2,9 @@
 
 import unittest
 
+import numpy
+import pandas
+
 from pandas import DataFrame
 from photon.lib import pandas_utils
 from photon.lib import time_utils
@@ -104,3 +107,92 @@ class SortByIndexAndColumnsTestCase(unittest.TestCase):
                     'c': {0: 0, 1: 0, 2: 1}}
         result = pandas_utils.sort_by_index_and_columns(frame, ['Timestamp']).to_dict()
         self.assertEqual(result, expected)
+
+
+class MergeSortedRunsTestCase(unittest.TestCase):
+    """Unit tests for merge_sorted_runs."""
+
+    def test_empty_frame(self):
+        """Test what happens with an empty DataFrame."""
+        result = pandas_utils.merge_sorted_runs(DataFrame({}), 'a').to_dict('list')
+        self.assertEqual({}, result)
+
+    def test_field_not_in_frame(self):
+        """Test what happens when the column is not in the DataFrame."""
+        with self.assertRaises(KeyError):
+            pandas_utils.merge_sorted_runs(DataFrame({'a': [1, 2, 3]}), 'b')
+
+    def test_runs(self):
+        """Test merging stacked runs which are each sorted; equal values keep their stacked order."""
+        frame = DataFrame({'a': [1, 3, 5, 2, 3, 4, 0], 'b': ['x1', 'x3', 'x5', 'y2', 'y3', 'y4', 'z0']},
+                          index=[0, 1, 2, 0, 1, 2, 0])
+        expected = {'a': [0, 1, 2, 3, 3, 4, 5], 'b': ['z0', 'x1', 'y2', 'x3', 'y3', 'y4', 'x5']}
+        result = pandas_utils.merge_sorted_runs(frame, 'a')
+        self.assertEqual(expected, result.to_dict('list'))
+        self.assertEqual(list(range(7)), result.index.tolist())
+
+    def test_single_run(self):
+        """Test a frame which is already sorted; it is kept as is, with a new index."""
+        frame = DataFrame({'a': [1, 1, 2]}, index=[5, 3, 4])
+        result = pandas_utils.merge_sorted_runs(frame, 'a')
+        self.assertEqual({'a': [1, 1, 2]}, result.to_dict('list'))
+        self.assertEqual([0, 1, 2], result.index.tolist())
+        self.assertEqual([5, 3, 4], frame.index.tolist())
+
+    def test_many_runs(self):
+        """Test an odd number of Timestamp runs against a stable sort."""
+        runs = [sorted(numpy.random.randint(0, 50, size=size)) for size in (7, 1, 12, 3, 9)]
+        timestamps = pandas.to_datetime(numpy.concatenate(runs), unit='s')
+        frame = DataFrame({'Timestamp': timestamps, 'b': range(len(timestamps))})
+        expected = frame.iloc[numpy.argsort(frame['Timestamp'].values, kind='mergesort')]
+        result = pandas_utils.merge_sorted_runs(frame, 'Timestamp')
+        self.assertEqual(expected['b'].tolist(), result['b'].tolist())
+
+
+class ResampleGrouperTestCase(unittest.TestCase):
+    """Unit tests for ResampleGrouper and get_resample_grouper."""
+
+    def setUp(self):
+        """Reset testing parameters."""
+        timestamps = pandas.to_datetime(['2019-01-01 23:58:10', '2019-01-01 23:58:50', '2019-01-02 00:03:05',
+                                         '2019-01-02 00:03:30'])
+        self.frame = DataFrame({'Timestamp': timestamps, 'controller': ['CT0', 'CT1', 'CT0', 'CT1'],
+                                'a': [1., 2., 3., None], 'b': [4., 5., 6., 7.]})
+
+    def test_floor_timestamps(self):
+        """Timestamps are zeroed out below the frequency."""
+        result = pandas_utils.floor_timestamps(self.frame['Timestamp'], '5min')
+        self.assertEqual(str(result[0]), '2019-01-01 23:58:00')
+        result = pandas_utils.floor_timestamps(self.frame['Timestamp'], '1D')
+        self.assertEqual(str(result[3]), '2019-01-02 00:00:00')
+
+    def test_same_as_resample_frame(self):
+        """Each operation gives the same results as resample_frame."""
+        grouper = pandas_utils.ResampleGrouper(self.frame['Timestamp'], '1min')
+        for operation in ('last', 'mean', 'sum', 'max'):
+            expected = getattr(pandas_utils.resample_frame(self.frame.copy(), '1min'), operation)()
+            result = grouper.aggregate(self.frame, operation)
+            # The resampled index has a freq, which the grouped index does not; so only compare the index values.
+            self.assertEqual(result.index.tolist(), expected.index.tolist())
+            pandas.testing.assert_frame_equal(result[['a', 'b']].reset_index(drop=True),
+                                              expected[['a', 'b']].reset_index(drop=True))
+
+    def test_operations_per_column(self):
+        """Several aggregations are done in one pass."""
+        grouper = pandas_utils.ResampleGrouper(self.frame['Timestamp'], '5min')
+        result = grouper.aggregate(self.frame, {'a': 'mean', 'b': 'sum'})
+        self.assertEqual(list(result.index.astype(str)), ['2019-01-01 23:55:00', '2019-01-02 00:00:00'])
+        self.assertEqual(result.to_dict('list'), {'a': [1.5, 3.], 'b': [9., 13.]})
+
+    def test_unknown_operation(self):
+        """An operation which is not a resampling operation."""
+        grouper = pandas_utils.ResampleGrouper(self.frame['Timestamp'], '1min')
+        with self.assertRaises(ValueError):
+            grouper.aggregate(self.frame, 'fake')
+
+    def test_cached(self):
+        """Frames with the same Timestamps share one grouper."""
+        grouper = pandas_utils.get_resample_grouper(self.frame['Timestamp'], '1min')
+        self.assertIs(pandas_utils.get_resample_grouper(self.frame['Timestamp'].copy(), '1min'), grouper)
+        self.assertIsNot(pandas_utils.get_resample_grouper(self.frame['Timestamp'], '5min'), grouper)
+        self.assertIsNot(pandas_utils.get_resample_grouper(self.frame['Timestamp'][:2], '1min'), grouper)
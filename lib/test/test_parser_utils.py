@@ -223,3 +223,125 @@ class TestParallelLogParser(unittest.TestCase):
         self.assertEqual(expected, result)
 
     # TODO: PT-2153 - Additional testing: regex_in_intervals, pull_from_regex.
+
+
+class TestRunLengthValues(unittest.TestCase):
+    """Unit tests for RunLengthValues."""
+
+    def test_runs(self):
+        """Consecutive values with the same key are stored once."""
+        values = parser_utils.RunLengthValues()
+        values.append(1, {'a': 1}, 'hash1')
+        values.append(2, {'a': 1}, 'hash1')
+        values.append(3, {'a': 2}, 'hash2')
+        values.append(4, {'a': 2})
+        self.assertEqual(3, len(values.runs))
+        self.assertEqual(4, len(values))
+        self.assertEqual([(1, {'a': 1}), (2, {'a': 1}), (3, {'a': 2}), (4, {'a': 2})], values)
+        self.assertIs(values[0][1], values[1][1])
+
+    def test_getitem(self):
+        """Indexes are found within the runs; like indexing the expanded list."""
+        values = parser_utils.RunLengthValues()
+        values.append(1, 'a', 'hash1')
+        values.append(2, 'a', 'hash1')
+        values.append(3, 'b', 'hash2')
+        self.assertEqual((2, 'a'), values[1])
+        self.assertEqual((3, 'b'), values[-1])
+        self.assertEqual([(2, 'a'), (3, 'b')], values[1:])
+        with self.assertRaises(IndexError):
+            values[3]
+
+    def test_append_shared(self):
+        """Each run gets its own copy of a shared value; which is only built once."""
+        shared = parser_utils.SharedValues(max_size=10)
+        calls = []
+        build = lambda: calls.append(1) or ['vol1']
+        values = parser_utils.RunLengthValues()
+        values.append_shared(1, 'hash1', shared, build)
+        values.append_shared(2, 'hash1', shared, build)
+        values.append_shared(3, 'hash2', shared, lambda: ['vol2'])
+        values.append_shared(4, 'hash1', shared, build)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(3, len(values.runs))
+        self.assertIs(values[0][1], values[1][1])
+        self.assertIsNot(values[0][1], values[3][1])
+        self.assertEqual(values[0][1], values[3][1])
+
+    def test_to_frame(self):
+        """Each timestamp gets a row, with the value of its run."""
+        values = parser_utils.RunLengthValues()
+        values.append(1, {'a': 1}, 'hash1')
+        values.append(2, {'a': 1}, 'hash1')
+        values.append(3, {'a': 2}, 'hash2')
+        frame = values.to_frame('field')
+        self.assertEqual([1, 2, 3], frame['Timestamp'].tolist())
+        self.assertEqual([{'a': 1}, {'a': 1}, {'a': 2}], frame['field'].tolist())
+
+    def test_empty(self):
+        """No values are falsy, like an empty list."""
+        self.assertFalse(parser_utils.RunLengthValues())
+
+
+class TestSharedValues(unittest.TestCase):
+    """Unit tests for SharedValues."""
+
+    def test_build_once(self):
+        """Values are only built when we don't already have them."""
+        shared = parser_utils.SharedValues(max_size=10)
+        calls = []
+        build = lambda: calls.append(1) or len(calls)
+        self.assertEqual(1, shared.get('key', build))
+        self.assertEqual(1, shared.get('key', build))
+        self.assertEqual(1, len(calls))
+
+    def test_copies(self):
+        """Changing a value which was given out does not change the cached value."""
+        shared = parser_utils.SharedValues(max_size=10)
+        value = shared.get('key', lambda: {'vol1': [1]})
+        value['vol1'].append(2)
+        self.assertEqual({'vol1': [1]}, shared.get('key', lambda: None))
+
+    def test_max_size(self):
+        """The least recently used values are dropped."""
+        shared = parser_utils.SharedValues(max_size=2)
+        shared.get('a', lambda: 1)
+        shared.get('b', lambda: 2)
+        shared.get('a', lambda: 1)
+        shared.get('c', lambda: 3)
+        self.assertIn('a', shared)
+        self.assertNotIn('b', shared)
+        self.assertEqual(2, len(shared))
+
+    def test_content_hash(self):
+        """Lines with the same content have the same hash."""
+        self.assertEqual(parser_utils.content_hash(['a', 'b']), parser_utils.content_hash(['a', 'b']))
+        self.assertNotEqual(parser_utils.content_hash(['a', 'b']), parser_utils.content_hash(['ab']))
+
+
+class TestTimestampLines(unittest.TestCase):
+    """Unit tests for timestamp_lines."""
+
+    def test_same_as_per_line(self):
+        """Each line has the same timestamp as time_utils.get_timestamp_from_line gives it."""
+        lines = [
+            'Mar  5 12:00:01.123 host core[1]: event',
+            '2018 Apr 1 01:02:03 host core[1]: event',
+            'Jun 7 01:02:03.1234567891 host core[1]: event',
+            'not a timestamp',
+        ]
+        table = parser_utils.timestamp_lines(lines)
+        expected = [time_utils.get_timestamp_from_line(line) for line in lines]
+        self.assertEqual(table['Timestamp'].tolist(), expected)
+        self.assertEqual(table['line'].tolist(), lines)
+
+    def test_invalid(self):
+        """Lines without a timestamp get the INVALID_TIMESTAMP."""
+        table = parser_utils.timestamp_lines(['', 'no timestamp here'])
+        self.assertEqual(table['Timestamp'].tolist(), [time_utils.INVALID_TIMESTAMP] * 2)
+
+    def test_empty(self):
+        """No lines give an empty table."""
+        table = parser_utils.timestamp_lines([])
+        self.assertTrue(table.empty)
+        self.assertEqual(list(table.columns), ['Timestamp', 'line'])
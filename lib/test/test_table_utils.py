@@ -0,0 +1,85 @@
+"""Unit tests for lib/table_utils."""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from photon.lib import table_utils
+
+LINES = [
+    'Name     Host Group  Size   Serial',
+    '-------------------------------------',
+    'vol1     hg1         1T     ABC1',
+    'vol2                 500G   ABC2',
+    '',
+    'vol3     hg2            2T  ABC3',
+]
+
+
+class FindColumnsTestCase(unittest.TestCase):
+    """Unit tests for find_columns."""
+
+    def test_default_headers(self):
+        """Headers are separated by 2 or more spaces."""
+        expected = [('Name', 0, 4), ('Host Group', 9, 19), ('Size', 21, 25), ('Serial', 28, 34)]
+        self.assertEqual(table_utils.find_columns(LINES[0]), expected)
+
+    def test_given_headers(self):
+        """Only the given headers are used as columns."""
+        expected = [('Name', 0, 4), ('Size', 21, 25)]
+        self.assertEqual(table_utils.find_columns(LINES[0], ['Name', 'Size']), expected)
+
+    def test_missing_header(self):
+        """A header which is not in the header line raises a ValueError."""
+        with self.assertRaises(ValueError):
+            table_utils.find_columns(LINES[0], ['Name', 'Missing'])
+
+
+class SplitTableTestCase(unittest.TestCase):
+    """Unit tests for split_table."""
+
+    def test_split(self):
+        """Blank and separator lines are skipped and blank cells are None."""
+        names, columns = table_utils.split_table(LINES)
+        self.assertEqual(names, ['Name', 'Host Group', 'Size', 'Serial'])
+        self.assertEqual(columns, [['vol1', 'vol2', 'vol3'], ['hg1', None, 'hg2'], ['1T', '500G', '2T'],
+                                   ['ABC1', 'ABC2', 'ABC3']])
+
+    def test_overflow(self):
+        """A value which is wider than its column is split on 2 or more spaces."""
+        lines = ['Name  Size', 'vol1  1T', 'long_volume_name  2T']
+        self.assertEqual(table_utils.split_table(lines)[1], [['vol1', 'long_volume_name'], ['1T', '2T']])
+
+    def test_empty(self):
+        """A table without rows has empty columns."""
+        self.assertEqual(table_utils.split_table(LINES[:2]), (['Name', 'Host Group', 'Size', 'Serial'],
+                                                              [[], [], [], []]))
+        self.assertEqual(table_utils.split_table([]), ([], []))
+
+
+class ParseTableTestCase(unittest.TestCase):
+    """Unit tests for parse_table."""
+
+    def test_parse(self):
+        """Each header is a column of str values."""
+        result = table_utils.parse_table(LINES)
+        self.assertEqual(list(result.columns), ['Name', 'Host Group', 'Size', 'Serial'])
+        self.assertEqual(result['Host Group'].tolist(), ['hg1', None, 'hg2'])
+        self.assertEqual(result['Size'].tolist(), ['1T', '500G', '2T'])
+
+    def test_given_headers(self):
+        """Each given header's column runs until the next given header."""
+        result = table_utils.parse_table(LINES, headers=['Name', 'Size'])
+        self.assertEqual(result['Name'].tolist(), ['vol1     hg1', 'vol2', 'vol3     hg2'])
+
+    def test_join_wrapped(self):
+        """Rows without a first value are joined to the previous row."""
+        lines = [
+            'Name  Description',
+            'vol1  first part',
+            '      second part',
+            'vol2  other',
+        ]
+        result = table_utils.parse_table(lines, join_wrapped=True)
+        self.assertEqual(result.to_dict('list'), {'Name': ['vol1', 'vol2'],
+                                                  'Description': ['first part second part', 'other']})
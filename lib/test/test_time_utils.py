@@ -279,6 +279,27 @@ class TimeframeTestCase(unittest.TestCase):
         ]
         self.assertEqual(expected, result)
 
+    def test_filter_logs_within_file(self):
+        """Test filtering log files by a range which is within a single log file."""
+        time_frame = time_utils.Timeframe(start='2018-01-01 01:20:00', end='2018-01-01 01:30:00', granularity='1min')
+        result = time_frame.filter_logs_by_time(self.log_files)
+        expected = [
+            '/logs/domain.com/array-ct0/2018_01_01/array_info.json.gz',
+            'diagnostics.log-2018010101.gz',
+            'hardware.log-2018010100.gz',
+        ]
+        self.assertEqual(expected, result)
+
+    def test_time_index(self):
+        """Test that times are only generated when used, and are the same as the listed times."""
+        timeframe = time_utils.Timeframe('2018-01-01', '2018-01-08', granularity='1s')
+        self.assertIsNone(timeframe._times)
+        self.assertEqual(len(timeframe.time_index), 7 * 24 * 3600 + 1)
+        self.assertIsNone(timeframe._time_list)
+        timeframe = time_utils.Timeframe(START, END, from_start=False, granularity='60s')
+        self.assertEqual(list(timeframe.time_index), timeframe.times)
+        self.assertEqual(list(timeframe.date_index), timeframe.dates)
+
     def test_generate_interval_times(self):
         """Ensure that when we do from_start that we get the same times."""
         timeframe_from_start = time_utils.Timeframe(START, END, from_start=True, granularity='60s')
@@ -514,6 +535,130 @@ class TestGetTimestampFromLine(unittest.TestCase):
         self.assertEqual(time_utils.get_timestamp_from_line(line), expected)
 
 
+class TestGetLineTimeKey(unittest.TestCase):
+    """Unit tests for get_line_time_key."""
+    reference = time_utils.Timestamp('2019-01-17 00:00:00')
+
+    def test_syslog_timestamp(self):
+        """Test a year-less timestamp with and without milliseconds."""
+        self.assertEqual(time_utils.get_line_time_key('Jan 17 00:16:32.123 line', self.reference),
+                         '2019-01-17 00:16:32.123')
+        self.assertEqual(time_utils.get_line_time_key('Jan  7 00:16:32 line', self.reference),
+                         '2019-01-07 00:16:32')
+
+    def test_previous_year(self):
+        """A December line near a January reference should belong to the previous year."""
+        self.assertEqual(time_utils.get_line_time_key('Dec 31 23:59:59 line', self.reference),
+                         '2018-12-31 23:59:59')
+
+    def test_explicit_years(self):
+        """Test timestamps which include a full or a short year."""
+        self.assertEqual(time_utils.get_line_time_key('2017 Jan 17 00:16:32 line'), '2017-01-17 00:16:32')
+        self.assertEqual(time_utils.get_line_time_key('Dec 10 17 23:18:02 [monitord:WARNING]'),
+                         '2017-12-10 23:18:02')
+        self.assertEqual(time_utils.get_line_time_key('Tue Jan 16 23:19:55 CST 2018', self.reference),
+                         '2018-01-16 23:19:55')
+        self.assertEqual(time_utils.get_line_time_key('Tue Jan 16 23:19:55 2018', self.reference),
+                         '2018-01-16 23:19:55')
+
+    def test_number_after_time(self):
+        """A number after a year-less timestamp without a weekday is not a year."""
+        self.assertEqual(time_utils.get_line_time_key('Jan 16 23:19:55 2048 bytes', self.reference),
+                         '2019-01-16 23:19:55')
+
+    def test_iso_timestamp(self):
+        """Test an ISO formatted timestamp."""
+        self.assertEqual(time_utils.get_line_time_key('2018-01-16 23:19:54 CST line'), '2018-01-16 23:19:54')
+
+    def test_no_timestamp(self):
+        """Test a line which does not begin with a timestamp."""
+        self.assertIsNone(time_utils.get_line_time_key('Just a line with no stamp.'))
+
+    def test_timeframe_keys(self):
+        """Keys from a Timeframe should compare against keys from lines."""
+        timeframe = time_utils.Timeframe('2019-01-17 00:16:00', '2019-01-17 00:17:00', granularity='1s')
+        start_key, end_key = timeframe.line_key_range()
+        line_key = time_utils.get_line_time_key('Jan 17 00:16:32.000 line', self.reference)
+        self.assertTrue(start_key <= line_key <= end_key)
+
+
+class _CountingTimestampParser(time_utils.TimestampParser):
+    """A TimestampParser which counts how many timestamps it reads."""
+
+    def __init__(self, reference=None):
+        super(_CountingTimestampParser, self).__init__(reference)
+        self.calls = 0
+
+    def to_nanoseconds(self, value):
+        self.calls += 1
+        return super(_CountingTimestampParser, self).to_nanoseconds(value)
+
+
+class TestTimestampParser(unittest.TestCase):
+    """Unit tests for TimestampParser and parse_timestamps."""
+    parser = time_utils.TimestampParser(time_utils.Timestamp('2019-01-17 00:00:00'))
+
+    def test_known_formats(self):
+        """Each known format is read like pandas would read it with a year."""
+        self.assertEqual(self.parser.parse('Jan 17 00:16:32.123'), pandas.Timestamp('2019-01-17 00:16:32.123'))
+        self.assertEqual(self.parser.parse('2017 Jan  7 00:16:32'), pandas.Timestamp('2017-01-07 00:16:32'))
+        self.assertEqual(self.parser.parse('2018-01-16 23:19:54 CST'), pandas.Timestamp('2018-01-16 23:19:54'))
+        self.assertEqual(self.parser.parse('2018011623'), pandas.Timestamp('2018-01-16 23:00:00'))
+        self.assertEqual(self.parser.parse('2018_01_16-23'), pandas.Timestamp('2018-01-16 23:00:00'))
+
+    def test_previous_year(self):
+        """A year-less December timestamp near a January reference belongs to the previous year."""
+        self.assertEqual(self.parser.parse('Dec 31 23:59:59'), pandas.Timestamp('2018-12-31 23:59:59'))
+
+    def test_same_as_timestamp(self):
+        """Without a reference, timestamps are read exactly like Timestamp reads them."""
+        parser = time_utils.TimestampParser()
+        values = ['Jan 17 00:16:32.1234567', 'Feb  3 11:22:33', '2018-01-16 23:19:54.25 PDT', '2018010100']
+        for value in values:
+            self.assertEqual(parser.parse(value), time_utils.Timestamp(value))
+
+    def test_unknown_formats(self):
+        """Timestamps which are not in a known format (or are not valid) are left to Timestamp."""
+        self.assertIsNone(self.parser.to_nanoseconds('Thursday, April 19, 2018 10:04:05 PM'))
+        self.assertIsNone(self.parser.to_nanoseconds('Foo 17 00:16:32'))
+        self.assertIsNone(self.parser.to_nanoseconds('2018 Feb 30 00:16:32'))
+        self.assertEqual(self.parser.parse('2018-01-16T23:19:54'), pandas.Timestamp('2018-01-16 23:19:54'))
+
+    def test_parse_timestamps(self):
+        """The batch API gives datetime64 values; with NaT for empty values."""
+        result = time_utils.parse_timestamps(['Jan 17 00:16:32', None, '2018-01-16 23:19:54'],
+                                             time_utils.Timestamp('2019-01-17'))
+        self.assertEqual(result.dtype, numpy.dtype('datetime64[ns]'))
+        self.assertEqual(pandas.Timestamp(result[0]), pandas.Timestamp('2019-01-17 00:16:32'))
+        self.assertTrue(numpy.isnat(result[1]))
+        self.assertEqual(pandas.Timestamp(result[2]), pandas.Timestamp('2018-01-16 23:19:54'))
+
+    def test_parse_many_repeats(self):
+        """Each distinct timestamp is only read once; repeats are mapped back to their position."""
+        parser = _CountingTimestampParser(time_utils.Timestamp('2019-01-17'))
+        values = ['Jan 17 00:16:32', 'Jan 17 00:16:33', None, 'Jan 17 00:16:32', '', 'Jan 17 00:16:33']
+        result = parser.parse_many(pandas.Series(values))
+        self.assertEqual(parser.calls, 3)
+        expected = ['2019-01-17 00:16:32', '2019-01-17 00:16:33', None, '2019-01-17 00:16:32', None,
+                    '2019-01-17 00:16:33']
+        self.assertEqual(list(pandas.to_datetime(expected).values.astype('int64')), list(result.astype('int64')))
+        self.assertEqual(len(parser.parse_many([])), 0)
+
+    def test_date_cache_size(self):
+        """Only up to DATE_CACHE_SIZE dates are kept; dates which were dropped are read again."""
+        parser = time_utils.TimestampParser(time_utils.Timestamp('2019-01-17'))
+        values = ['2019-01-{:02d} 00:16:32 UTC'.format(day) for day in range(1, 29)]
+        cache_size = time_utils.DATE_CACHE_SIZE
+        time_utils.DATE_CACHE_SIZE = 10
+        try:
+            result = parser.parse_many(pandas.Series(values + values))
+        finally:
+            time_utils.DATE_CACHE_SIZE = cache_size
+        self.assertLessEqual(len(parser._dates), 10)
+        expected = [value.replace(' UTC', '') for value in values + values]
+        self.assertEqual(list(pandas.to_datetime(expected).values.astype('int64')), list(result.astype('int64')))
+
+
 class ToEpochTimeTestCase(unittest.TestCase):
     """Unit tests for to_epoch_time."""
     ts_obj = time_utils.Timestamp('Thursday, April 19, 2018 10:04:05 PM')
@@ -670,6 +815,45 @@ class GetTimestampFromFilesTestCase(unittest.TestCase):
         self.assertEqual(expected, log_times)
 
 
+class ToDatetimeSeriesTestCase(unittest.TestCase):
+    """Unit tests for to_datetime_series."""
+
+    def test_timestamps(self):
+        """Timestamp objects and strings should become datetime64 values."""
+        values = [time_utils.Timestamp('2018-03-14 15:00:00'), '2018-03-14 16:00:00']
+        result = time_utils.to_datetime_series(values)
+        self.assertEqual('datetime64[ns]', str(result.dtype))
+        self.assertEqual([pandas.Timestamp('2018-03-14 15:00:00'), pandas.Timestamp('2018-03-14 16:00:00')],
+                         result.tolist())
+
+    def test_log_dates(self):
+        """Log dates which pandas cannot read should be handled like Timestamp does."""
+        result = time_utils.to_datetime_series(['2018_03_14-15'])
+        self.assertEqual([pandas.Timestamp('2018-03-14 15:00:00')], result.tolist())
+
+
+class IntervalsTestCase(unittest.TestCase):
+    """Unit tests for merge_intervals, intersect_intervals, and subtract_intervals."""
+
+    def test_merge_intervals(self):
+        """Overlapping and touching intervals should be combined."""
+        intervals = [(5, 7), (1, 3), (2, 4), (7, 8), (10, 11)]
+        self.assertEqual([(1, 4), (5, 8), (10, 11)], time_utils.merge_intervals(intervals))
+
+    def test_intersect_intervals(self):
+        """Only the overlapping parts of both sets should be kept."""
+        first = [(1, 5), (8, 12)]
+        second = [(3, 9), (11, 20)]
+        self.assertEqual([(3, 5), (8, 9), (11, 12)], time_utils.intersect_intervals(first, second))
+        self.assertEqual([], time_utils.intersect_intervals(first, []))
+
+    def test_subtract_intervals(self):
+        """Gaps should be everything in the range which is not covered."""
+        self.assertEqual([(0, 10)], time_utils.subtract_intervals(0, 10, []))
+        self.assertEqual([(0, 2), (4, 6)], time_utils.subtract_intervals(0, 10, [(2, 4), (6, 12)]))
+        self.assertEqual([], time_utils.subtract_intervals(0, 10, [(-1, 11)]))
+
+
 class TestGetTimestampFromLogPath(unittest.TestCase):
     """Unit test for get_timestamp_from_log_path."""
 
@@ -725,6 +909,26 @@ class TestScaleLatency(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class TestScaleLatencyValues(unittest.TestCase):
+    """Unit tests for scale_latency_values."""
+
+    def test_auto_scale_values(self):
+        """Each value is scaled to its own greatest whole unit."""
+        values = [0.0005, 0.5, 1, 100, 1000000, 100000000]
+        expected = ['500.00 us', '500.00 ms', '1.00 s', '1.67 m', '11.57 d', '3.17 y']
+        self.assertEqual(time_utils.scale_latency_values(values, base_unit='seconds'), expected)
+
+    def test_scale_to_unit(self):
+        """All values are scaled to a static unit."""
+        values = numpy.array([1, 100, 1000])
+        expected = ['0.02 m', '1.67 m', '16.67 m']
+        self.assertEqual(time_utils.scale_latency_values(values, 'seconds', display_unit='minutes'), expected)
+
+    def test_zero(self):
+        """A 0 latency has no whole unit; so it is shown in nanoseconds."""
+        self.assertEqual(time_utils.scale_latency_values([0], 'milliseconds'), ['0.00 ns'])
+
+
 class TestToRawLatency(unittest.TestCase):
     """Unit tests for to_raw_latency."""
 
@@ -80,6 +80,10 @@ def mock_api(real_api, *args, **kwargs):
             result['Timestamp'] = self.data_set['Timestamp']
             return pandas.DataFrame(result)
 
+        def get_latest_fields(self, fields, controllers=('CT0', 'CT1')):
+            """Helper to simplify testing; the static data set is also used for the latest values."""
+            return self.get_fields(fields)
+
         def set_value(self, controller, key, value):
             """Set a value the given controller, automatically add a timestamp."""
             self.data_set = self.data_set.append({key: value,
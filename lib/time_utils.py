@@ -6,7 +6,9 @@ import datetime
 import logging
 import os
 import re
+import time
 
+import numpy
 import pandas
 import pytz
 
@@ -33,6 +35,8 @@ from photon.lib import format_utils
 from photon.lib import math_utils
 from photon.lib import validation_utils
 
+# How many dates each TimestampParser keeps the start of; it starts over once it has this many.
+DATE_CACHE_SIZE = 1024
 DELTA_SHORT_NAMES = {
     'nanoseconds': 'ns',
     'microseconds': 'us',
@@ -43,11 +47,36 @@ DELTA_SHORT_NAMES = {
     'days': 'd',
     'years': 'y',
 }
+EPOCH_DATE = datetime.date(1970, 1, 1)
 INVALID_TIMESTAMP = pandas.Timestamp('Jan 1 1970 00:00:00')
+# Timestamps like '2018-01-01 12:00:00 PDT' (as dateutil reads them, the time zone name is dropped):
+ISO_TZ_TIMESTAMP = re.compile(r'(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2}) (?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})(?:\.(?P<fraction>\d+))? (?P<tz>[A-Z]{3,5})$')
+# Log dates with an hour; i.e. in log names like '2018010112' or paths like '2018_01_01-12':
+LOG_DATE_HOUR = re.compile(r'(?P<year>\d{4})(?P<month>\d{2})(?P<day>\d{2})(?P<hour>\d{2})$|(?P<path_year>\d{4})_(?P<path_month>\d{2})_(?P<path_day>\d{2})-(?P<path_hour>\d{2})$')
+# Timestamps like 'Tue Jan 16 23:19:55 CST 2018' (i.e. from the date command) have a trailing year after the weekday.
+LINE_TIME_PREFIX = re.compile(r'(?:(?P<iso_date>\d{4}-\d{2}-\d{2})[ T](?P<iso_time>\d{2}:\d{2}:\d{2}(?:\.\d+)?)|(?P<weekday>[A-Z][a-z]{2}\s+)?(?:(?P<year>\d{4})\s+)?(?P<month>[A-Z][a-z]{2})\s+(?P<day>\d{1,2})\s+(?:(?P<short_year>\d{2})\s+)?(?P<time>\d{2}:\d{2}:\d{2}(?:\.\d+)?)(?:(?:\s+[A-Z]{2,5})?\s+(?P<trailing_year>\d{4})(?!\d))?)')
+# Latency units from the biggest to the smallest; and how many nanoseconds are in one of each.
+LATENCY_SCALES = ('years', 'days', 'hours', 'minutes', 'seconds', 'milliseconds', 'microseconds', 'nanoseconds')
+LATENCY_NANOSECONDS = {
+    'years': 365 * 24 * 3600 * 10 ** 9,
+    'days': 24 * 3600 * 10 ** 9,
+    'hours': 3600 * 10 ** 9,
+    'minutes': 60 * 10 ** 9,
+    'seconds': 10 ** 9,
+    'milliseconds': 10 ** 6,
+    'microseconds': 10 ** 3,
+    'nanoseconds': 1,
+}
 LOGGER = logging.getLogger(__name__)
+MONTH_NUMBERS = {'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+                 'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12}
 # pylint: disable=line-too-long
 OPTIONAL_DATE_MS = re.compile(r'(((?P<year>\d{4})\s+)?(?P<month>[A-Z][a-z]{2})\s+(?P<day>\d+)\s+(?P<hms>\d{2}:\d{2}:\d{2}))(\.(?P<millisecond>\d+))?')
 SETTINGS = config_utils.get_settings()  # type: Dict[str, Any]
+# Timestamps like 'Jan  1 12:00:00.123' or '2018 Jan  1 12:00:00':
+SYSLOG_TIMESTAMP = re.compile(r'(?:(?P<year>\d{4})\s+)?(?P<month>[A-Z][a-z]{2})\s+(?P<day>\d{1,2})\s+(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})(?:\.(?P<fraction>\d+))?$')
+# Time zone names which dateutil does not drop; these are left to pandas/dateutil.
+ZONE_AWARE_NAMES = frozenset(['UTC', 'GMT', 'Z'] + list(time.tzname))
 
 # TODO: PT-2373 - Subclass better so we can override rich comparisons.
 class Timestamp(pandas.Timestamp):
@@ -75,6 +104,11 @@ class Timestamp(pandas.Timestamp):
                 raise TypeError(error_msg)
         else:
             if isinstance(timestamp, string_types):
+                if not kwargs:
+                    # Most log timestamps are in a known format, which is much cheaper to read ourselves.
+                    nanoseconds = TIMESTAMP_PARSER.to_nanoseconds(timestamp)
+                    if nanoseconds is not None:
+                        return super(Timestamp, cls).__new__(cls, nanoseconds)
                 # Pandas Timestamp can't parse log dates like "2018_01_01"
                 timestamp = timestamp.replace('_', '/')
                 # Also add support for log_time with hour like "2018_01_01-12"
@@ -101,6 +135,117 @@ class Timestamp(pandas.Timestamp):
                     dt_obj = dt_obj.replace(year=year)
                 return super(Timestamp, cls).__new__(cls, dt_obj, **kwargs)
 
+
+class TimestampParser(object):
+    """Read the known log timestamp formats without pandas or dateutil; in bulk or one at a time.
+
+    The known formats are 'Mon DD HH:MM:SS[.ffffff]' (with or without a leading year), 'YYYY-MM-DD HH:MM:SS TZ',
+    'YYYYmmddHH' and 'YYYY_MM_DD-HH'; they are read as time_utils.Timestamp would read them.  The start of each date is
+    only computed once, as log lines share a handful of dates; up to DATE_CACHE_SIZE dates are kept.
+    """
+
+    def __init__(self, reference=None):
+        # type: (Optional[Any]) -> None
+        """
+        Arguments:
+            reference (Timestamp): A nearby time (i.e. the date of the log file) used to infer the year when a
+                timestamp does not have one.  The year which puts the timestamp closest to the reference is used.
+                * Defaults to the current year, like dateutil.
+        """
+        self.reference = Timestamp(reference) if reference is not None else None
+        self._dates = {}  # type: Dict[Tuple[Any, Any, Any], Optional[int]]
+
+    def _get_date_nanoseconds(self, year, month, day):
+        # type: (Optional[str], str, str) -> Optional[int]
+        """Get the start of a date in nanoseconds since the epoch; None if it is not a valid date."""
+        if not year and self.reference is None:
+            year = str(datetime.date.today().year)
+        key = (year, month, day)
+        if key in self._dates:
+            return self._dates[key]
+        month_number = int(month) if month.isdigit() else MONTH_NUMBERS.get(month, 0)
+        try:
+            year_number = int(year) if year else _infer_year(month_number, self.reference)
+            days = (datetime.date(year_number, month_number, int(day)) - EPOCH_DATE).days
+            nanoseconds = days * 86400 * 10 ** 9  # type: Optional[int]
+        except ValueError:
+            nanoseconds = None
+        if len(self._dates) >= DATE_CACHE_SIZE:
+            # Long lived parsers (or bad input) could see any number of dates; they are cheap to compute again.
+            self._dates.clear()
+        self._dates[key] = nanoseconds
+        return nanoseconds
+
+    def to_nanoseconds(self, value):
+        # type: (str) -> Optional[int]
+        """Read a timestamp in one of the known formats.
+
+        Arguments:
+            value (str): A timestamp string.
+
+        Returns:
+            The timestamp in nanoseconds since the epoch; None if it is not in a known format (or not a valid date).
+        """
+        match = SYSLOG_TIMESTAMP.match(value)
+        if not match:
+            match = ISO_TZ_TIMESTAMP.match(value)
+            if not match or match.group('tz') in ZONE_AWARE_NAMES:
+                match = LOG_DATE_HOUR.match(value)
+                if not match:
+                    return None
+                year, month, day, hour = [group for group in match.groups() if group]
+                date = self._get_date_nanoseconds(year, month, day)
+                if date is None or int(hour) > 23:
+                    return None
+                return date + int(hour) * 3600 * 10 ** 9
+        year, month, day, hour, minute, second, fraction = match.group('year', 'month', 'day', 'hour', 'minute',
+                                                                       'second', 'fraction')
+        date = self._get_date_nanoseconds(year, month, day)
+        hour, minute, second = int(hour), int(minute), int(second)
+        if date is None or hour > 23 or minute > 59 or second > 59:
+            return None
+        nanoseconds = date + (hour * 3600 + minute * 60 + second) * 10 ** 9
+        if fraction:
+            # Like dateutil, anything past microseconds is dropped.
+            nanoseconds += int(fraction[:6].ljust(6, '0')) * 1000
+        return nanoseconds
+
+    def parse(self, value):
+        # type: (str) -> pandas.Timestamp
+        """Read a single timestamp; any which are not in a known format are read by Timestamp."""
+        nanoseconds = self.to_nanoseconds(value)
+        if nanoseconds is None:
+            return Timestamp(value)
+        return pandas.Timestamp(nanoseconds)
+
+    def parse_many(self, values):
+        # type: (Any) -> numpy.ndarray
+        """Read many timestamps at once.
+
+        Arguments:
+            values (list/pandas.Series): Timestamp strings; None (or other empty values) become NaT.
+
+        Returns:
+            A numpy.ndarray of datetime64[ns]; any time zone aware timestamps are converted to UTC.
+        """
+        nat = numpy.datetime64('NaT').astype('int64')
+        # Log lines repeat the same timestamps, so only read each distinct one once; missing values have a code of -1.
+        codes, uniques = pandas.factorize(numpy.asarray(values, dtype=object))
+        parsed = numpy.empty(len(uniques) + 1, dtype='int64')
+        parsed[-1] = nat
+        for index, value in enumerate(uniques):
+            nanoseconds = self.to_nanoseconds(value) if isinstance(value, string_types) else None
+            if nanoseconds is None:
+                timestamp = Timestamp(value) if isinstance(value, string_types) and value else None
+                nanoseconds = timestamp.value if timestamp is not None else nat
+            parsed[index] = nanoseconds
+        return parsed[codes].view('datetime64[ns]')
+
+
+# Shared by Timestamp; year-less timestamps are in the current year.
+TIMESTAMP_PARSER = TimestampParser()
+
+
 # pylint: disable=super-on-old-class, no-member
 class Timedelta(pandas.Timedelta):
     """Wrapper around pandas.Timedelta with additional conversion methods."""
@@ -256,8 +401,11 @@ class Timeframe(object):
         self.from_latest = from_latest
         self._validate_input()
         self._from_start = from_start
-        self._times = date_range
-        self._dates = None
+        # The times and dates are only generated when they are used; Timestamp objects only when listed.
+        self._times = pandas.DatetimeIndex(date_range).sort_values() if date_range is not None else None
+        self._time_list = None  # type: Optional[List[Any]]
+        self._date_index = None  # type: Optional[pandas.DatetimeIndex]
+        self._dates = None  # type: Optional[List[Timestamp]]
         LOGGER.debug('Created a Timeframe between {} and {}.'.format(self.start, self.end))
 
     def __str__(self):
@@ -291,38 +439,43 @@ class Timeframe(object):
         if total_time < self.granularity:
             raise ValueError('Frequency must be smaller than the total timeframe covered.')
 
+    @property
+    def date_index(self):
+        # type: () -> pandas.DatetimeIndex
+        """The dates (at midnight) within the timeframe."""
+        if self._date_index is None:
+            date_index = pandas.date_range(start=self.start, end=self.end).normalize()
+            self._date_index = date_index.tz_localize(None) if date_index.tz is not None else date_index
+        return self._date_index
+
     @property
     def dates(self):
         # type: () -> Optional[List[Timestamp]]
         """Generate the date range."""
-        if self._dates:
-            return self._dates
-        dates = pandas.date_range(start=self.start, end=self.end)
-        self._dates = [Timestamp(day.date()) for day in dates]
+        if self._dates is None:
+            self._dates = list(self.date_index)
         return self._dates
 
+    @property
+    def time_index(self):
+        # type: () -> pandas.DatetimeIndex
+        """The interval times at the granularity; from the start or back from the end, with both the start and end."""
+        if self._times is None:
+            start, end, step = self.start.value, self.end.value, self.granularity.value
+            if self._from_start:
+                values = numpy.append(numpy.arange(start, end + 1, step, dtype='int64'), end)
+            else:
+                values = numpy.append(numpy.arange(end, start - 1, -step, dtype='int64'), start)
+            self._times = _to_datetime_index(numpy.unique(values), self.start.tz)
+        return self._times
+
     @property
     def times(self):
         # type: () -> Optional[List[Any]]
         """Generate interval times from the start or end."""
-        if self._times:
-            return self._times
-        if self._from_start:
-            interval_times = set()
-            current_time = self.start
-            while current_time <= self.end:
-                interval_times.add(current_time)
-                current_time += self.granularity
-            interval_times.add(self.end)
-        else:
-            interval_times = set()
-            current_time = self.end
-            while current_time >= self.start:
-                interval_times.add(current_time)
-                current_time -= self.granularity
-            interval_times.add(self.start)
-        self._times = sorted(interval_times)
-        return self._times
+        if self._time_list is None:
+            self._time_list = list(self.time_index)
+        return self._time_list
 
     def filter_logs_by_time(self, log_files):
         # type: (List[str], bool) -> List[str]
@@ -338,24 +491,21 @@ class Timeframe(object):
             LOGGER.warning('No log files to filter.')
             return log_files
         LOGGER.debug('Filtering {} log_files by time range.'.format(len(log_files)))
-        filtered = set()
-        for filename in log_files:
-            log_obj = lib.file_utils.LogFile(filename)
-            # Logs with have "no log date" should be included.  We default
-            # these to epoch 0, so that's what we'll check for.
-            if log_obj.start_time == INVALID_TIMESTAMP:
-                filtered.add(filename)
-            elif log_obj.log_type in SETTINGS['filter_exceptions']['daily_logs']:
-                if self.start.date() <= log_obj.start_time.date() <= self.end.date():
-                    filtered.add(filename)
-                elif self.end.date() >= log_obj.end_time.date() >= self.start.date():
-                    filtered.add(filename)
-            # If start time is after timeframe start but before timeframe end
-            elif log_obj.start_time >= self.start and log_obj.start_time <= self.end:
-                filtered.add(filename)
-            # If end time is before timeframe end but after timeframe start
-            elif log_obj.end_time <= self.end and log_obj.end_time >= self.start:
-                filtered.add(filename)
+        log_objs = [lib.file_utils.LogFile(filename) for filename in log_files]
+        starts = numpy.array([log_obj.start_time.value for log_obj in log_objs], dtype='int64')
+        ends = numpy.array([log_obj.end_time.value for log_obj in log_objs], dtype='int64')
+        daily_types = SETTINGS['filter_exceptions']['daily_logs']
+        is_daily = numpy.array([log_obj.log_type in daily_types for log_obj in log_objs], dtype=bool)
+        # Daily logs are compared by date; everything else by time.  Files which only touch the timeframe are kept.
+        day = 24 * 3600 * 10 ** 9
+        overlaps = numpy.where(
+            is_daily,
+            (starts // day * day <= self.end.normalize().value) & (ends // day * day >= self.start.normalize().value),
+            (starts <= self.end.value) & (ends >= self.start.value),
+        )
+        # Logs with have "no log date" should be included.  We default these to epoch 0, so that's what we'll check for.
+        keep = overlaps | (starts == INVALID_TIMESTAMP.value)
+        filtered = set(filename for filename, kept in zip(log_files, keep.tolist()) if kept)
 
         if not filtered:
             LOGGER.warning('No log files remaining after filtering by time.')
@@ -363,6 +513,11 @@ class Timeframe(object):
             LOGGER.warning('%d log files remain after filtering.', len(list(filtered)))
         return sorted(list(filtered))
 
+    def line_key_range(self):
+        # type: () -> Tuple[str, str]
+        """Get the start/end of the timeframe as sortable keys; see get_line_time_key."""
+        return _to_line_time_key(self.start), _to_line_time_key(self.end)
+
     def generate_interval(self, granularity=None):
         # type: (str) -> List[Any]
         """Generate an interval from the current start/end times with a different frequency.
@@ -371,13 +526,14 @@ class Timeframe(object):
             granularity (int): The frequency/granularity of the intervals to generate.
 
         Returns:
-            A list of intervals between the start and end time at the given granularity.
+            A pandas.DatetimeIndex of intervals between the start and end time at the given granularity.
         """
         if not granularity:
             granularity = self.granularity
-        return [Timestamp(timestamp) for timestamp in pandas.date_range(start=self.start,
-                                                                        end=self.end,
-                                                                        freq=granularity)]
+        if isinstance(granularity, Timedelta):
+            # pandas reads a frequency through the unit properties which Timedelta redefines; give it a plain one.
+            granularity = pandas.Timedelta(granularity.value)
+        return pandas.date_range(start=self.start, end=self.end, freq=granularity)
 
     def generate_filenames(self, filename_base, extension='.gz', start=None, end=None):
         # type: (str, str, Optional[Any], Optional[Any]) -> List[str]
@@ -418,12 +574,12 @@ class Timeframe(object):
         except ValueError:
             # /logs/domain.com/array-ct0
             validation_utils.fuse_base_path(log_path, ValueError)
-        days = self.generate_interval()
+        days = self.generate_interval().strftime('%Y_%m_%d').unique()
         log_paths = set()
         for day in days:
             # We need to generate a logfile for both controllers when we
             # look at the fuse base path, not just one.
-            day_path = os.path.join(log_path, day.strftime('%Y_%m_%d'))
+            day_path = os.path.join(log_path, day)
             other_ctrl = '-ct0/' if '-ct1/' in day_path else '-ct1/'
             peer_path = re.sub(r'-ct\d/', other_ctrl, day_path)
             log_paths.add(day_path)
@@ -465,10 +621,9 @@ class Timeframe(object):
         """
         lower_time = exact_time - buffer_time
         upper_time = exact_time + buffer_time
-        upper_range = set(pandas.date_range(start=exact_time, end=upper_time, freq=granularity))
-        lower_range = set(pandas.date_range(start=lower_time, end=exact_time, freq=granularity))
-        sorted_time_set = sorted(set.union(upper_range, lower_range))
-        timeframe = cls.from_pandas_date_range(sorted_time_set, granularity=granularity)
+        upper_range = pandas.date_range(start=exact_time, end=upper_time, freq=granularity)
+        lower_range = pandas.date_range(start=lower_time, end=exact_time, freq=granularity)
+        timeframe = cls.from_pandas_date_range(lower_range.union(upper_range), granularity=granularity)
         return timeframe
 
     @classmethod
@@ -484,12 +639,19 @@ class Timeframe(object):
             A Timeframe object of the range of time.
         """
         # We shouldn't assume the date_range is sorted.
-        sorted_range = sorted(date_range)
+        sorted_range = pandas.DatetimeIndex(date_range).sort_values()
         start = sorted_range[0]
         end = sorted_range[-1]
         return cls(start=start, end=end, granularity=granularity, date_range=sorted_range)
 
 
+def _to_datetime_index(values, tz=None):
+    # type: (numpy.ndarray, Optional[Any]) -> pandas.DatetimeIndex
+    """Convert int64 nanoseconds since the epoch to a DatetimeIndex; in the time zone (if any) of the timeframe."""
+    index = pandas.DatetimeIndex(values.view('datetime64[ns]'))
+    return index.tz_localize('UTC').tz_convert(tz) if tz is not None else index
+
+
 def _set_granularity(granularity):
     # type: (Optional[Timedelta]) -> Timedelta
     """Set the granularity, after validating it is within an acceptable range."""
@@ -601,6 +763,73 @@ def generate_timeframe(start=None,              # type: Optional[Union[str, Time
     return timeframe
 
 
+def intersect_intervals(first, second):
+    # type: (List[Tuple[Any, Any]], List[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]
+    """Get the ranges of time which are within both sets of (start, end) intervals.
+
+    Arguments:
+        first (list): One or more (start, end) intervals.
+        second (list): One or more (start, end) intervals.
+
+    Returns:
+        A sorted list of merged (start, end) intervals which are in both first and second.
+    """
+    overlaps = []
+    for first_start, first_end in merge_intervals(first):
+        for second_start, second_end in merge_intervals(second):
+            start = max(first_start, second_start)
+            end = min(first_end, second_end)
+            if start < end:
+                overlaps.append((start, end))
+    return merge_intervals(overlaps)
+
+
+def merge_intervals(intervals):
+    # type: (List[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]
+    """Merge overlapping or touching (start, end) intervals.
+
+    Arguments:
+        intervals (list): One or more (start, end) intervals; in any order.
+
+    Returns:
+        merged (list): A sorted list of non-overlapping (start, end) intervals.
+    """
+    merged = []  # type: List[Tuple[Any, Any]]
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def subtract_intervals(start, end, intervals):
+    # type: (Any, Any, List[Tuple[Any, Any]]) -> List[Tuple[Any, Any]]
+    """Get the gaps between start and end which are not covered by any of the intervals.
+
+    Arguments:
+        start (Timestamp): The beginning of the range of time.
+        end (Timestamp): The end of the range of time.
+        intervals (list): One or more (start, end) intervals which are already covered.
+
+    Returns:
+        gaps (list): A sorted list of (start, end) intervals which are not covered.
+    """
+    gaps = []
+    current = start
+    for covered_start, covered_end in merge_intervals(intervals):
+        if covered_end <= current:
+            continue
+        elif covered_start >= end:
+            break
+        if covered_start > current:
+            gaps.append((current, covered_start))
+        current = max(current, covered_end)
+    if current < end:
+        gaps.append((current, end))
+    return gaps
+
+
 def get_start_end_from_files(files, from_latest):
     # type: (List[str], bool) -> Tuple[time_utils.Timestamp, time_utils.Timestamp]
     """Get a start and end date from a log path with logs in it."""
@@ -677,6 +906,24 @@ def get_timestamps_from_files(log_files):
     return sorted(log_times - set([INVALID_TIMESTAMP]))
 
 
+def to_datetime_series(values):
+    # type: (Any) -> pandas.Series
+    """Convert timestamps (Timestamp objects, datetimes or timestamp strings) to a datetime64[ns] Series.
+
+    Arguments:
+        values (pandas.Series/list): One or more timestamps.
+
+    Returns:
+        A pandas.Series with a datetime64[ns] dtype.
+    """
+    values = pandas.Series(values)
+    try:
+        return pandas.to_datetime(values)
+    except (TypeError, ValueError):
+        # Some log timestamps are not in a format which pandas can read (i.e. '2018_01_01-12' or no year).
+        return pandas.to_datetime(values.apply(Timestamp))
+
+
 def get_timestamp_from_log_path(log_path):
     # type: (str) -> Timestamp
     """Get the timestamp from a FUSE log path.
@@ -733,31 +980,122 @@ def get_timestamp_from_line(line):
     return timestamp
 
 
-def _get_highest_latency_unit(latency_value):
-    # type: (Timedelta) -> str
-    """Determine which latency whole unit to scale to."""
-    use_scale = 'nanoseconds'
-    # Start from the biggest and work down until there is a whole number.
-    scales = ('years', 'days', 'hours', 'minutes', 'seconds', 'milliseconds', 'microseconds', 'nanoseconds')
-    for scale in scales:
-        if getattr(latency_value, scale) >= 1:
-            use_scale = scale
-            break
-    return use_scale
+def get_line_time_key(line, reference=None):
+    # type: (str, Optional[Timestamp]) -> Optional[str]
+    """Get a sortable 'YYYY-MM-DD HH:MM:SS[.ffffff]' key from the timestamp prefix of a log line.
+
+    This is much cheaper than building a Timestamp, and is meant for comparing lines against a
+    Timeframe (see Timeframe.line_key_range) before we spend any time actually parsing them.
+
+    Arguments:
+        line (str): A log line which may begin with a timestamp.
+        reference (Timestamp): A nearby time used to infer the year when the line does not have one.
+            * The year which puts the line closest to the reference is used.  Defaults to the current year.
+
+    Returns:
+        key (str): The sortable key, or None if the line does not begin with a known timestamp format.
+    """
+    match = LINE_TIME_PREFIX.match(line)
+    if not match:
+        return None
+    if match.group('iso_date'):
+        return '{} {}'.format(match.group('iso_date'), match.group('iso_time'))
+    month = MONTH_NUMBERS.get(match.group('month'))
+    if not month:
+        return None
+    if match.group('year'):
+        year = int(match.group('year'))
+    elif match.group('short_year'):
+        year = 2000 + int(match.group('short_year'))
+    elif match.group('weekday') and match.group('trailing_year'):
+        # Without the weekday, this could be any number which follows a year-less timestamp.
+        year = int(match.group('trailing_year'))
+    else:
+        # pylint: disable=no-member
+        year = _infer_year(month, reference or Timestamp.now())
+    return '{:04d}-{:02d}-{:02d} {}'.format(year, month, int(match.group('day')), match.group('time'))
+
+
+def _infer_year(month, reference):
+    # type: (int, Any) -> int
+    """Infer the year of a year-less log timestamp in a month; from a nearby time (i.e. the date of the log file)."""
+    year = reference.year
+    # CAVEAT: Year-less lines around new year.
+    # An hourly log for Jan 1 00:00 can begin with lines from Dec 31 (before log rotation), so
+    # pick the year which keeps the line within ~6 months of the reference time.
+    if month - reference.month > 6:
+        year -= 1
+    elif reference.month - month > 6:
+        year += 1
+    return year
+
+
+def parse_timestamps(values, reference=None):
+    # type: (Any, Optional[Any]) -> numpy.ndarray
+    """Read many timestamp strings at once; see TimestampParser.
+
+    Arguments:
+        values (list/pandas.Series): Timestamp strings; None (or other empty values) become NaT.
+        reference (Timestamp): A nearby time (i.e. the date of the log file) used to infer the year of timestamps
+            which do not have one.  Defaults to the current year.
+
+    Returns:
+        A numpy.ndarray of datetime64[ns].
+    """
+    return TimestampParser(reference).parse_many(values)
+
+
+def _to_line_time_key(timestamp):
+    # type: (Timestamp) -> str
+    """Convert a Timestamp to the same sortable format as get_line_time_key."""
+    key = timestamp.strftime('%Y-%m-%d %H:%M:%S')
+    if timestamp.microsecond:
+        key += '.{:06d}'.format(timestamp.microsecond)
+    return key
 
 
 def scale_latency(value, base_unit, display_unit=None, precision=2):
     # type: (Union[str, int, float], str, Optional[str], int) -> str
     """Auto-scale a latency value to the greatest whole unit or specified 'to_unit'."""
-    from_method = 'from_{}'.format(base_unit)
-    # Get the from_ method applicable to this base unit.  i.e. Timedelta.from_seconds
-    delta = getattr(Timedelta, from_method)(value)
-    # Convert to the requested display unit:
-    display_unit = display_unit or _get_highest_latency_unit(delta)
-    display = getattr(delta, display_unit)
-    # Convert the long name to a short name for display purposes:  'milliseconds' -> 'ms'
-    short_name = DELTA_SHORT_NAMES[display_unit]
-    return '{:.{}f} {}'.format(display, precision, short_name)
+    return scale_latency_values([value], base_unit, display_unit, precision)[0]
+
+
+def scale_latency_values(values, base_unit, display_unit=None, precision=2):
+    # type: (Any, str, Optional[str], int) -> List[str]
+    """Auto-scale many latency values at once; like scale_latency for each value.
+
+    Arguments:
+        values (list/numpy.ndarray/pandas.Series): Raw latency values in the base_unit.
+        base_unit (str): The unit the raw values are in; i.e. 'milliseconds'.
+        display_unit (str): A unit to statically scale to; otherwise each value is scaled to its greatest whole unit.
+        precision (int): How many values after the decimal point to preserve.
+
+    Returns:
+        A list with a string of each scaled value with its short unit name.  i.e. ['1.67 m', '100.12 ms']
+    """
+    nanoseconds = numpy.round(numpy.asarray(values, dtype=float) * LATENCY_NANOSECONDS[base_unit])
+    # The same (rounded) values as the Timedelta unit properties:
+    scaled = {'seconds': nanoseconds / 1e9}
+    scaled['minutes'] = math_utils.safe_divide_values(scaled['seconds'], 60)
+    scaled['hours'] = math_utils.safe_divide_values(scaled['minutes'], 60)
+    scaled['days'] = math_utils.safe_divide_values(scaled['hours'], 24)
+    scaled['years'] = math_utils.safe_divide_values(scaled['days'], 365)
+    scaled['milliseconds'] = scaled['seconds'] * 1000
+    scaled['microseconds'] = scaled['milliseconds'] * 1000
+    scaled['nanoseconds'] = scaled['microseconds'] * 1000
+    if display_unit:
+        display_units = numpy.full(len(nanoseconds), display_unit, dtype=object)
+    else:
+        # Start from the biggest and work down until there is a whole number.
+        display_units = numpy.full(len(nanoseconds), 'nanoseconds', dtype=object)
+        unscaled = numpy.ones(len(nanoseconds), dtype=bool)
+        for scale in LATENCY_SCALES:
+            whole = unscaled & (scaled[scale] >= 1)
+            display_units[whole] = scale
+            unscaled &= ~whole
+    template = '{{:.{}f}} {{}}'.format(precision)
+    return [template.format(scaled[unit][index], DELTA_SHORT_NAMES[unit])
+            for index, unit in enumerate(display_units.tolist())]
 
 
 def to_epoch_time(timestamp, timezone):
@@ -1,4 +1,11 @@
-"""Unit tests for metric_actions."""
+"""Custom actions for Metrics; see the 'action' setting in metric_index.ini.
+
+Each action is given all of the rows of the Metric's frame at once (see metric_base.Metric.process), but will also
+work on a single row.
+"""
+
+import numpy
+import pandas
 
 from photon.lib import format_utils
 
@@ -6,16 +13,25 @@ from photon.lib import format_utils
 def calculate_raw_unaccounted(row):
     # type: (Any) -> Any
     """Helper to calculate raw Unaccounted Space."""
-    return format_utils.zero(row['unreported_space'] - row['reclaimable_space'] - row['reported_pyramid'])
+    raw_unaccounted = row['unreported_space'] - row['reclaimable_space'] - row['reported_pyramid']
+    if isinstance(row, pandas.DataFrame):
+        # Like format_utils.zero for each value.
+        return numpy.trunc(raw_unaccounted.astype(float)).clip(lower=0).astype(int)
+    return format_utils.zero(raw_unaccounted)
 
 
 def scale_unaccounted_space(row):
     # type: (Any) -> Any
     """Helper to convert raw Unaccounted space to human readable."""
+    if isinstance(row, pandas.DataFrame):
+        return pandas.Series(format_utils.auto_scale_values(row['Unaccounted Raw'].values, 'binary_bytes'),
+                             index=row.index)
     return format_utils.auto_scale(row['Unaccounted Raw'], 'binary_bytes')
 
 
 def format_unreported_ratio(row):
     # type: (Any) -> Any
     """Helper to format a value as a ratio."""
+    if isinstance(row, pandas.DataFrame):
+        return row['unreported_ratio'].map('{:.2f}:1'.format)
     return '{:.2f}:1'.format(row['unreported_ratio'])
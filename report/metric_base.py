@@ -3,8 +3,9 @@
 Wiki Page: https://wiki.purestorage.com/display/SDT/Photon%3A+Report+API+Overview
 """
 
+import copy
 import logging
-import numpy
+import pandas
 
 from photon.lib import config_utils
 from photon.lib import format_utils
@@ -26,6 +27,8 @@ except ImportError:
 
 LOGGER = logging.getLogger(__name__)
 METRIC_INDEX = config_utils.get_metric_index()
+# Built Metrics by (metric_name, metric_kwargs); see build_metric.
+_METRIC_CACHE = {}  # type: Dict[Tuple[str, Tuple[Any, ...]], Metric]
 
 
 class Metric(object):
@@ -138,19 +141,26 @@ class Metric(object):
         """Fill missing and infer values for metrics for a consistent output."""
         if self.fill:
             frame = frame.ffill().bfill()
-        resampler = pandas_utils.resample_frame(frame, frequency)
         if self.operation == 'avg':
             self.operation = 'mean'
-        if not hasattr(resampler, self.operation):
-            error_msg = 'The resampling operation "{}" is not defined.'.format(self.operation)
-            LOGGER.error(error_msg)
-            raise ValueError(error_msg)
+        # Metrics with the same rows share the same buckets; see pandas_utils.get_resample_grouper.
+        grouper = pandas_utils.get_resample_grouper(frame['Timestamp'], frequency)
         # PT-2128 - If we have all None/nan for a required numerical field, then we will fail to do any aggregation.
-        frame = getattr(resampler, self.operation)()
+        frame = grouper.aggregate(frame, self.operation)
         frame['Timestamp'] = frame.index
         frame.reset_index(drop=True, inplace=True)
         return frame
 
+    def evaluate(self, frame):
+        # type: (pandas.DataFrame) -> pandas.Series
+        """Get the raw values of the Metric for all of the rows in the frame at once."""
+        return frame[self.field]
+
+    def format_values(self, values):
+        # type: (pandas.Series) -> pandas.Series
+        """Format the raw values of the Metric for display; all at once."""
+        return values
+
     def process(self, frame, frequency):
         # type: (Any, str) -> Any
         """Return original DataFrame as it already the requested field as a column.
@@ -170,10 +180,13 @@ class Metric(object):
         if self.operation != 'event':
             frame = self._fill(frame, frequency)
 
-        if hasattr(self, '_action') and not frame.empty:
-            frame[self.nice_name] = frame.apply(getattr(self, '_action'), axis=1)
-        else:
+        if frame.empty:
             frame[self.nice_name] = frame[self.field]
+        elif hasattr(self, '_action'):
+            # Custom actions (see metric_actions) are given all of the rows at once.
+            frame[self.nice_name] = getattr(self, '_action')(frame)
+        else:
+            frame[self.nice_name] = self.format_values(self.evaluate(frame))
 
         # Enforce dtype if applicable:
         if self.dtype:
@@ -234,15 +247,19 @@ class LatencyMetric(Metric):
         self.display_unit = display_unit
         self.precision = precision
 
-    def _action(self, row):
-        # type: (Any) -> str
-        """Action to perform on each row in the column."""
-        raw_value = row[self.field]
-        if numpy.isnan(float(raw_value)):
-            scaled = '-'
-        else:
-            scaled = time_utils.scale_latency(value=raw_value, base_unit=self.base_unit,
-                                              display_unit=self.display_unit, precision=self.precision)
+    def evaluate(self, frame):
+        # type: (pandas.DataFrame) -> pandas.Series
+        """Get the raw latency values in the base_unit."""
+        return frame[self.field].astype(float)
+
+    def format_values(self, values):
+        # type: (pandas.Series) -> pandas.Series
+        """Scale the latency values to their display unit; missing values are shown as '-'."""
+        scaled = pandas.Series('-', index=values.index, dtype=object)
+        valid = values.notnull()
+        if valid.any():
+            scaled[valid] = time_utils.scale_latency_values(values[valid].values, base_unit=self.base_unit,
+                                                            display_unit=self.display_unit, precision=self.precision)
         return scaled
 
 
@@ -272,10 +289,16 @@ class PercentageMetric(Metric):
         self.numerator = numerator
         self.denominator = denominator
 
-    def _action(self, row):
-        # type: (Any) -> str
-        """Action to perform on each row in the column."""
-        return format_utils.percentage(math_utils.safe_divide(row[self.numerator], row[self.denominator]))
+    def evaluate(self, frame):
+        # type: (pandas.DataFrame) -> pandas.Series
+        """Get the ratio of the numerator to the denominator."""
+        ratios = math_utils.safe_divide_values(frame[self.numerator], frame[self.denominator])
+        return pandas.Series(ratios, index=frame.index)
+
+    def format_values(self, values):
+        # type: (pandas.Series) -> pandas.Series
+        """Format the ratios as percentages."""
+        return values.map('{:.2%}'.format)
 
 
 class ScaledUnitsMetric(Metric):
@@ -305,10 +328,10 @@ class ScaledUnitsMetric(Metric):
             raise ValueError(msg)
         self.scale = scale
 
-    def _action(self, row):
-        # type: (Any) -> str
-        """Action to perform on each row in the column."""
-        return format_utils.auto_scale(row[self.field], self.scale)
+    def format_values(self, values):
+        # type: (pandas.Series) -> pandas.Series
+        """Scale the values to their display unit."""
+        return pandas.Series(format_utils.auto_scale_values(values.values, self.scale), index=values.index)
 
 
 class TextMetric(Metric):
@@ -329,10 +352,21 @@ class TextMetric(Metric):
         super(TextMetric, self).__init__(field, defaults=defaults, **kwargs)
 
 
+def load_metric_index():
+    # type: () -> None
+    """Re-read the metric_index.ini; metrics which were built from the previous contents are dropped."""
+    METRIC_INDEX.clear()
+    METRIC_INDEX.update(config_utils.get_metric_index())
+    _METRIC_CACHE.clear()
+
+
 def build_metric(metric_name, **metric_kwargs):
     # type: (str, **Dict[str, Any]) -> Metric
     """Helper to validate and then build a metric based upon its name.
 
+    Each metric is only built once per set of keyword arguments; callers get their own copy, as Tables update the
+    metrics which they process (i.e. to use the nice_name of required_metrics).
+
     Arguments:
         metric_name (str): The name of a single metric to build.
             Note: The available metrics are listed in the metric_index.ini file.
@@ -340,6 +374,20 @@ def build_metric(metric_name, **metric_kwargs):
     Returns:
         metric (Metric): A Metric instance based upon the name and parameters given.
     """
+    try:
+        key = (metric_name, tuple(sorted(metric_kwargs.items())))
+        hash(key)
+    except TypeError:
+        # Un-hashable keyword arguments (i.e. a list of sub_tables) are not cached.
+        return _build_metric(metric_name, **metric_kwargs)
+    if key not in _METRIC_CACHE:
+        _METRIC_CACHE[key] = _build_metric(metric_name, **metric_kwargs)
+    return copy.deepcopy(_METRIC_CACHE[key])
+
+
+def _build_metric(metric_name, **metric_kwargs):
+    # type: (str, **Dict[str, Any]) -> Metric
+    """Build a metric based upon its name; see build_metric."""
     metric_config, action, metric_cls = _build_metric_config(metric_name, **metric_kwargs)
     metric = metric_cls(**metric_config)
     if action:
@@ -359,7 +407,8 @@ def _build_metric_config(metric_name, **kwargs):
         raise ValueError(msg)
 
     # Fetch the configuration for this metric.
-    metric_config = METRIC_INDEX[metric_name]
+    # Copy it, so that the keyword arguments only apply to this metric.
+    metric_config = copy.deepcopy(METRIC_INDEX[metric_name])
     metric_config.update(kwargs)
 
     # Validate that the requested metric_type exists.
@@ -0,0 +1,138 @@
+"""Compiled render plans for the Report API; from the metric_index.ini and table_index.ini.
+
+A RenderPlan is built once per process and shared by all Reports; so tools which build many reports (i.e. a report
+per day) only work out each metric and template once.  It is re-built when either INI file is modified.
+"""
+
+import copy
+import logging
+
+from six import string_types
+
+from photon.lib import config_utils
+from photon.report import metric_base
+
+# pylint: disable=unused-import
+try:
+    from typing import Any
+    from typing import Dict
+    from typing import List
+    from typing import Optional
+    from typing import Tuple
+except ImportError:
+    pass
+
+FIELD_INDEX = config_utils.get_field_index()
+INDEX_PATHS = (config_utils.METRIC_INDEX_PATH, config_utils.TABLE_INDEX_PATH)
+LOGGER = logging.getLogger(__name__)
+
+
+class MetricPlan(object):
+    """How to render a single metric from the metric_index."""
+
+    def __init__(self, name, metric, dependencies, required_fields):
+        # type: (str, metric_base.Metric, List[str], List[str]) -> None
+        """
+        Arguments:
+            name (str): The name of the metric in the metric_index.
+            metric (metric_base.Metric): The metric, as built from the metric_index.
+            dependencies (list): Every metric which this metric requires (directly or not); in the order to process
+                them, so each one comes after the metrics which it requires.
+            required_fields (list): Every field from the field_index which is needed to render this metric; including
+                the fields of the metrics which it requires (directly or not).
+        """
+        self.name = name
+        self.dependencies = dependencies
+        self.required_fields = required_fields
+        self.dtype = metric.dtype
+        # The resampling operation; see metric_base.Metric._fill.
+        self.operation = 'mean' if metric.operation == 'avg' else metric.operation
+
+
+class RenderPlan(object):
+    """The compiled metric_index.ini and table_index.ini."""
+    # The RenderPlan which is shared by all Reports; see get_render_plan.
+    _shared = None  # type: Optional[RenderPlan]
+
+    def __init__(self):
+        # type: () -> None
+        """Read the table templates; metrics are only compiled when they are first needed."""
+        self.mtimes = _get_index_mtimes()
+        self.metrics = {}  # type: Dict[str, MetricPlan]
+        self.tables = config_utils.get_table_index()  # type: Dict[str, Dict[str, Any]]
+
+    def get_metric_plan(self, metric_name):
+        # type: (str) -> Optional[MetricPlan]
+        """Get the plan of a metric from the metric_index; it is compiled after the metrics which it requires.
+
+        Returns:
+            The MetricPlan; or None if the metric is not in the metric_index.
+        """
+        if metric_name in self.metrics:
+            return self.metrics[metric_name]
+        if metric_name not in metric_base.METRIC_INDEX:
+            return None
+        metric = metric_base.build_metric(metric_name)
+        dependencies = []  # type: List[str]
+        for needed_metric in metric.required_metrics:
+            needed_plan = self.get_metric_plan(needed_metric)
+            if needed_plan is None:
+                continue
+            for dependency in needed_plan.dependencies + [needed_metric]:
+                if dependency not in dependencies:
+                    dependencies.append(dependency)
+        required_fields = self.get_required_fields(metric)
+        self.metrics[metric_name] = MetricPlan(metric_name, metric, dependencies, required_fields)
+        return self.metrics[metric_name]
+
+    def get_required_fields(self, metric):
+        # type: (metric_base.Metric) -> List[str]
+        """Get every field from the field_index which is needed to render a metric; i.e. a metric with keyword
+        arguments from Table.add_metric.  The fields of the metrics which it requires come from their plans.
+        """
+        # There are field names which are just used to reference processed columns and may not exist in the lower API.
+        required_fields = {field for field in metric.required_fields if field in FIELD_INDEX}
+        for needed_metric in metric.required_metrics:
+            if isinstance(needed_metric, string_types):
+                needed_plan = self.get_metric_plan(needed_metric)
+                if needed_plan is not None:
+                    required_fields.update(needed_plan.required_fields)
+                    continue
+                needed_metric = metric_base.build_metric(needed_metric)
+            required_fields.update(self.get_required_fields(needed_metric))
+        return sorted(required_fields)
+
+    def get_table_config(self, template_name, **table_kwargs):
+        # type: (str, **Dict[str, Any]) -> Dict[str, Any]
+        """Get a copy of the configuration of a table template; with any keyword argument overrides."""
+        if template_name not in self.tables:
+            msg = 'Requested template "{}" does not exist.'.format(template_name)
+            LOGGER.error(msg)
+            raise ValueError(msg)
+        table_config = copy.deepcopy(self.tables[template_name])
+        table_config.update(table_kwargs)
+        return table_config
+
+    def is_current(self):
+        # type: () -> bool
+        """Check that neither INI file has been modified since this was compiled."""
+        return _get_index_mtimes() == self.mtimes
+
+
+def get_render_plan():
+    # type: () -> RenderPlan
+    """Get the RenderPlan which is shared by all Reports; it is re-compiled when either INI file is modified."""
+    render_plan = RenderPlan._shared
+    if render_plan is None or not render_plan.is_current():
+        if render_plan is not None:
+            LOGGER.info('The metric_index.ini or table_index.ini was modified; re-compiling the render plan.')
+            metric_base.load_metric_index()
+        render_plan = RenderPlan()
+        RenderPlan._shared = render_plan
+    return render_plan
+
+
+def _get_index_mtimes():
+    # type: () -> Tuple[float, ...]
+    """Get when each of the INI files were last modified."""
+    return tuple(config_utils.get_index_mtime(path) for path in INDEX_PATHS)
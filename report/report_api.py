@@ -1,9 +1,18 @@
 """Simple Report API for generating and printing reports within the terminal."""
 
 import abc
+import collections
+import gzip
+import hashlib
 import logging
+import re
+import sys
 
+import numpy
 import pandas
+import six
+
+from pandas.io.formats.format import format_array
 
 from photon.lib import config_utils
 from photon.lib import format_utils
@@ -11,11 +20,14 @@ from photon.lib import pandas_utils
 from photon.lib import parallel_utils
 from photon.lib import time_utils
 from photon.report import metric_base
+from photon.report import render_plan
 
 # pylint: disable=unused-import
 try:
     from typing import Any
     from typing import Dict
+    from typing import Iterable
+    from typing import Iterator
     from typing import List
     from typing import Optional
     from typing import Set
@@ -24,18 +36,29 @@ try:
 except ImportError:
     pass
 
+# How many rows of a table to render at a time; see Table.write_table.
+CHUNK_SIZE = 10000
 FIELD_INDEX = config_utils.get_field_index()
+# Where the rows start and end within pandas.DataFrame.to_html and to_json(orient='table'):
+HTML_BODY_END = '  </tbody>'
+HTML_BODY_START = '<tbody>\n'
+JSON_DATA_END = ']}'
+# The spacing around the data key differs between versions of pandas.
+JSON_DATA_START = re.compile(r',\s*"data":\s*\[')
 LOGGER = logging.getLogger(__name__)
 META_KEYS = ['Timestamp', 'controller']
+# How many processed metric frames to keep for other Tables and Reports; see Table._process_metric.
+METRIC_FRAME_CACHE_SIZE = 256
 METRIC_INDEX = config_utils.get_metric_index()
 PIPE = '|'  # PIPE is used as a custom separator to break up table columns.
 SETTINGS = config_utils.get_settings()
-TABLE_INDEX = config_utils.get_table_index()
 TEXT_ALIGNMENTS = {
     'left': format_utils.LEFT_JUSTIFY,
     'right': format_utils.RIGHT_JUSTIFY,
     'center': format_utils.CENTER_JUSTIFY
 }
+# Processed metric frames (or None for metrics without data) by Table._get_cache_key; least recently used first.
+_METRIC_FRAME_CACHE = collections.OrderedDict()  # type: collections.OrderedDict
 
 
 class Report(object):
@@ -58,15 +81,16 @@ class Report(object):
         self.table_types = {'csv': CSVTable, 'json': JSONTable, 'html': HTMLTable, 'table': Table}
 
     def _build_tables_in_parallel(self, jira):
-        # type: (bool) -> str
+        # type: (bool) -> Iterator[str]
         """Build tables in parallel.
 
-        This will break up the amount of work and assign 10 tasks for each sub-process.
+        This will break up the amount of work and assign 10 tasks for each sub-process.  Each sub-process returns its
+        rendered table as a whole str, which is yielded as soon as it (and the tables before it) are done.
         """
         tasks = []
         task_args = []
         for table in self.tables:
-            if isinstance(table, str):
+            if isinstance(table, six.string_types):
                 # CAVEAT: This is a text area... no real processing required, just pass it through.
                 yield table
                 continue
@@ -81,29 +105,45 @@ class Report(object):
             for result in pool.get_results(ordered=True):
                 yield result
 
-    def _build_tables_in_series(self, jira):
-        # type: (bool) -> str
-        """Generate tables in series."""
-        for table in self.tables:
-            if isinstance(table, str):
+    def _write_tables_in_series(self, stream, jira):
+        # type: (Any, bool) -> None
+        """Write tables in series; each table is written as soon as it is rendered."""
+        for index, table in enumerate(self.tables):
+            if index:
+                stream.write('\n')
+            if isinstance(table, six.string_types):
                 # CAVEAT: This is a text area... no real processing required, just pass it through.
-                yield table
+                stream.write(table)
                 continue
             fields = [field for field in table.required_fields if field in FIELD_INDEX]
             table_frame = self.dataset[META_KEYS + fields]
-            result = table.render_table(table_frame, self.freq, jira)
-            yield result
+            table.write_table(stream, table_frame, self.freq, jira)
+
+    def _get_data_key(self, fields):
+        # type: (List[str]) -> Optional[Tuple[Any, ...]]
+        """Identify the dataset; so that its processed metrics can be reused by other Tables and Reports.
+
+        The dataset is the same while the array, timeframe, fields and the array's cached field values are.  Array APIs
+        without a data_version (see FlashArray.data_version) get None, which means nothing is cached.  Each Table
+        also hashes the values which it uses; see Table._process_metrics.
+        """
+        data_version = getattr(self.array_api, 'data_version', None)
+        if data_version is None:
+            return None
+        ident = self.array_api.ident
+        timeframe = self.array_api.timeframe
+        return (ident.fqdn or ident.log_path, timeframe.start, timeframe.end, timeframe.granularity.value,
+                tuple(sorted(fields)), data_version)
 
     def _get_table_fields(self):
         # type: () -> None
         """Get all of the fields needed to render all tables."""
         for table in self.tables:
-            if isinstance(table, str):
+            if isinstance(table, six.string_types):
                 # This is a TextArea, skip it.
                 continue
-            for metric in table.metrics.values():
-                for field in _get_required_fields(metric):
-                    self.fields.add(field)
+            # Each Table gathers the fields of its metrics as they are added.
+            self.fields.update(table.required_fields)
 
     def add_table(self, table_type=None, title=None, timestamp=True, **table_config):
         # type: (str, Optional[str], bool, **dict) -> Table
@@ -144,14 +184,8 @@ class Report(object):
         Returns:
             table (Table): An instance of either Table/CSVTable/JSONTable/HTMLTable, etc.
         """
-        if template_name not in TABLE_INDEX:
-            msg = 'Requested template "{}" does not exist.'.format(template_name)
-            LOGGER.error(msg)
-            raise ValueError(msg)
-
         # Get the default configuration and update it with any manual overrides.
-        table_config = TABLE_INDEX[template_name]
-        table_config.update(table_kwargs)
+        table_config = render_plan.get_render_plan().get_table_config(template_name, **table_kwargs)
 
         # If there is no title, then use the template_name in a nicer format.
         if table_config.get('title') == '':
@@ -220,6 +254,8 @@ class Report(object):
         # type: (bool, bool) -> Optional[str]
         """Render all of the tables that were added to the Report.
 
+        The whole report is built as a str in memory; use write_tables to stream the tables to a file or stdout.
+
         Arguments:
             jira (bool): Add {noformat} tags for JIRA.
                 Combined with title=True uses {noformat:title=TITLE}.
@@ -228,27 +264,54 @@ class Report(object):
         Return:
             lines (list): Lines to print.
         """
+        stream = six.StringIO()
+        self._write_tables(stream, jira)
+        table_lines = stream.getvalue()
+        if print_tables:
+            print(table_lines)
+        return table_lines
+
+    def write_tables(self, path=None, jira=True):
+        # type: (Optional[str], bool) -> None
+        """Render all of the tables straight to a file or stdout; without building the rendered report as a str.
+
+        Arguments:
+            path (str): A file to write the tables to; paths ending with '.gz' are gzip compressed.
+                By default, the tables are written to stdout.
+            jira (bool): Add {noformat} tags for JIRA.
+                Combined with title=True uses {noformat:title=TITLE}.
+        """
+        if path is None:
+            self._write_tables(sys.stdout, jira)
+            # The same as render_tables when printing.
+            sys.stdout.write('\n')
+            return
+        with _open_output(path) as stream:
+            self._write_tables(stream, jira)
+
+    def _write_tables(self, stream, jira):
+        # type: (Any, bool) -> None
+        """Render all of the tables to a stream, separated by new lines."""
         # Get all of the fields for all of the table metrics.
         self._get_table_fields()
         # There are field names which are just used to reference processed columns and may not exist in the lower API.
         fields = [field for field in self.fields if field in FIELD_INDEX]
         # TODO: PT-2378 - The same DataFrame is also cached in the API, how do we reduce redundancy?
         self.dataset = self.array_api.get_fields(fields)
+        data_key = self._get_data_key(fields)
+        for table in self.tables:
+            if not isinstance(table, six.string_types):
+                table.data_key = data_key
 
-        # Generate the table structure and printable lines.
-        table_lines = []
         # TODO: PT-2369 - Replace this logic with asyncio...
         if SETTINGS['cpu']['serialize'] or int(len(self.tables)) / 10 <= 1:
-            # Build the tables in series.
-            for result in self._build_tables_in_series(jira):
-                table_lines.append(result)
-        else:
-            # Build the tables in parallel.
-            for result in self._build_tables_in_parallel(jira):
-                table_lines.append(result)
-        if print_tables:
-            print('\n'.join(table_lines))
-        return '\n'.join(table_lines)
+            self._write_tables_in_series(stream, jira)
+            return
+        # Build the tables in parallel; each table is written as soon as it (and those before it) are done.
+        for index, table_lines in enumerate(self._build_tables_in_parallel(jira)):
+            if index:
+                stream.write('\n')
+            stream.write(table_lines)
 
 
 class Table(object):
@@ -268,10 +331,18 @@ class Table(object):
             use_titles (bool): Whether to display titles or not.
         """
         self.box = kwargs.get('box', True)
+        # Identifies the dataset of the Report; see Report._get_data_key.
+        self.data_key = None  # type: Optional[Tuple[Any, ...]]
         # Add '| Timestamp |' if we have requested a timestamp.
         self.columns = [PIPE, 'Timestamp', PIPE] if timestamp else [PIPE]
         self.dataset = pandas.DataFrame()
         self.metric_data = pandas.DataFrame()
+        # Each processed metric (by nice_name) and the (Timestamp, controller) rows of all of them; see _join_metrics.
+        self._metric_frames = collections.OrderedDict()  # type: collections.OrderedDict
+        self._metric_index = None  # type: Optional[pandas.MultiIndex]
+        # The cache key of each processed metric (by nice_name) and of the rows of the dataset; see _get_cache_key.
+        self._metric_keys = {}  # type: Dict[str, Optional[Tuple[Any, ...]]]
+        self._dataset_key = None  # type: Optional[Tuple[Any, ...]]
         self.grid = kwargs.get('grid', False)
         self.headers = kwargs.get('headers', True)
         self.metrics = {}  # type: Dict[str, metric_base.Metric]
@@ -287,8 +358,7 @@ class Table(object):
         self.metrics[metric.nice_name] = metric
         self.columns.append(metric.nice_name)
         # Add all fields that are required by the metric.
-        for field in _get_required_fields(metric):
-            self.required_fields.add(field)
+        self.required_fields.update(render_plan.get_render_plan().get_required_fields(metric))
         LOGGER.debug('Successfully added metric "{}" to table.'.format(metric_name))
 
     def add_pipe(self):
@@ -304,8 +374,22 @@ class Table(object):
     def render_table(self, data_frame, frequency, jira_format=True):
         # type: (pandas.DataFrame, str, bool) -> str
         """Render the table with the given metrics and data_frame at a requested frequency."""
-        table_lines = []
+        stream = six.StringIO()
+        self.write_table(stream, data_frame, frequency, jira_format)
+        return stream.getvalue()
+
+    def write_table(self, stream, data_frame, frequency, jira_format=True):
+        # type: (Any, pandas.DataFrame, str, bool) -> None
+        """Render the table to a stream; CHUNK_SIZE rows at a time, so the rendered table is never held as a str.
 
+        The processed metric_data of the table is still built in full before any rows are rendered.
+
+        Arguments:
+            stream (file): Where to write the table; i.e. an open file or sys.stdout.
+            data_frame (pandas.DataFrame): The fields which are required by the metrics of the table.
+            frequency (str): The frequency to render the metrics at.
+            jira_format (bool): Add {noformat} tags for JIRA.
+        """
         self.dataset = data_frame
 
         # Drop rows where all required_fields values are empty.
@@ -322,23 +406,20 @@ class Table(object):
         # Apply header formatting:
         if jira_format:
             if self.use_titles and self.title:
-                table_lines.append('{{noformat:title={}}}'.format(self.title))
+                stream.write('{{noformat:title={}}}\n'.format(self.title))
             else:
-                table_lines.append('{noformat}')
+                stream.write('{noformat}\n')
         elif self.use_titles and self.title:
-            table_lines.append(self.title)
+            stream.write('{}\n'.format(self.title))
 
         # Render the table lines and table structure.
         # TODO: PT-2366 - Migrate and/or merge this logic with report_utils.
-        table_lines.extend(self._build_table_structure())
+        for line in self._build_table_structure():
+            stream.write(line + '\n')
 
         # Apply tail formatting:
         if jira_format:
-            table_lines.append('{noformat}')
-
-        # Add a final empty line for a visual break.
-        table_lines.append('')
-        return '\n'.join(table_lines)
+            stream.write('{noformat}\n')
 
     def _build_table_header(self, max_col_widths):
         # type: (List[int]) -> Tuple[List[str], str]
@@ -370,49 +451,47 @@ class Table(object):
         return header, line_bar
 
     def _build_box_structure(self, max_col_widths):
-        # type: (List[int]) -> List[str]
+        # type: (List[int]) -> Iterator[str]
         """Build the box-like structure for the table."""
-        lines = []
+        header, line_bar = self._build_table_header(max_col_widths)
+        lines = self._build_table_lines(header, line_bar, max_col_widths)
+        return _get_boxed_lines(lines, line_bar, self.box)
+
+    def _build_table_lines(self, header, line_bar, max_col_widths):
+        # type: (List[str], str, List[int]) -> Iterator[str]
+        """Build the header and a line per row; the rows are built a chunk at a time."""
         # Padding is used between cells/columns.
         padding = ' ' * 2
-        header, line_bar = self._build_table_header(max_col_widths)
 
         # Add the header if we have requested it.
         if self.headers:
-            lines.append(padding.join(header))
-            lines.append(line_bar)
+            yield padding.join(header)
+            yield line_bar
 
         # For each row, build a string representation of the values and table-structure.
-        for _, row in self.metric_data.iterrows():
-            line = []
+        alignments = [self.metrics[column].alignment if column in self.metrics else 'auto' for column in self.columns]
+        for chunk in _iter_chunks(self.metric_data):
+            cells = []
             for col_index, column in enumerate(self.columns):
                 if column == PIPE:
-                    line.append(PIPE)
+                    cells.append([PIPE] * len(chunk))
                     continue
-                if column in self.metrics:
-                    alignment = self.metrics[column].alignment
-                else:
-                    alignment = 'auto'
                 column_width = max_col_widths[col_index]
-                # Convert the value to a string and justify/align it.
-                value = _justify_text(str(row[column]), alignment, column_width)
-                line.append(value)
-
-            # Join the line together with appropriate padding.
-            lines.append(padding.join(line))
-
-        lines = _get_boxed_lines(lines, line_bar, self.box)
-        return lines
+                # Convert the values to strings and justify/align them.
+                cells.append([_justify_text(str(value), alignments[col_index], column_width)
+                              for value in chunk[column].tolist()])
+            # Join each line together with appropriate padding.
+            for line in zip(*cells):
+                yield padding.join(line)
 
     def _build_table_structure(self):
-        # type: () -> List[str]
+        # type: () -> Iterator[str]
         """Build the overall table structure, based upon the requested columns."""
         if self.grid:
             # Grid separates every column with a PIPE.
             self.columns = _get_grid_layout(self.columns)
         max_col_widths = self._get_maximum_column_lengths()
-        table_lines = self._build_box_structure(max_col_widths)
-        return table_lines
+        return self._build_box_structure(max_col_widths)
 
     def _get_maximum_column_lengths(self):
         # type: () -> List[int]
@@ -431,7 +510,8 @@ class Table(object):
             clean_name = column_name.split(',')[0]
             name_length = len(clean_name)
             # Get the maximum string length of all values within the column.
-            max_value_length = self.metric_data[column_name].astype('str').str.len().max()
+            values = self.metric_data[column_name].astype('str').values.astype('U')
+            max_value_length = int(numpy.char.str_len(values).max())
             # Get the maximum string length between the header and the values.
             table_structure.append(max([name_length, max_value_length]))
         return table_structure
@@ -469,15 +549,58 @@ class Table(object):
         for metric in self.metrics.values():
             self.metric_data[metric.nice_name].fillna(metric.placeholder, inplace=True)
 
+    def _join_metrics(self, nice_names):
+        # type: (List[str]) -> pandas.DataFrame
+        """Join processed metrics at once; aligned on the (Timestamp, controller) rows of every processed metric.
+
+        Arguments:
+            nice_names (list): The nice_name of each processed metric to include.
+
+        Returns:
+            joined (pandas.DataFrame): The Timestamp and controller columns plus a column per metric.
+                Metrics without data are None; _post_process fills in their placeholders.
+        """
+        if self._metric_index is None:
+            # None of the metrics had any data, so use a single row of placeholders.
+            joined = pandas.DataFrame({'Timestamp': [None], 'controller': [None]})
+            for nice_name in nice_names:
+                joined[nice_name] = self.metrics[nice_name].placeholder if nice_name in self.metrics else None
+            return joined
+        frames = [self._metric_frames[nice_name] for nice_name in nice_names
+                  if self._metric_frames[nice_name] is not None]
+        data_frames = [frame for frame in self._metric_frames.values() if frame is not None]
+        if len(data_frames) == 1 and frames:
+            # Only one metric has data, so there is nothing to align with.
+            joined = frames[0].copy()
+        else:
+            indexed = [frame.set_index(META_KEYS) for frame in frames]
+            joined = pandas.concat(indexed, axis=1) if indexed else pandas.DataFrame(index=self._metric_index)
+            if not joined.index.equals(self._metric_index):
+                joined = joined.reindex(self._metric_index)
+            joined.reset_index(inplace=True)
+        for nice_name in nice_names:
+            if self._metric_frames[nice_name] is None:
+                joined[nice_name] = None
+        return joined
+
     def _process_metrics(self, frequency):
         # type: (str) -> None
         """Process all of the metrics, and their dependencies."""
+        if self.data_key is not None:
+            # The rows, columns and values of the dataset which this Table uses (i.e. after dropping empty rows).
+            # Other arrays can have the same identity, timeframe and data_version, but different values.
+            digest = hashlib.sha1(pandas.util.hash_pandas_object(self.dataset, index=True).values).hexdigest()
+            self._dataset_key = (self.data_key, tuple(self.dataset.columns), len(self.dataset), digest)
         # TODO: PT-2369 - Run this in parallel via asyncio.
         for nice_name, metric in self.metrics.items():
-            if nice_name in self.metric_data:
+            if nice_name in self._metric_frames:
                 continue
             self._process_metric(metric, frequency)
 
+        # Join all of the metrics together at once.
+        if self._metric_frames:
+            self.metric_data = self._join_metrics(list(self._metric_frames))
+
         # Post Processing in order to fill gaps for unique timestamps.
         if not self.metric_data.empty:
             self._post_process()
@@ -488,7 +611,7 @@ class Table(object):
         needed_fields = [field for field in metric.required_fields if field in self.dataset]
 
         # If the metric is not already processed, then process it.
-        if metric.nice_name not in self.metric_data:
+        if metric.nice_name not in self._metric_frames:
             # Use the nice_name for required_metrics once they are processed!!!
             nice_name_required_metrics = []
             # If there are any metric dependencies, process those metrics first.
@@ -498,7 +621,7 @@ class Table(object):
                 # Update the names for required_metrics, numerators, denominators, etc.
                 nice_name_required_metrics.append(sub_metric.nice_name)
 
-                if sub_metric.nice_name not in self.metric_data:
+                if sub_metric.nice_name not in self._metric_frames:
                     # This metric needs to be processed; see if has already been instantiated.
                     if sub_metric.nice_name in self.metrics:
                         sub_metric = self.metrics[sub_metric.nice_name]
@@ -511,44 +634,58 @@ class Table(object):
 
             # Update the required_metrics to use the nice_names.
             metric.required_metrics = nice_name_required_metrics
-            # Process the metric with the fields/metrics it requires.
-            needed_fields = META_KEYS + needed_fields
-            if metric.required_metrics:
-                needed_metrics = META_KEYS + metric.required_metrics
+            cache_key = self._get_cache_key(metric, frequency)
+            self._metric_keys[metric.nice_name] = cache_key
+            if cache_key in _METRIC_FRAME_CACHE:
+                # Another Table (i.e. in another format) already processed this metric from the same data.
+                metric_frame = _METRIC_FRAME_CACHE.pop(cache_key)
+                _cache_metric_frame(cache_key, metric_frame)
             else:
-                needed_metrics = []
-            metric_frame = pandas.concat([self.dataset[needed_fields],
-                                          self.metric_data[needed_metrics]], keys='Timestamp', copy=False)
-            # If there are no metrics then we end up adding empty rows, remove them and organize things.
-            metric_frame.dropna(how='all', inplace=True)
-            metric_frame.sort_values(by='Timestamp', inplace=True)
-            metric_frame.reset_index(inplace=True, drop=True)
-
-            # Add a placeholder if we have no data, otherwise process the Metric with the data subset.
-            if metric_frame.empty:
-                LOGGER.warning('The metric "{}" has no data.'.format(metric.nice_name))
-            else:
-                metric_frame = metric.process(metric_frame, frequency)
-
-            # Merge in newly created metric data.
-            if metric_frame.empty and self.metric_data.empty:
-                # We will need placeholders for Timestamp, and controller.
-                self.metric_data[metric.nice_name] = [metric.placeholder]
-                # Include a 1-dimensional placeholder so we actually have a value.
-                self.metric_data['Timestamp'] = None
-                self.metric_data['controller'] = None
-            elif metric_frame.empty:
-                # We need to add a placeholder for the metric, we should already have Timestamp/controller.
-                self.metric_data[metric.nice_name] = None
-            elif self.metric_data.empty:
-                # No need to merge with an empty frame, grab any placeholder columns and assign them to metric_frame.
-                for key in self.metric_data.keys():
-                    if key not in ('Timestamp', 'controller'):
-                        metric_frame[key] = self.metric_data[key]
-                self.metric_data = metric_frame
-            else:
-                # We need to merge on Timestamp and controller, as we may have unique data on both controllers.
-                self.metric_data = pandas_utils.merge_on_timestamp([self.metric_data, metric_frame], META_KEYS)
+                metric_frame = self._build_metric_frame(metric, needed_fields, frequency)
+                if cache_key is not None:
+                    _cache_metric_frame(cache_key, metric_frame)
+
+            # Keep the newly created metric data; all of the metrics are joined together once they are processed.
+            self._metric_frames[metric.nice_name] = metric_frame
+            if metric_frame is None:
+                return
+            index = pandas.MultiIndex.from_arrays([metric_frame[key] for key in META_KEYS], names=META_KEYS)
+            self._metric_index = index if self._metric_index is None else self._metric_index.union(index)
+
+    def _build_metric_frame(self, metric, needed_fields, frequency):
+        # type: (metric_base.Metric, List[str], str) -> Optional[pandas.DataFrame]
+        """Process the metric with the fields/metrics it requires; None when there is no data for it."""
+        needed_fields = META_KEYS + needed_fields
+        if metric.required_metrics:
+            required_frame = self._join_metrics(metric.required_metrics)[META_KEYS + metric.required_metrics]
+            metric_frame = pandas.concat([self.dataset[needed_fields], required_frame], keys='Timestamp', copy=False)
+        else:
+            metric_frame = self.dataset[needed_fields].copy()
+        # If there are no metrics then we end up adding empty rows, remove them and organize things.
+        metric_frame.dropna(how='all', inplace=True)
+        metric_frame.sort_values(by='Timestamp', inplace=True)
+        metric_frame.reset_index(inplace=True, drop=True)
+
+        # Add a placeholder if we have no data, otherwise process the Metric with the data subset.
+        if metric_frame.empty:
+            LOGGER.warning('The metric "{}" has no data.'.format(metric.nice_name))
+            return None
+        metric_frame = metric.process(metric_frame, frequency)
+        return None if metric_frame.empty else metric_frame
+
+    def _get_cache_key(self, metric, frequency):
+        # type: (metric_base.Metric, str) -> Optional[Tuple[Any, ...]]
+        """Identify a processed metric by the rows of the dataset, the metric, the metrics which it requires and the
+        frequency; None when it cannot be cached (see Report._get_data_key).
+        """
+        if self._dataset_key is None:
+            return None
+        required_keys = tuple(self._metric_keys.get(nice_name) for nice_name in metric.required_metrics)
+        if None in required_keys:
+            return None
+        attributes = sorted((name, repr(value)) for name, value in vars(metric).items())
+        metric_digest = hashlib.sha1(repr((type(metric).__name__, attributes)).encode('utf-8')).hexdigest()
+        return self._dataset_key, getattr(frequency, 'value', frequency), metric_digest, required_keys
 
 
 class CSVTable(Table):
@@ -572,62 +709,116 @@ class CSVTable(Table):
         # Also run the default post-processing.
         super(CSVTable, self)._post_process()
 
-    def render_table(self, data_frame, frequency, title=None):
-        # type: (pandas.DataFrame, str, Optional[str]) -> str
-        """Render the table with the given metrics and data_frame at a requested frequency."""
+    def write_table(self, stream, data_frame, frequency, title=None):
+        # type: (Any, pandas.DataFrame, str, Optional[str]) -> None
+        """Render the table to a stream; CHUNK_SIZE rows at a time."""
         # Use the new data_frame to generate and process the dataset via the requested Metrics.
         self.dataset = data_frame
         self._process_metrics(frequency)
         self.columns = [col for col in self.columns if col != PIPE]
-        table_lines = self.metric_data[self.columns].to_csv(index=False)
-        return table_lines
+        for index, chunk in enumerate(_iter_chunks(self.metric_data[self.columns])):
+            # Only the first chunk has the header.
+            chunk.to_csv(stream, index=False, header=not index)
 
 
 class HTMLTable(Table):
     """A HTML Formatted table."""
 
-    def render_table(self, data_frame, frequency, title=None):
-        # type: (pandas.DataFrame, str, Optional[str]) -> str
-        """Render the table with the given metrics and data_frame at a requested frequency."""
+    def write_table(self, stream, data_frame, frequency, title=None):
+        # type: (Any, pandas.DataFrame, str, Optional[str]) -> None
+        """Render the table to a stream; CHUNK_SIZE rows at a time."""
         # Use the new data_frame to generate and process the dataset via the requested Metrics.
         self.dataset = data_frame
         self._process_metrics(frequency)
         self.columns = [col for col in self.columns if col != PIPE]
+        metric_data = self.metric_data[self.columns]
+        if len(metric_data) > CHUNK_SIZE:
+            # Some values are formatted per column (i.e. the precision of floats); so do that once for every row.
+            metric_data = _format_html_columns(metric_data)
         # TODO: PT-2377 - Do something useful here with pandas.DataFrame.to_html(classes=) -> CSS classes
         # TODO: PT-2377 - Use the title as the table_id, this requires a newer version of pandas.
         # We can make the tables dynamic and prettier by applying CSS...
-        table_lines = self.metric_data[self.columns].to_html()
-        return table_lines
+        tail = ''
+        for index, chunk in enumerate(_iter_chunks(metric_data)):
+            # Only keep the rows of each chunk; between the head (<table>...<tbody>) and tail (</tbody></table>).
+            table_lines = chunk.to_html()
+            body_start = table_lines.index(HTML_BODY_START) + len(HTML_BODY_START)
+            body_end = table_lines.rindex(HTML_BODY_END)
+            if not index:
+                stream.write(table_lines[:body_start])
+                tail = table_lines[body_end:]
+            stream.write(table_lines[body_start:body_end])
+        stream.write(tail)
 
 
 class JSONTable(Table):
     """A JSON Formatted table."""
 
-    def render_table(self, data_frame, frequency, title=None):
-        # type: (pandas.DataFrame, str, Optional[str]) -> str
-        """Render the table with the given metrics and data_frame at a requested frequency."""
+    def write_table(self, stream, data_frame, frequency, title=None):
+        # type: (Any, pandas.DataFrame, str, Optional[str]) -> None
+        """Render the table to a stream; CHUNK_SIZE rows at a time."""
         # Use the new data_frame to generate and process the dataset via the requested Metrics.
         self.dataset = data_frame
         self._process_metrics(frequency)
         self.columns = [col for col in self.columns if col != PIPE]
         # We can make the tables dynamic and prettier by applying CSS...
         # TODO: Add index=False, if we update pandas to >=0.23.
-        table_lines = self.metric_data[self.columns].to_json(orient='table')
-        return table_lines
+        needs_separator = False
+        for index, chunk in enumerate(_iter_chunks(self.metric_data[self.columns])):
+            # Only keep the data records of each chunk; the schema is the same for all of them.
+            table_lines = chunk.to_json(orient='table')
+            data_start = JSON_DATA_START.search(table_lines).end()
+            if not index:
+                stream.write(table_lines[:data_start])
+            records = table_lines[data_start:-len(JSON_DATA_END)]
+            if records:
+                if needs_separator:
+                    stream.write(',')
+                stream.write(records)
+                needs_separator = True
+        stream.write(JSON_DATA_END)
 
 
 def _get_boxed_lines(lines, line_bar, box):
-    # type: (List[str], Optional[str], bool) -> List[str]
+    # type: (Iterable[str], Optional[str], bool) -> Iterator[str]
     """Add a horizontal bars to the top and bottom of the table."""
-    if box:
-        # Adding the box around the table if requested.
-        box_width = len(lines[0])
-        box_line = '=' * box_width
-        lines.insert(0, box_line)
-        # If the last line of the box is line_bar then grid was used and we do not use the box tail.
-        if lines[-1] != line_bar:
-            lines.append(box_line)
-    return lines
+    lines = iter(lines)
+    if not box:
+        for line in lines:
+            yield line
+        return
+    # Adding the box around the table if requested.
+    first_line = next(lines, None)
+    if first_line is None:
+        return
+    box_line = '=' * len(first_line)
+    yield box_line
+    last_line = first_line
+    yield first_line
+    for last_line in lines:
+        yield last_line
+    # If the last line of the box is line_bar then grid was used and we do not use the box tail.
+    if last_line != line_bar:
+        yield box_line
+
+
+def _cache_metric_frame(cache_key, metric_frame):
+    # type: (Tuple[Any, ...], Optional[pandas.DataFrame]) -> None
+    """Keep a processed metric frame for other Tables; the frames are shared, so they must not be modified."""
+    _METRIC_FRAME_CACHE[cache_key] = metric_frame
+    while len(_METRIC_FRAME_CACHE) > METRIC_FRAME_CACHE_SIZE:
+        _METRIC_FRAME_CACHE.popitem(last=False)
+
+
+def _format_html_columns(metric_data):
+    # type: (pandas.DataFrame) -> pandas.DataFrame
+    """Format the values of non-object columns the same way as pandas.DataFrame.to_html does for a whole column."""
+    formatted = metric_data.copy()
+    for column in metric_data.columns:
+        if metric_data[column].dtype != object:
+            values = format_array(metric_data[column].values, None)
+            formatted[column] = [value.strip() for value in values]
+    return formatted
 
 
 def _get_grid_layout(fields):
@@ -649,17 +840,20 @@ def _get_grid_layout(fields):
     return new_fields
 
 
-def _get_required_fields(metric):
-    # type: (metric_base.Metric) -> List[str]
-    """Get all of the required metrics related to the metric."""
-    fields = []
-    # There are field names which are just used to reference processed columns and may not exist in the lower API.
-    fields.extend([field for field in metric.required_fields if field in FIELD_INDEX])
-    for sub_metric in metric.required_metrics:
-        if isinstance(sub_metric, str):
-            sub_metric = metric_base.build_metric(sub_metric)
-        fields.extend(_get_required_fields(sub_metric))
-    return fields
+def _iter_chunks(data_frame):
+    # type: (pandas.DataFrame) -> Iterator[pandas.DataFrame]
+    """Split a DataFrame into chunks of up to CHUNK_SIZE rows; an empty DataFrame is a single empty chunk."""
+    for start in range(0, max(len(data_frame), 1), CHUNK_SIZE):
+        yield data_frame.iloc[start:start + CHUNK_SIZE]
+
+
+def _open_output(path):
+    # type: (str) -> Any
+    """Open a file to write native str to; paths ending with '.gz' are gzip compressed."""
+    if path.endswith('.gz'):
+        # On python 2, a gzip file is only written in binary mode; which takes native str.
+        return gzip.open(path, 'wb' if six.PY2 else 'wt')
+    return open(path, 'w')
 
 
 def _justify_text(text, alignment, padding_width):
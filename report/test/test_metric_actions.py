@@ -37,3 +37,17 @@ def test_format_unreported_ratio(row, expected):
     """Unit tests for format_unreported_ratio."""
     result = metric_actions.format_unreported_ratio(row)
     assert result == expected
+
+
+def test_frame_actions():
+    """The actions are given all of the rows of a frame at once."""
+    frame = pandas.DataFrame({
+        'unreported_space': [0, 10, 0],
+        'reclaimable_space': [1, 1, 0],
+        'reported_pyramid': [2, 2, 2],
+        'Unaccounted Raw': [10000, 20000, 30000],
+        'unreported_ratio': [0.8, 20.3523, 0.12823],
+    })
+    assert metric_actions.calculate_raw_unaccounted(frame).tolist() == [0, 7, 0]
+    assert metric_actions.scale_unaccounted_space(frame).tolist() == ['9.77 KiB', '19.53 KiB', '29.30 KiB']
+    assert metric_actions.format_unreported_ratio(frame).tolist() == ['0.80:1', '20.35:1', '0.13:1']
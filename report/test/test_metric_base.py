@@ -19,3 +19,19 @@ def test_fake_metric(metric_name):
     """Test building metrics which don't exist."""
     with pytest.raises(ValueError, msg='Metric "{}" should have failed.'.format(metric_name)):
         metric_base.build_metric(metric_name)
+
+
+def test_build_metric_copies():
+    """Each built metric is a separate copy of the memoized metric."""
+    metric = metric_base.build_metric('ssd_mapped')
+    metric.required_metrics.append('fake_metric')
+    rebuilt = metric_base.build_metric('ssd_mapped')
+    assert rebuilt is not metric
+    assert 'fake_metric' not in rebuilt.required_metrics
+
+
+def test_build_metric_kwargs():
+    """Keyword arguments only apply to the metric which they were given to."""
+    metric = metric_base.build_metric('ssd_mapped', controller='CT0')
+    assert metric.controller == 'CT0'
+    assert metric_base.build_metric('ssd_mapped').controller is None
@@ -0,0 +1,52 @@
+"""Unit tests for render_plan."""
+
+import pytest
+
+from photon.report import render_plan
+
+
+def test_shared():
+    """All callers share one RenderPlan."""
+    assert render_plan.get_render_plan() is render_plan.get_render_plan()
+
+
+def test_recompiled(monkeypatch):
+    """The RenderPlan is re-compiled when either INI file is modified."""
+    plan = render_plan.get_render_plan()
+    monkeypatch.setattr(render_plan, '_get_index_mtimes', lambda: (0., 0.))
+    assert not plan.is_current()
+    new_plan = render_plan.get_render_plan()
+    assert new_plan is not plan
+    assert new_plan.is_current()
+
+
+def test_metric_plan():
+    """Metrics include the fields of the metrics which they require; and are only compiled when needed."""
+    plan = render_plan.RenderPlan()
+    assert not plan.metrics
+    metric_plan = plan.get_metric_plan('unaccounted_space')
+    assert metric_plan.dependencies == ['unaccounted_raw']
+    assert metric_plan.required_fields == ['reclaimable_space', 'reported_pyramid', 'unreported_space']
+    assert plan.get_metric_plan('unaccounted_space') is metric_plan
+    assert set(plan.metrics) == {'unaccounted_space', 'unaccounted_raw'}
+    assert plan.get_metric_plan('fake_metric') is None
+
+
+def test_metric_plan_columns():
+    """Metrics keep the dtype and resampling operation of their column."""
+    plan = render_plan.RenderPlan()
+    metric_plan = plan.get_metric_plan('mce_counts')
+    assert (metric_plan.dtype, metric_plan.operation) == ('int', 'sum')
+    metric_plan = plan.get_metric_plan('unaccounted_raw')
+    assert (metric_plan.dtype, metric_plan.operation) == (None, 'last')
+
+
+def test_table_config():
+    """Each table configuration is a copy; with the keyword argument overrides."""
+    plan = render_plan.get_render_plan()
+    table_config = plan.get_table_config('array_space_summary', grid=True)
+    assert table_config['grid'] is True
+    del table_config['columns']
+    assert plan.get_table_config('array_space_summary')['columns']
+    with pytest.raises(ValueError):
+        plan.get_table_config('fake_template')
@@ -1,12 +1,19 @@
 """Unit tests for the ReportAPI."""
 
+import collections
+import gzip
+import os
+import shutil
+import tempfile
 import textwrap
 
 import numpy
 import pandas
 import pytest
+import six
 import ujson
 
+from photon.lib import array_utils
 from photon.lib import config_utils
 from photon.lib import time_utils
 from photon.report import report_api
@@ -228,6 +235,19 @@ class SimpleAPI(object):
         return self.dataset[['Timestamp', 'controller'] + fields]
 
 
+class VersionedAPI(SimpleAPI):
+    """A SimpleAPI which has an identity and a data_version; like the FlashArray API."""
+
+    def __init__(self, dataset):
+        super(VersionedAPI, self).__init__(dataset)
+        self.data_version = (('logs', 1),)
+        self.ident = array_utils.ArrayIdent(log_path='/logs/domain.com/array-ct0')
+
+    def get_fields(self, fields):
+        """Like FlashArray.get_fields; only rows with a value for one of the fields."""
+        return super(VersionedAPI, self).get_fields(fields).dropna(how='all', subset=fields)
+
+
 @pytest.fixture()
 def make_simple_api():
     """Build a SimpleAPI instance with the default dataset."""
@@ -284,6 +304,97 @@ def test_add_template(template_name):
     assert len(report.tables) == 1
 
 
+def test_add_template_twice():
+    """The same template can be used more than once."""
+    report = make_report()
+    report.add_template('array_space_summary')
+    report.add_template('array_space_summary', table_type='csv')
+    assert len(report.tables) == 2
+    assert isinstance(report.tables[1], report_api.CSVTable)
+
+
+def test_write_tables():
+    """Report.write_tables writes the same tables as render_tables; gzip compressed for a '.gz' path."""
+    test_case = TEST_CASES['simple_metrics']
+    reports = []
+    for _ in range(2):
+        report = make_report()
+        for table_type in ('table', 'csv'):
+            table = report.add_table(table_type, **test_case['table_config'])
+            for metric_name, metric_config in sorted(test_case['metrics'].items()):
+                table.add_metric(metric_name, **metric_config)
+        report.add_text_area('Some text', box=False)
+        reports.append(report)
+    expected = reports[0].render_tables(print_tables=False)
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'report.txt.gz')
+        reports[1].write_tables(path)
+        with gzip.open(path, 'rb') as report_file:
+            assert report_file.read() == six.ensure_binary(expected)
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_metric_frame_cache(monkeypatch):
+    """Reports of the same data share their processed metrics; until the data_version changes."""
+    processed = []
+    build_metric_frame = report_api.Table._build_metric_frame
+
+    def _build_and_count(table, metric, needed_fields, frequency):
+        """Count how many times a metric is actually processed."""
+        processed.append(metric.nice_name)
+        return build_metric_frame(table, metric, needed_fields, frequency)
+
+    monkeypatch.setattr(report_api.Table, '_build_metric_frame', _build_and_count)
+    monkeypatch.setattr(report_api, '_METRIC_FRAME_CACHE', collections.OrderedDict())
+    test_case = TEST_CASES['simple_metrics']
+
+    def _render(api, table_type):
+        """Render a single table with a new Report."""
+        report = report_api.Report(api)
+        table = report.add_table(table_type, **test_case['table_config'])
+        for metric_name, metric_config in sorted(test_case['metrics'].items()):
+            table.add_metric(metric_name, **metric_config)
+        return report.render_tables(print_tables=False)
+
+    api = VersionedAPI(DATASET)
+    uncached_api = VersionedAPI(DATASET)
+    uncached_api.data_version = None
+    _render(api, 'table')
+    num_metrics = len(processed)
+    assert num_metrics == len(test_case['metrics'])
+    # Other formats of the same data do not process the metrics again; and render the same as without the cache.
+    for table_type in ('csv', 'json', 'html'):
+        assert _render(api, table_type) == _render(uncached_api, table_type)
+    assert len(processed) == num_metrics * 4
+    # New data (i.e. more of the timeframe was parsed) processes them again.
+    api.data_version = (('logs', 2),)
+    _render(api, 'csv')
+    assert len(processed) == num_metrics * 5
+
+
+def test_metric_frame_cache_values(monkeypatch):
+    """Reports of arrays with the same identity, timeframe and data_version but other values do not share metrics."""
+    monkeypatch.setattr(report_api, '_METRIC_FRAME_CACHE', collections.OrderedDict())
+    test_case = TEST_CASES['simple_metrics']
+
+    def _render(api):
+        """Render a single table with a new Report."""
+        report = report_api.Report(api)
+        table = report.add_table('csv', **test_case['table_config'])
+        for metric_name, metric_config in sorted(test_case['metrics'].items()):
+            table.add_metric(metric_name, **metric_config)
+        return report.render_tables(print_tables=False)
+
+    other_dataset = DATASET.copy()
+    other_dataset['array_name'] = other_dataset['array_name'].replace('my_cool_array', 'other_array')
+    first = _render(VersionedAPI(DATASET))
+    second = _render(VersionedAPI(other_dataset))
+    assert 'my_cool_array' in first
+    assert 'other_array' in second and 'my_cool_array' not in second
+
+
 # Unit tests for Table objects:
 @pytest.mark.parametrize('table_type', TABLE_TYPES)
 @pytest.mark.parametrize('metric', list(METRIC_INDEX.keys()), ids=list(METRIC_INDEX.keys()))
@@ -319,3 +430,18 @@ def test_render_table(test_case, table_type):
         result = ujson.loads(result)
         expected = ujson.loads(expected)
     assert result == expected
+
+
+@pytest.mark.parametrize('table_type', TABLE_TYPES)
+@pytest.mark.parametrize('test_case', list(TEST_CASES.values()), ids=list(TEST_CASES.keys()))
+def test_write_table_chunks(test_case, table_type, monkeypatch):
+    """Rendering a table a row at a time gives the same table as rendering all of the rows at once."""
+    tables = []
+    for _ in range(2):
+        table = make_table(table_type, test_case['table_config'])
+        for metric, metric_config in sorted(test_case['metrics'].items()):
+            table.add_metric(metric, **metric_config)
+        tables.append(table)
+    expected = tables[0].render_table(DATASET.copy(), **test_case['render_config'])
+    monkeypatch.setattr(report_api, 'CHUNK_SIZE', 1)
+    assert tables[1].render_table(DATASET.copy(), **test_case['render_config']) == expected
@@ -25,6 +25,7 @@ packages = [
     'photon.backend.pure',
     'photon.backend.pure.cli',
     'photon.backend.pure.configuration',
+    'photon.backend.pure.export',
     'photon.backend.pure.insights',
     'photon.backend.pure.iris',
     'photon.backend.pure.logs',
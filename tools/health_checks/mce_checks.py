@@ -40,7 +40,7 @@ def main():
         # SEL Events
         sel_table = report.add_table(args.table_type, title='{} Memory Related SEL Events'.format(controller), grid=True)
         sel_table.add_metric('sel_critical_events', controller=controller)
-    report.render_tables(jira=args.jira)
+    report.write_tables(jira=args.jira)
 
 
 if __name__ == '__main__':
@@ -21,7 +21,7 @@ def main():
     array = api.FlashArray(**kwargs)
     report = report_api.Report(array)
     report.add_template('array_performance_summary', table_type=args.table_type)
-    report.render_tables(jira=args.jira)
+    report.write_tables(jira=args.jira)
 
 
 if __name__ == '__main__':
@@ -40,7 +40,7 @@ def main():
     # total_reduction, thin_provisioning, data_reduction, puredb_dedup_version
     # core.log: compression_ratio, if we want to estimate dedup ratio.
     # TODO: PT-2188 - Per-Volume / Pgroup / HostGroup / Pod, etc. used space.
-    report.render_tables(jira=args.jira)
+    report.write_tables(jira=args.jira)
 
 
 if __name__ == '__main__':